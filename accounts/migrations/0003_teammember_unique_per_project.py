@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:31
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_members(apps, schema_editor):
+    # 동시 가입으로 중복 생성된 팀원을 하나만 남기고 삭제한 뒤 팀원 수를 다시 맞춤
+    TeamMember = apps.get_model('accounts', 'TeamMember')
+    Project = apps.get_model('portfolios', 'Project')
+    duplicates = (
+        TeamMember.objects.values('user', 'project')
+        .annotate(keep_id=Min('id'), total=Count('id'))
+        .filter(total__gt=1)
+    )
+    for row in list(duplicates):
+        TeamMember.objects.filter(
+            user=row['user'], project=row['project']
+        ).exclude(id=row['keep_id']).delete()
+        Project.objects.filter(pk=row['project']).update(
+            member_count=TeamMember.objects.filter(project=row['project']).count()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_initial'),
+        ('portfolios', '0005_project_member_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_members, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='teammember',
+            constraint=models.UniqueConstraint(fields=('user', 'project'), name='unique_team_member_per_project'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_project_created_at(apps, schema_editor):
+    TeamMember = apps.get_model('accounts', 'TeamMember')
+    Project = apps.get_model('portfolios', 'Project')
+    TeamMember.objects.update(
+        project_created_at=Subquery(
+            Project.objects.filter(pk=OuterRef('project_id')).values('created_at')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_teammember_unique_per_project'),
+        ('portfolios', '0005_project_member_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='project_created_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(copy_project_created_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='teammember',
+            name='project_created_at',
+            field=models.DateTimeField(blank=True, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['user', '-project_created_at', '-project'], name='teammember_user_project_idx'),
+        ),
+    ]
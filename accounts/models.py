@@ -1,6 +1,10 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import AbstractUser
-from portfolios.models import Project, Log
+from portfolios.models import Project, Log, ProjectHouse
 from django.core.exceptions import ValidationError
 
 class User(AbstractUser):
@@ -23,6 +27,16 @@ class TeamMember(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
     role = models.CharField(max_length=10, choices=Roles)
     joined_at = models.DateTimeField(auto_now_add=True)
+    # 프로젝트 생성 시각 복사본 ("내 프로젝트 최신순"을 팀원 인덱스 범위 스캔으로 처리하기 위한 정렬 키)
+    project_created_at = models.DateTimeField(blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-project_created_at", "-project"], name="teammember_user_project_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "project"], name="unique_team_member_per_project"),
+        ]
 
     def total_logs(self):
         return Log.objects.filter(user=self.user, project=self.project).count()
@@ -33,11 +47,93 @@ class TeamMember(models.Model):
         return round((self.total_logs() / max_logs) * 100, 1)
 
     def clean(self):
-        # 현재 프로젝트에 속한 팀원 수 체크
-        if self.project and TeamMember.objects.filter(project=self.project).count() >= 6:
-            raise ValidationError("한 프로젝트에는 최대 6명까지만 참여할 수 있습니다.")
+        # 저장된 팀원 수로 빠르게 체크 (최종 보장은 save()의 조건부 UPDATE)
+        if self._state.adding and self.project_id and self.project.member_count >= Project.MAX_MEMBERS:
+            raise ValidationError("한 프로젝트에는 최대 6명까지만 참여할 수 있습니다.", code="project_full")
 
     def save(self, *args, **kwargs):
-        # clean() 포함 모든 검증 실행
-        self.full_clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        # clean() 포함 검증 실행 (중복 가입은 사전 조회 대신 INSERT 시 unique 제약으로 확인)
+        self.full_clean(validate_unique=False, validate_constraints=False)
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        self._add_atomically(*args, **kwargs)
+
+    def _add_atomically(self, *args, **kwargs):
+        try:
+            with transaction.atomic():
+                self._add(*args, **kwargs)
+        except IntegrityError:
+            # 롤백된 뒤 다시 조회해 중복 가입인지 판단 (DB마다 다른 오류 메시지에 의존하지 않음)
+            # 이미 가입된 게 아니면 FK 위반 등 다른 오류이므로 그대로 전달
+            rejection = self._rejection()
+            if rejection.code != "already_joined":
+                raise
+            raise rejection
+
+    def _add(self, *args, **kwargs):
+        """
+        새 팀원 추가 (save()와 join()이 _add_atomically()의 트랜잭션 안에서 호출)
+        인원 제한 조건부 UPDATE로 프로젝트 행을 먼저 잠그고 다시 확인한 뒤 INSERT 하므로,
+        그 사이 삭제(표시)된 프로젝트에는 가입되지 않습니다.
+        """
+        if self.project_created_at is None:
+            self.project_created_at = self.project.created_at
+        # 삭제 표시되지 않았고 6명 미만일 때만 팀원 수를 증가시켜 동시 가입에도 인원 제한 보장
+        reserved = Project.objects.filter(
+            pk=self.project_id, member_count__lt=Project.MAX_MEMBERS
+        ).update(member_count=F("member_count") + 1)
+        if not reserved:
+            raise self._rejection()
+        # 중복 가입은 unique 제약 위반(IntegrityError)으로 트랜잭션 밖에서 처리
+        super().save(*args, **kwargs)
+
+        # 팀원이 새로 추가된 경우에만 통나무집 목표치 재계산
+        ProjectHouse.refresh_required_logs(self.project)
+
+    def _rejection(self):
+        # 조건부 UPDATE가 실패한 이유 (실패한 경우에만 조회)
+        if TeamMember.objects.filter(user_id=self.user_id, project_id=self.project_id).exists():
+            return ValidationError("이미 해당 프로젝트에 속해있습니다.", code="already_joined")
+        if not Project.objects.filter(pk=self.project_id).exists():
+            return ValidationError("프로젝트를 찾을 수 없습니다.", code="project_not_found")
+        return ValidationError("한 프로젝트에는 최대 6명까지만 참여할 수 있습니다.", code="project_full")
+
+    @classmethod
+    def join(cls, user, project, role="Member"):
+        """
+        프로젝트 가입을 하나의 트랜잭션에서 최소한의 쿼리로 처리합니다.
+        인원 제한 조건부 UPDATE(프로젝트 잠금) → INSERT(중복은 unique 제약으로 확인) → 통나무집 목표치 UPDATE
+        호출하는 쪽의 프로젝트 조회와 합쳐 조회·중복 확인·인원 제한 INSERT는 3개,
+        다른 테이블인 통나무집 목표치 UPDATE를 더해 가입 한 번에 4개의 쿼리를 사용합니다.
+        """
+        team_member = cls(user=user, project=project, role=role)
+        # user, project는 호출하는 쪽에서 조회한 인스턴스이므로 FK 존재 확인 쿼리 없이 필드 값만 검증
+        team_member.clean_fields(exclude=["user", "project"])
+        team_member._add_atomically()
+        return team_member
+
+    @classmethod
+    def sync_member_count(cls, project_id):
+        """
+        팀원 행 수로 member_count를 다시 맞추고 통나무집 목표치를 재계산합니다.
+        감소분을 빼는 대신 같은 UPDATE 안에서 COUNT 서브쿼리로 다시 세므로 값이 어긋나도 스스로 바로잡힙니다.
+        """
+        member_count = (
+            cls.objects.filter(project_id=OuterRef("pk"))
+            .order_by()
+            .values("project_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        Project.all_objects.filter(pk=project_id).update(member_count=Coalesce(Subquery(member_count), 0))
+        project = Project.all_objects.filter(pk=project_id).first()
+        if project is not None:
+            ProjectHouse.refresh_required_logs(project)
+
+
+# 인스턴스 delete()뿐 아니라 QuerySet.delete()와 User/Project 삭제의 CASCADE에도 호출됨
+@receiver(post_delete, sender=TeamMember)
+def release_member_slot(sender, instance, **kwargs):
+    TeamMember.sync_member_count(instance.project_id)
@@ -0,0 +1,24 @@
+from django.core.cache import cache, caches
+from django.core.cache.backends.db import DatabaseCache
+
+
+def is_database_cache(alias="default"):
+    """
+    캐시가 DB 캐시 테이블(DatabaseCache)인지 확인합니다. (REDIS_URL이 없을 때의 기본값, config/settings.py)
+    """
+    return isinstance(caches[alias], DatabaseCache)
+
+
+def read_through(key, build, timeout):
+    """
+    key의 캐시 값을 돌려주고, 없으면 build()로 만들어 캐싱합니다.
+    DB 캐시에서는 캐시를 채우는 set()이 django_cache 테이블 INSERT라 조회 요청마다 DB 쓰기(SQLite는 전역 쓰기 잠금)가 생기므로,
+    캐시를 거치지 않고 build() 결과를 그대로 돌려줍니다. 조회 캐시는 Redis 같은 공유 캐시에서만 채워집니다.
+    """
+    if is_database_cache():
+        return build()
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, timeout)
+    return value
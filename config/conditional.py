@@ -0,0 +1,47 @@
+import hashlib
+import json
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """
+    주어진 값들로 강한 ETag("...")를 만듭니다.
+    """
+    raw = json.dumps(parts, sort_keys=True, default=str).encode()
+    return '"%s"' % hashlib.md5(raw).hexdigest()
+
+
+def row_validators(obj, *extra, field="modified_at"):
+    """
+    상세 응답용 (ETag, Last-Modified). 이미 조회한 행의 수정 시각만으로 계산합니다.
+    """
+    modified = getattr(obj, field)
+    return make_etag(obj._meta.label, obj.pk, modified, *extra), modified
+
+
+def list_validators(queryset, *extra, field="modified_at"):
+    """
+    목록 응답용 (ETag, Last-Modified). 행을 읽지 않고 MAX(modified_at), COUNT 집계 한 번으로 계산합니다.
+    수정/추가는 MAX가, 삭제는 COUNT가 바꿉니다.
+    """
+    stats = queryset.order_by().aggregate(last_modified=Max(field), count=Count("pk"))
+    etag = make_etag(queryset.model._meta.label, stats["last_modified"], stats["count"], *extra)
+    return etag, stats["last_modified"]
+
+
+def conditional_response(request, etag, last_modified, build):
+    """
+    If-None-Match / If-Modified-Since가 일치하면 build()를 호출하지 않고(직렬화 없이) 304를 돌려줍니다.
+    아니면 build()가 만든 응답에 ETag / Last-Modified 헤더를 붙입니다.
+    """
+    # HTTP 날짜는 초 단위라 소수점 이하는 버림 (같은 초 안의 변경은 ETag가 구분)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = build()
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    return response
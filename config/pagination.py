@@ -0,0 +1,117 @@
+import base64
+import json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    (created_at, id) 같은 정렬 키 기준의 커서(keyset) 페이지네이션입니다.
+    OFFSET 없이 "마지막으로 본 행보다 뒤" 조건으로 조회하므로 몇 번째 페이지든 비용이 같습니다.
+    커서는 마지막 행의 정렬 키 값을 base64로 인코딩한 불투명 문자열입니다.
+    """
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = [
+            queryset.model._meta.get_field(name.lstrip("-"))
+            for name in self.ordering
+        ]
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self.after(self.decode_cursor(cursor)))
+
+        # 다음 페이지 존재 여부를 알기 위해 한 개 더 조회
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def etag_parts(self, request):
+        """
+        같은 목록에서도 페이지마다 응답이 다르므로, 목록 ETag에 함께 넣을 커서와 실제 적용될 페이지 크기
+        """
+        return request.query_params.get(self.cursor_query_param, ""), self.get_page_size(request)
+
+    def after(self, values):
+        """
+        정렬 순서상 values 다음에 오는 행 조건
+        (a, b) 내림차순이면 a <= va AND (a < va OR (a = va AND b < vb))
+        앞의 a <= va 조건은 중복이지만, OR만 있으면 DB가 인덱스를 범위 탐색하지 못하고
+        처음부터 훑어 내려가므로 뒤 페이지일수록 느려집니다.
+        """
+        first = self.ordering[0]
+        bound = Q(**{f"{first.lstrip('-')}__{'lte' if first.startswith('-') else 'gte'}": values[0]})
+        condition = Q()
+        for index, name in enumerate(self.ordering):
+            field = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            clause = Q(**{f"{field}__{lookup}": values[index]})
+            for prev_name, prev_value in zip(self.ordering[:index], values[:index]):
+                clause &= Q(**{prev_name.lstrip("-"): prev_value})
+            condition |= clause
+        return bound & condition
+
+    def encode_cursor(self, obj):
+        values = [field.value_to_string(obj) for field in self.fields]
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            return [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (ValueError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_cursor(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_next_link(self):
+        cursor = self.get_next_cursor()
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "next_cursor": self.get_next_cursor(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "next_cursor": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
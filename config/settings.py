@@ -105,6 +105,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",  # 프로젝트 폴더 안에 자동으로 생성됨
+        # 트랜잭션 시작 시 쓰기 잠금을 먼저 잡음 (행 잠금 후 쓰는 트랜잭션이 다른 프로세스와 겹칠 때,
+        # 읽기 잠금에서 쓰기 잠금으로 올리다 바로 "database is locked"로 실패하지 않고 대기하도록)
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
     }
 }
 
@@ -121,6 +124,30 @@ DATABASES = {
 # }
 
 
+# Cache
+# 통나무집/기여도/대시보드 캐시와 TagStyle 버전은 워커 간에 무효화가 전달되어야 하므로
+# 프로세스마다 따로인 LocMemCache 대신 공유 캐시를 사용
+# secrets.json에 REDIS_URL이 있으면 Redis(redis 패키지 필요), 없으면 DB 캐시 테이블(마이그레이션에서 생성)
+# DB 캐시는 무효화/버전 전달에만 쓰이고, 조회 결과 캐시는 채우지 않음 (조회 요청이 DB에 쓰지 않도록, config/cache.py)
+REDIS_URL = secrets.get("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -191,6 +218,12 @@ REST_FRAMEWORK = {
 
 REST_USE_JWT = True
 
+# 프로젝트 초대 코드 생성기 (교체 가능)
+INVITE_CODE_GENERATOR = "portfolios.invite_codes.generate_invite_code"
+
+# 같은 메모·태그 스타일의 하이라이트가 겹칠 때: "allow"(허용) / "reject"(400 거절) / "merge"(하나로 병합)
+TAGGING_OVERLAP_POLICY = "allow"
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=3),    # 유효기간 3시간
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),    # 유효기간 7일
@@ -0,0 +1,58 @@
+"""
+메모 본문에 대한 텍스트 델타(insert/delete 연산) 적용과 태깅 오프셋 재계산.
+
+연산은 순서대로 적용되며, 각 연산의 pos는 앞 연산까지 적용된 본문 기준의 글자 위치입니다.
+    {"op": "insert", "pos": 5, "text": "추가"}
+    {"op": "delete", "pos": 2, "length": 3}
+"""
+
+
+class DeltaError(ValueError):
+    def __init__(self, index, message):
+        super().__init__(message)
+        self.index = index
+        self.message = message
+
+
+def shift_insert(span, pos, length):
+    # 태깅 시작 위치에 삽입하면 태깅은 뒤로 밀리고, 태깅 안쪽에 삽입하면 늘어남
+    start, end = span
+    new_start = start + length if start >= pos else start
+    new_end = end + length if end > pos else end
+    return new_start, max(new_start, new_end)
+
+
+def shift_delete(span, pos, length):
+    # 삭제 구간에 걸친 부분은 잘라내고, 뒤쪽은 삭제 길이만큼 당김
+    def move(offset):
+        if offset <= pos:
+            return offset
+        if offset < pos + length:
+            return pos
+        return offset - length
+
+    start, end = span
+    return move(start), move(end)
+
+
+def apply_delta(text, ops, spans):
+    """
+    본문에 연산들을 적용하고, spans(태깅 (start, end) 목록)를 같은 순서로 재계산해 돌려줍니다.
+    잘못된 연산이 있으면 DeltaError(연산 번호, 사유)를 발생시킵니다.
+    """
+    spans = list(spans)
+    for index, op in enumerate(ops):
+        pos = op["pos"]
+        if pos > len(text):
+            raise DeltaError(index, f"pos({pos})가 본문 길이({len(text)})를 넘습니다.")
+        if op["op"] == "insert":
+            inserted = op["text"]
+            text = text[:pos] + inserted + text[pos:]
+            spans = [shift_insert(span, pos, len(inserted)) for span in spans]
+        else:
+            length = op["length"]
+            if pos + length > len(text):
+                raise DeltaError(index, f"삭제 구간({pos}~{pos + length})이 본문 길이({len(text)})를 넘습니다.")
+            text = text[:pos] + text[pos + length:]
+            spans = [shift_delete(span, pos, length) for span in spans]
+    return text, spans
@@ -0,0 +1,122 @@
+import csv
+import json
+import zlib
+from django.db.models import Prefetch
+from taggings.models import Tagging
+from .models import Memo
+
+CHUNK_SIZE = 500
+
+CSV_COLUMNS = [
+    "memo_id", "memo_user_id", "memo_date", "memo_contents", "memo_created_at",
+    "tagging_id", "tagging_user_id", "tag_style_id", "tag_detail", "tag_color",
+    "tag_contents", "offset_start", "offset_end",
+]
+
+
+def iter_memo_chunks(project, chunk_size=None):
+    """
+    프로젝트의 메모를 chunk_size개씩 읽어 메모 목록으로 돌려줍니다.
+    iterator(chunk_size=...)는 청크마다 태깅(+태그 스타일)을 prefetch 하므로
+    프로젝트 크기와 관계없이 메모리에는 한 청크만 올라갑니다.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    memos = (
+        Memo.objects.filter(project=project)
+        .order_by("id")
+        .prefetch_related(
+            Prefetch(
+                "taggings",
+                queryset=Tagging.objects.select_related("tag_style").order_by("offset_start", "id"),
+            )
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+    chunk = []
+    for memo in memos:
+        chunk.append(memo)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def memo_record(memo):
+    return {
+        "id": memo.id,
+        "user": memo.user_id,
+        "date": memo.date.isoformat(),
+        "contents": memo.contents,
+        "created_at": memo.created_at.isoformat(),
+        "modified_at": memo.modified_at.isoformat(),
+        "taggings": [
+            {
+                "id": tagging.id,
+                "user": tagging.user_id,
+                "tag_style": {
+                    "id": tagging.tag_style_id,
+                    "tag_detail": tagging.tag_style.tag_detail,
+                    "tag_color": tagging.tag_style.tag_color,
+                },
+                "tag_contents": tagging.tag_contents,
+                "offset_start": tagging.offset_start,
+                "offset_end": tagging.offset_end,
+                "created_at": tagging.created_at.isoformat(),
+            }
+            for tagging in memo.taggings.all()
+        ],
+    }
+
+
+def ndjson_chunks(project):
+    for memos in iter_memo_chunks(project):
+        yield "".join(
+            json.dumps(memo_record(memo), ensure_ascii=False) + "\n" for memo in memos
+        ).encode()
+
+
+class LineBuffer:
+    # csv.writer가 쓴 문자열을 그대로 돌려주는 파일 대용 객체
+    def write(self, value):
+        return value
+
+
+def csv_rows(memo):
+    # 태깅 하나당 한 줄, 태깅이 없는 메모도 한 줄은 남김
+    base = [memo.id, memo.user_id, memo.date.isoformat(), memo.contents, memo.created_at.isoformat()]
+    taggings = memo.taggings.all()
+    if not taggings:
+        yield base + [""] * (len(CSV_COLUMNS) - len(base))
+    for tagging in taggings:
+        yield base + [
+            tagging.id, tagging.user_id, tagging.tag_style_id,
+            tagging.tag_style.tag_detail, tagging.tag_style.tag_color,
+            tagging.tag_contents, tagging.offset_start, tagging.offset_end,
+        ]
+
+
+def csv_chunks(project):
+    writer = csv.writer(LineBuffer())
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+    yield ("\ufeff" + writer.writerow(CSV_COLUMNS)).encode()
+    for memos in iter_memo_chunks(project):
+        yield "".join(
+            writer.writerow(row) for memo in memos for row in csv_rows(memo)
+        ).encode()
+
+
+def gzip_chunks(chunks):
+    # wbits=31 → gzip 헤더/트레일러 포함 스트림
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_chunks, "application/x-ndjson", "ndjson"),
+    "csv": (csv_chunks, "text/csv; charset=utf-8", "csv"),
+}
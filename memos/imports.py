@@ -0,0 +1,102 @@
+import json
+from django.core.cache import cache
+from django.db import connection, transaction
+from rest_framework import serializers
+from portfolios.models import Log
+from .models import Memo, MemoRevision
+from .revisions import compress_text
+from .serializers import MemoImportSerializer
+
+BATCH_SIZE = 500
+MAX_ROWS = 5000
+
+
+class ImportTooLarge(Exception):
+    pass
+
+
+def iter_ndjson(stream):
+    """
+    한 줄에 JSON 객체 하나씩 읽어 (줄 번호, 객체)를 돌려줍니다. 빈 줄은 건너뜁니다.
+    JSON으로 읽을 수 없는 줄은 객체 대신 None을 돌려줍니다.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError:
+            yield line_number, None
+
+
+def iter_json_array(stream):
+    rows = json.load(stream)
+    if not isinstance(rows, list):
+        raise ValueError("JSON 배열이 필요합니다.")
+    yield from enumerate(rows, start=1)
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_memos(user, project, rows):
+    """
+    (줄 번호, 객체) 목록을 BATCH_SIZE 단위로 검증하고 유효한 줄만 bulk_create 합니다.
+    전체가 하나의 트랜잭션이며, 통나무는 행마다가 아니라 마지막에 날짜별로 한 번만 지급합니다.
+    """
+    created = 0
+    errors = []
+    dates = set()
+    # 행마다 DB 조회가 없는 검증기 하나를 재사용
+    validator = MemoImportSerializer()
+    with transaction.atomic():
+        for batch in batched(rows, BATCH_SIZE):
+            if created + len(errors) + len(batch) > MAX_ROWS:
+                raise ImportTooLarge
+            memos = []
+            for line, row in batch:
+                try:
+                    if row is None:
+                        raise serializers.ValidationError({"non_field_errors": ["JSON 형식이 올바르지 않습니다."]})
+                    data = validator.run_validation(row)
+                except serializers.ValidationError as exc:
+                    errors.append({"line": line, "errors": exc.detail})
+                    continue
+                memos.append(Memo(user=user, project=project, **data))
+                dates.add(data["date"])
+            Memo.objects.bulk_create(memos)
+            created += len(memos)
+            if not connection.features.can_return_rows_from_bulk_insert:
+                # MySQL 등은 bulk_create 후 pk를 채우지 않으므로, 방금 넣은(아직 리비전이 없는) 메모를 다시 읽음
+                memos = Memo.objects.filter(
+                    user=user, project=project, revisions__isnull=True
+                ).only("id", "contents")
+            # bulk_create는 Memo.save()를 거치지 않으므로 첫 리비전(스냅샷)도 함께 생성
+            MemoRevision.objects.bulk_create([
+                MemoRevision(
+                    memo=memo, number=1, is_snapshot=True,
+                    data=compress_text(memo.contents), length=len(memo.contents),
+                )
+                for memo in memos
+            ])
+
+        awarded = Log.give_past_logs(user, project, "DAILY_COMPLETE", dates) if dates else []
+
+        # bulk_create는 Memo.save()를 거치지 않으므로 날짜별 메모 캐시를 직접 무효화
+        keys = [Memo.daily_cache_key(user.id, project.id, day) for day in dates]
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    return {
+        "created": created,
+        "errors": errors,
+        "log_result": {"awarded": len(awarded), "dates": [day.isoformat() for day in awarded]},
+    }
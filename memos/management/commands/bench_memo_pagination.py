@@ -0,0 +1,105 @@
+import time
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.request import Request
+from accounts.models import User
+from memos.models import Memo
+from memos.views import MemoPagination
+from portfolios.models import Project
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "메모 커서 페이지네이션의 첫 페이지/마지막 페이지 조회 시간을 비교합니다. (데이터는 롤백됨)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--memos", type=int, default=100_000, help="생성할 메모 수 (기본 100000)")
+        parser.add_argument("--page-size", type=int, default=50, help="페이지 크기 (기본 50)")
+        parser.add_argument("--repeat", type=int, default=20, help="페이지별 반복 측정 횟수 (기본 20)")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, options):
+        total, page_size, repeat = options["memos"], options["page_size"], options["repeat"]
+
+        user = User.objects.create_user(username="bench_memo_user", email="bench@example.com")
+        project = Project.objects.create(
+            project_name="bench",
+            date_start=date(2020, 1, 1),
+            date_end=date(2030, 1, 1),
+            owner=user,
+            invite_code="BENCHMEMO0",
+        )
+
+        self.stdout.write(f"메모 {total}개 생성 중...")
+        started = time.perf_counter()
+        Memo.objects.bulk_create(
+            (
+                Memo(user=user, project=project, date=date(2020, 1, 1) + timedelta(days=i // 10), contents=f"memo {i}")
+                for i in range(total)
+            ),
+            batch_size=5000,
+        )
+        self.stdout.write(f"생성 완료 ({time.perf_counter() - started:.1f}s)")
+
+        factory = RequestFactory()
+        queryset = Memo.objects.filter(user=user, project=project)
+
+        def fetch(cursor=None):
+            params = {"page_size": page_size}
+            if cursor:
+                params["cursor"] = cursor
+            paginator = MemoPagination()
+            paginator.paginate_queryset(queryset, Request(factory.get("/memos/", params)))
+            return paginator
+
+        # 마지막 페이지의 커서를 구하기 위해 끝까지 이동
+        cursor, pages = None, 0
+        while True:
+            pages += 1
+            next_cursor = fetch(cursor).get_next_cursor()
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+        last_cursor = cursor
+
+        def measure(cursor):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                fetch(cursor)
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            return timings[len(timings) // 2] * 1000
+
+        def measure_offset(offset):
+            timings = []
+            ordered = queryset.order_by("-created_at", "-id")
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(ordered[offset:offset + page_size])
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            return timings[len(timings) // 2] * 1000
+
+        first_ms = measure(None)
+        last_ms = measure(last_cursor)
+        offset_first_ms = measure_offset(0)
+        offset_last_ms = measure_offset((pages - 1) * page_size)
+
+        self.stdout.write(f"페이지 수: {pages} (page_size={page_size})")
+        self.stdout.write(f"커서  첫 페이지   : {first_ms:.2f}ms (중앙값)")
+        self.stdout.write(f"커서  마지막 페이지: {last_ms:.2f}ms (중앙값)")
+        self.stdout.write(f"OFFSET 첫 페이지  : {offset_first_ms:.2f}ms (비교용)")
+        self.stdout.write(f"OFFSET 마지막 페이지: {offset_last_ms:.2f}ms (비교용)")
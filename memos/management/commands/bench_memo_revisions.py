@@ -0,0 +1,82 @@
+import random
+import time
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Length
+from accounts.models import User
+from memos.models import Memo, MemoRevision
+from portfolios.models import Project
+
+WORDS = ["오늘", "로그인", "버그", "수정", "회의", "정리", "배포", "테스트", "리뷰", "API", "화면", "데이터"]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "메모 리비전 저장 공간(스냅샷+압축 델타)을 전체 본문 복사와 비교합니다. (데이터는 롤백됨)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--revisions", type=int, default=1000, help="편집 횟수 (기본 1000)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본 0)")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def random_text(self, rng, length):
+        words = []
+        while sum(len(word) + 1 for word in words) < length:
+            words.append(rng.choice(WORDS))
+        return " ".join(words)[:length]
+
+    def run(self, options):
+        rng = random.Random(options["seed"])
+        user = User.objects.create_user(username="bench_revision_user", email="bench-revision@example.com")
+        project = Project.objects.create(
+            project_name="bench",
+            date_start=date(2020, 1, 1),
+            date_end=date(2030, 1, 1),
+            owner=user,
+            invite_code="BENCHREV00",
+        )
+        memo = Memo.objects.create(user=user, project=project, date=date(2025, 1, 1), contents=self.random_text(rng, 300))
+        naive_bytes = len(memo.contents.encode())
+
+        # 키 입력 단위 저장을 흉내 낸 작은 편집 (삽입/삭제 1~10글자)
+        started = time.perf_counter()
+        for _ in range(options["revisions"] - 1):
+            text = memo.contents
+            pos = rng.randint(0, len(text))
+            if len(text) > 450 or (text and rng.random() < 0.4):
+                memo.contents = text[:pos] + text[pos + rng.randint(1, 10):]
+            else:
+                memo.contents = text[:pos] + self.random_text(rng, rng.randint(1, 10)) + text[pos:]
+            memo.save()
+            naive_bytes += len(memo.contents.encode())
+        save_seconds = time.perf_counter() - started
+
+        revisions = MemoRevision.objects.filter(memo=memo)
+        count = revisions.count()
+        stored = revisions.aggregate(total=Sum(Length("data")))["total"]
+        snapshots = revisions.filter(is_snapshot=True).count()
+
+        # 가장 오래 걸리는 경우: 스냅샷 바로 앞 리비전 (델타 SNAPSHOT_INTERVAL - 1번 적용)
+        worst = [n for n in range(1, count + 1) if n % MemoRevision.SNAPSHOT_INTERVAL == 0] or [count]
+        started = time.perf_counter()
+        for number in worst:
+            MemoRevision.reconstruct(memo, number)
+        reconstruct_ms = (time.perf_counter() - started) / len(worst) * 1000
+        assert MemoRevision.reconstruct(memo, count) == memo.contents
+
+        self.stdout.write(f"리비전 수: {count} (스냅샷 {snapshots}개, 간격 {MemoRevision.SNAPSHOT_INTERVAL})")
+        self.stdout.write(f"전체 본문 복사: {naive_bytes} bytes ({naive_bytes / count:.1f} bytes/리비전)")
+        self.stdout.write(f"스냅샷+압축 델타: {stored} bytes ({stored / count:.1f} bytes/리비전, {stored / naive_bytes:.1%})")
+        self.stdout.write(f"저장 평균: {save_seconds / (count - 1) * 1000:.2f}ms, 최악 복원 평균: {reconstruct_ms:.2f}ms")
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0001_initial'),
+        ('portfolios', '0006_project_deleted_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='memo',
+            index=models.Index(fields=['user', 'project', '-created_at', '-id'], name='memo_user_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='memo',
+            index=models.Index(fields=['user', 'project', 'date', '-created_at', '-id'], name='memo_user_project_date_idx'),
+        ),
+    ]
@@ -0,0 +1,88 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+FTS_TABLE = "memos_search"
+
+# rowid = 메모 id * 2, 태깅 id * 2 + 1
+# 본문(body)만 인덱싱하고 memo_id/user_id는 검색 범위 필터용으로만 저장
+CREATE_TABLE = f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        body, memo_id UNINDEXED, user_id UNINDEXED, tokenize='trigram'
+    )
+"""
+
+TRIGGERS = [
+    f"""
+    CREATE TRIGGER memos_search_memo_insert AFTER INSERT ON memos_memo BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, body, memo_id, user_id)
+        VALUES (new.id * 2, new.contents, new.id, new.user_id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER memos_search_memo_update AFTER UPDATE OF contents, user_id ON memos_memo BEGIN
+        UPDATE {FTS_TABLE} SET body = new.contents, user_id = new.user_id WHERE rowid = old.id * 2;
+    END
+    """,
+    f"""
+    CREATE TRIGGER memos_search_memo_delete AFTER DELETE ON memos_memo BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id * 2;
+    END
+    """,
+    f"""
+    CREATE TRIGGER memos_search_tagging_insert AFTER INSERT ON taggings_tagging BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, body, memo_id, user_id)
+        VALUES (new.id * 2 + 1, new.tag_contents, new.memo_id, new.user_id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER memos_search_tagging_update AFTER UPDATE OF tag_contents, memo_id, user_id ON taggings_tagging BEGIN
+        UPDATE {FTS_TABLE} SET body = new.tag_contents, memo_id = new.memo_id, user_id = new.user_id
+        WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER memos_search_tagging_delete AFTER DELETE ON taggings_tagging BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+]
+
+BACKFILL = [
+    f"INSERT INTO {FTS_TABLE}(rowid, body, memo_id, user_id) SELECT id * 2, contents, id, user_id FROM memos_memo",
+    f"INSERT INTO {FTS_TABLE}(rowid, body, memo_id, user_id) SELECT id * 2 + 1, tag_contents, memo_id, user_id FROM taggings_tagging",
+]
+
+
+def create_search_index(apps, schema_editor):
+    # SQLite 전용. 다른 DB에서는 memos.search가 LIKE 검색으로 대체함
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute(CREATE_TABLE)
+        except OperationalError:
+            # FTS5 또는 trigram 토크나이저(SQLite 3.34+)가 없는 빌드
+            return
+        for sql in TRIGGERS + BACKFILL:
+            cursor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name in ["memo_insert", "memo_update", "memo_delete", "tagging_insert", "tagging_update", "tagging_delete"]:
+            cursor.execute(f"DROP TRIGGER IF EXISTS memos_search_{name}")
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0002_memo_list_indexes'),
+        ('taggings', '0002_alter_tagging_tag_contents'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
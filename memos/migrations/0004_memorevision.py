@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0003_memo_search_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemoRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('is_snapshot', models.BooleanField(default=False)),
+                ('data', models.BinaryField()),
+                ('length', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('memo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='memos.memo')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('memo', 'number'), name='unique_revision_number_per_memo')],
+            },
+        ),
+    ]
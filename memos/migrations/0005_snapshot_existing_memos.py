@@ -0,0 +1,32 @@
+from django.db import migrations
+
+from memos.revisions import compress_text
+
+
+def snapshot_existing_memos(apps, schema_editor):
+    # 리비전 기록 전에 만들어진 메모는 현재 본문을 첫 리비전(스냅샷)으로 남겨, 다음 수정 전 본문도 복원되게 함
+    Memo = apps.get_model("memos", "Memo")
+    MemoRevision = apps.get_model("memos", "MemoRevision")
+    memos = Memo.objects.filter(revisions__isnull=True).only("id", "contents").iterator(chunk_size=2000)
+    MemoRevision.objects.bulk_create(
+        (
+            MemoRevision(
+                memo_id=memo.id, number=1, is_snapshot=True,
+                data=compress_text(memo.contents), length=len(memo.contents),
+            )
+            for memo in memos
+        ),
+        batch_size=2000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0004_memorevision'),
+    ]
+
+    operations = [
+        migrations.RunPython(snapshot_existing_memos, migrations.RunPython.noop),
+    ]
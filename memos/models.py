@@ -1,6 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from django.core.cache import cache
 from accounts.models import User
 from portfolios.models import Project
+from config.conditional import row_validators
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True) # 객체를 생성할 때 날짜와 시간 저장
@@ -10,9 +14,208 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class MemoChanged(Exception):
+    """
+    apply_delta(if_match=...)에서 잠근 행의 ETag가 클라이언트가 보낸 If-Match와 다를 때
+    """
+
+
 class Memo(BaseModel):
     id = models.AutoField(primary_key=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="memos")
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="memos")
     date = models.DateField()
     contents = models.TextField(default="", max_length=500)
+
+    class Meta:
+        indexes = [
+            # 메모 리스트 커서 페이지네이션: (user, project) 범위를 최신순으로 스캔
+            models.Index(fields=["user", "project", "-created_at", "-id"], name="memo_user_project_created_idx"),
+            # ?date= 필터가 있는 경우: (user, project, date) 범위를 최신순으로 스캔
+            models.Index(fields=["user", "project", "date", "-created_at", "-id"], name="memo_user_project_date_idx"),
+        ]
+
+    CACHE_TIMEOUT = 60 * 10
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 수정 시 이전 (유저, 프로젝트, 날짜)의 캐시도 지울 수 있도록 기억
+        instance._loaded_key = instance.daily_cache_key(
+            instance.__dict__.get("user_id"),
+            instance.__dict__.get("project_id"),
+            instance.__dict__.get("date"),
+        )
+        return instance
+
+    @staticmethod
+    def daily_cache_key(user_id, project_id, date):
+        return f"daily_memos:{user_id}:{project_id}:{date}"
+
+    def invalidate_daily_cache(self):
+        keys = {self.daily_cache_key(self.user_id, self.project_id, self.date)}
+        if getattr(self, "_loaded_key", None):
+            keys.add(self._loaded_key)
+        transaction.on_commit(lambda: cache.delete_many(list(keys)))
+
+    def save(self, *args, **kwargs):
+        # 본문이 지연 로딩(defer)된 채이거나 update_fields에 없으면 본문은 저장되지 않음
+        update_fields = kwargs.get("update_fields")
+        saves_contents = "contents" in self.__dict__ and (update_fields is None or "contents" in update_fields)
+        with transaction.atomic():
+            previous = None
+            if saves_contents and not self._state.adding:
+                # 불러온 뒤 다른 요청이 본문을 바꿨을 수 있으므로, 행을 잠그고 저장된 본문과 비교
+                previous = (
+                    type(self).objects.select_for_update()
+                    .filter(pk=self.pk).values_list("contents", flat=True).first()
+                )
+            super().save(*args, **kwargs)
+            if saves_contents and previous != self.contents:
+                MemoRevision.record(self, previous)
+        self.invalidate_daily_cache()
+        self._loaded_key = self.daily_cache_key(self.user_id, self.project_id, self.date)
+
+    def delete(self, *args, **kwargs):
+        self.invalidate_daily_cache()
+        return super().delete(*args, **kwargs)
+
+    def apply_delta(self, ops, if_match=None):
+        """
+        텍스트 델타를 적용해 본문을 저장하고, 이 메모의 태깅 오프셋을 한 번의 bulk_update로 옮깁니다.
+        태깅된 글자가 모두 지워진 태깅은 삭제합니다.
+        if_match(If-Match의 ETag 목록)가 있으면 잠근 행의 ETag와 비교해, 다르면 아무것도 바꾸지 않고 MemoChanged를 냅니다.
+        """
+        return self._rewrite(lambda original: ops, if_match)
+
+    def restore_to(self, contents):
+        """
+        본문을 contents로 되돌립니다. 통째로 덮어쓰지 않고 잠근 행의 현재 본문과의 차이를 델타로 적용해
+        기존 태깅 위치를 보존합니다.
+        """
+        from .revisions import edit_ops
+
+        return self._rewrite(lambda original: edit_ops(original, contents))
+
+    def _rewrite(self, make_ops, if_match=None):
+        """
+        행과 태깅을 잠그고 다시 읽은 본문으로 make_ops(본문)를 만들어 적용합니다. (apply_delta, restore_to)
+        """
+        from .deltas import apply_delta
+
+        with transaction.atomic():
+            # 불러온 뒤 다른 요청이 본문이나 태깅을 바꿨을 수 있으므로, 행을 잠그고 다시 읽은 값에 적용
+            memo = type(self).objects.select_for_update().get(pk=self.pk)
+            # If-Match도 잠근 행으로 확인해야 확인과 적용 사이에 다른 수정이 끼어들지 못함
+            if if_match is not None and "*" not in if_match and row_validators(memo)[0] not in if_match:
+                raise MemoChanged
+            original = memo.contents
+            ops = make_ops(original)
+            if not ops:
+                self._sync_from(memo)
+                return {"updated": 0, "deleted": []}
+            taggings = list(memo.taggings.select_for_update().order_by("id"))
+            contents, spans = apply_delta(
+                original, ops, [(t.offset_start, t.offset_end) for t in taggings]
+            )
+            # TextField의 max_length는 모델 검증에서 확인되지 않으므로 직접 확인
+            max_length = self._meta.get_field("contents").max_length
+            if len(contents) > max_length:
+                raise ValidationError({"contents": [f"메모는 최대 {max_length}자까지 작성할 수 있습니다."]})
+            memo.contents = contents
+            memo.save(update_fields=["contents", "modified_at"])
+
+            now = timezone.now()
+            kept, removed = [], []
+            for tagging, (start, end) in zip(taggings, spans):
+                if start == end:
+                    removed.append(tagging.id)
+                    continue
+                old_span = (tagging.offset_start, tagging.offset_end)
+                if (start, end) == old_span and original[slice(*old_span)] == contents[start:end]:
+                    continue
+                tagging.offset_start, tagging.offset_end = start, end
+                tagging.tag_contents = contents[start:end]
+                # bulk_update는 auto_now를 적용하지 않으므로 직접 갱신 (ETag 변경용)
+                tagging.modified_at = now
+                kept.append(tagging)
+
+            Tagging = self.taggings.model
+            if kept:
+                Tagging.objects.bulk_update(kept, ["offset_start", "offset_end", "tag_contents", "modified_at"])
+            if removed:
+                Tagging.objects.filter(id__in=removed).delete()
+
+        self._sync_from(memo)
+        return {"updated": len(kept), "deleted": removed}
+
+    def _sync_from(self, memo):
+        # 호출한 쪽의 인스턴스도 저장된 값으로 맞춤 (응답 직렬화, ETag 계산용)
+        for field in self._meta.concrete_fields:
+            setattr(self, field.attname, getattr(memo, field.attname))
+        self._loaded_key = memo._loaded_key
+
+
+# 메모 본문 변경 이력 (주기적 전체 스냅샷 + 직전 리비전 대비 압축 델타)
+class MemoRevision(models.Model):
+    # 스냅샷 간격. 어떤 리비전이든 스냅샷 1개 + 델타 최대 (간격 - 1)개로 복원
+    SNAPSHOT_INTERVAL = 10
+
+    memo = models.ForeignKey(Memo, on_delete=models.CASCADE, related_name="revisions")
+    number = models.PositiveIntegerField()
+    is_snapshot = models.BooleanField(default=False)
+    # 스냅샷이면 zlib 압축 본문, 아니면 zlib 압축 델타 (memos/revisions.py)
+    data = models.BinaryField()
+    length = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["memo", "number"], name="unique_revision_number_per_memo"),
+        ]
+
+    @classmethod
+    def record(cls, memo, previous):
+        """
+        Memo.save()에서 본문이 바뀌었을 때 잠근 행의 저장된 본문(previous)과 함께 호출됩니다.
+        직전 리비전이 없거나, 저장된 본문을 알 수 없거나(previous가 None), 간격이 차면 스냅샷을 남깁니다.
+        """
+        from . import revisions
+
+        last_number = (
+            cls.objects.filter(memo=memo).order_by("-number").values_list("number", flat=True).first()
+        )
+        number = (last_number or 0) + 1
+        is_snapshot = (
+            last_number is None or previous is None or (number - 1) % cls.SNAPSHOT_INTERVAL == 0
+        )
+        data = (
+            revisions.compress_text(memo.contents)
+            if is_snapshot
+            else revisions.compress_delta(previous, memo.contents)
+        )
+        return cls.objects.create(
+            memo=memo, number=number, is_snapshot=is_snapshot, data=data, length=len(memo.contents),
+        )
+
+    @classmethod
+    def reconstruct(cls, memo, number):
+        """
+        number번 리비전의 본문을 복원합니다. 직전 스냅샷부터 델타를 적용하므로
+        쿼리 1번, 델타 적용은 최대 SNAPSHOT_INTERVAL - 1번입니다.
+        """
+        from . import revisions
+
+        rows = list(
+            cls.objects.filter(
+                memo=memo, number__lte=number, number__gt=number - cls.SNAPSHOT_INTERVAL,
+            ).order_by("number")
+        )
+        if not rows or rows[-1].number != number:
+            raise cls.DoesNotExist
+        start = max(index for index, row in enumerate(rows) if row.is_snapshot)
+        text = revisions.decompress_text(rows[start].data)
+        for row in rows[start + 1:]:
+            text = revisions.apply_compressed_delta(text, row.data)
+        return text
+
@@ -0,0 +1,78 @@
+"""
+메모 리비전의 압축 저장 형식.
+
+스냅샷은 본문 전체를, 델타는 직전 리비전 본문에서의 변경만 zlib으로 압축해 저장합니다.
+델타는 다음 항목들의 JSON 배열입니다.
+    양수 n        : 이전 본문에서 n글자 유지
+    음수 -n       : 이전 본문에서 n글자 삭제
+    문자열 "..."  : 현재 위치에 삽입
+"""
+import json
+import zlib
+from difflib import SequenceMatcher
+
+
+def compress_text(text):
+    return zlib.compress(text.encode(), 9)
+
+
+def decompress_text(data):
+    return zlib.decompress(bytes(data)).decode()
+
+
+def diff(old, new):
+    ops = []
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if tag in ("delete", "replace"):
+            ops.append(-(i2 - i1))
+        if tag in ("insert", "replace"):
+            ops.append(new[j1:j2])
+    # 끝부분 유지는 생략해도 복원 결과가 같음
+    if ops and isinstance(ops[-1], int) and ops[-1] > 0:
+        ops.pop()
+    return ops
+
+
+def patch(old, ops):
+    parts = []
+    pos = 0
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.append(old[pos:pos + op])
+            pos += op
+        else:
+            pos -= op
+    parts.append(old[pos:])
+    return "".join(parts)
+
+
+def compress_delta(old, new):
+    raw = json.dumps(diff(old, new), ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(raw.encode(), 9)
+
+
+def apply_compressed_delta(old, data):
+    return patch(old, json.loads(decompress_text(data)))
+
+
+def edit_ops(old, new):
+    """
+    old를 new로 바꾸는 insert/delete 연산 목록 (Memo.apply_delta 형식, 복원 시 태깅 오프셋 재계산용)
+    """
+    ops = []
+    pos = 0
+    for op in diff(old, new):
+        if isinstance(op, str):
+            ops.append({"op": "insert", "pos": pos, "text": op})
+            pos += len(op)
+        elif op > 0:
+            pos += op
+        else:
+            ops.append({"op": "delete", "pos": pos, "length": -op})
+    return ops
@@ -0,0 +1,177 @@
+import re
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import escape
+from .models import Memo
+
+# FTS5 가상 테이블 이름 (memos/migrations/0003_memo_search_fts.py에서 생성)
+FTS_TABLE = "memos_search"
+
+# trigram 토크나이저는 3글자 이상이어야 MATCH가 가능
+MIN_FTS_TERM_LENGTH = 3
+SNIPPET_RADIUS = 20
+HIGHLIGHT_START, HIGHLIGHT_END = "<mark>", "</mark>"
+# FTS5 snippet()이 일치 부분을 표시할 임시 구분자 (본문을 이스케이프한 뒤 <mark>로 바꿈)
+SNIPPET_START, SNIPPET_END = "\x02", "\x03"
+
+# rowid = id * 2 (메모) / id * 2 + 1 (태깅) 으로 두 테이블을 하나의 인덱스에 넣음
+KIND_MEMO, KIND_TAGGING = "memo", "tagging"
+
+
+def parse_terms(query):
+    return [term for term in re.split(r"\s+", query.strip()) if term]
+
+
+def fts_available():
+    """
+    SQLite이고 FTS5 테이블이 만들어져 있을 때만 FTS 검색을 사용합니다.
+    (FTS5/trigram을 지원하지 않는 SQLite 빌드에서는 마이그레이션이 테이블을 만들지 않음)
+    """
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def search(user, query, project_id=None, limit=20):
+    """
+    사용자의 메모 본문과 태깅 문구를 검색해 관련도 순으로 돌려줍니다.
+    검색어가 모두 3글자 이상이면 FTS5(bm25 순위 + 하이라이트 스니펫)를,
+    아니면 LIKE 스캔을 사용합니다. 삭제 표시된 프로젝트는 제외합니다.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return []
+    if fts_available() and all(len(term) >= MIN_FTS_TERM_LENGTH for term in terms):
+        return fts_search(user, terms, project_id, limit)
+    return like_search(user, terms, project_id, limit)
+
+
+def fts_query(terms):
+    # 각 검색어를 따옴표로 감싸 FTS5 문법(AND, OR, *, 따옴표 등)으로 해석되지 않게 함
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def fts_search(user, terms, project_id, limit):
+    memo_table = connection.ops.quote_name(Memo._meta.db_table)
+    project_table = connection.ops.quote_name(Memo._meta.get_field("project").related_model._meta.db_table)
+    sql = f"""
+        SELECT s.rowid, s.memo_id, m.project_id, m.date,
+               snippet({FTS_TABLE}, 0, %s, %s, '…', 32), bm25({FTS_TABLE})
+        FROM {FTS_TABLE} s
+        JOIN {memo_table} m ON m.id = s.memo_id
+        JOIN {project_table} p ON p.id = m.project_id
+        WHERE {FTS_TABLE} MATCH %s AND s.user_id = %s AND p.deleted_at IS NULL
+    """
+    params = [SNIPPET_START, SNIPPET_END, fts_query(terms), user.id]
+    if project_id:
+        sql += " AND m.project_id = %s"
+        params.append(project_id)
+    sql += f" ORDER BY bm25({FTS_TABLE}) LIMIT %s"
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    results = []
+    for rowid, memo_id, row_project_id, row_date, snippet, rank in rows:
+        is_tagging = rowid % 2
+        results.append({
+            "type": KIND_TAGGING if is_tagging else KIND_MEMO,
+            "memo_id": memo_id,
+            "tagging_id": rowid // 2 if is_tagging else None,
+            "project_id": row_project_id,
+            "date": str(row_date),
+            "snippet": render_snippet(snippet),
+            "rank": rank,
+        })
+    return results
+
+
+def render_snippet(snippet):
+    """
+    구분자로 표시된 스니펫의 사용자 본문을 HTML 이스케이프한 뒤, 구분자만 <mark> 태그로 바꿉니다.
+    """
+    # 본문에 섞여 들어온 구분자는 태그가 짝이 맞지 않게 되므로 지움
+    parts = snippet.split(SNIPPET_START)
+    rendered = [escape(parts[0].replace(SNIPPET_END, ""))]
+    for part in parts[1:]:
+        matched, _, rest = part.partition(SNIPPET_END)
+        rendered.append(f"{HIGHLIGHT_START}{escape(matched)}{HIGHLIGHT_END}{escape(rest.replace(SNIPPET_END, ''))}")
+    return "".join(rendered)
+
+
+def highlight(text, terms):
+    """
+    첫 번째로 일치하는 검색어 주변을 잘라 일치 부분을 표시합니다. (LIKE 검색용)
+    본문은 HTML 이스케이프하고 일치 부분만 <mark>로 감쌉니다.
+    """
+    lowered = text.lower()
+    positions = [lowered.find(term.lower()) for term in terms]
+    positions = [index for index in positions if index >= 0]
+    if not positions:
+        return escape(text[:SNIPPET_RADIUS * 2])
+    index = min(positions)
+    start = max(0, index - SNIPPET_RADIUS)
+    end = min(len(text), index + SNIPPET_RADIUS)
+    snippet = text[start:end]
+
+    # 검색어를 하나의 패턴으로 묶어 한 번에 찾아야 앞서 넣은 표시 안에서 다시 찾지 않음
+    pattern = "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True))
+    rendered = []
+    last = 0
+    for match in re.finditer(pattern, snippet, flags=re.IGNORECASE):
+        rendered.append(escape(snippet[last:match.start()]))
+        rendered.append(f"{HIGHLIGHT_START}{escape(match.group(0))}{HIGHLIGHT_END}")
+        last = match.end()
+    rendered.append(escape(snippet[last:]))
+    return ("…" if start > 0 else "") + "".join(rendered) + ("…" if end < len(text) else "")
+
+
+def like_search(user, terms, project_id, limit):
+    """
+    FTS를 쓸 수 없을 때(다른 DB, 짧은 검색어)의 대체 검색입니다.
+    사용자 범위의 인덱스로 좁힌 뒤 LIKE로 스캔하며, 순위 대신 최신순으로 정렬합니다.
+    """
+    from taggings.models import Tagging
+
+    memo_filter = Q()
+    tagging_filter = Q()
+    for term in terms:
+        memo_filter &= Q(contents__icontains=term)
+        tagging_filter &= Q(tag_contents__icontains=term)
+
+    memos = Memo.objects.filter(memo_filter, user=user, project__deleted_at__isnull=True)
+    taggings = Tagging.objects.filter(tagging_filter, user=user, memo__project__deleted_at__isnull=True)
+    if project_id:
+        memos = memos.filter(project_id=project_id)
+        taggings = taggings.filter(memo__project_id=project_id)
+
+    rows = [
+        (memo.created_at, {
+            "type": KIND_MEMO,
+            "memo_id": memo.id,
+            "tagging_id": None,
+            "project_id": memo.project_id,
+            "date": str(memo.date),
+            "snippet": highlight(memo.contents, terms),
+            "rank": None,
+        })
+        for memo in memos.order_by("-created_at")[:limit]
+    ]
+    rows += [
+        (tagging.created_at, {
+            "type": KIND_TAGGING,
+            "memo_id": tagging.memo_id,
+            "tagging_id": tagging.id,
+            "project_id": tagging.memo.project_id,
+            "date": str(tagging.memo.date),
+            "snippet": highlight(tagging.tag_contents, terms),
+            "rank": None,
+        })
+        for tagging in taggings.select_related("memo").order_by("-created_at")[:limit]
+    ]
+    rows.sort(key=lambda row: row[0], reverse=True)
+    return [row for _, row in rows[:limit]]
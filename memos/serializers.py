@@ -1,8 +1,50 @@
 from rest_framework import serializers
-from .models import Memo
+from taggings.serializers import TaggingWithStyleSerializer
+from .models import Memo, MemoRevision
 
 class MemoSerializer(serializers.ModelSerializer):
     class Meta:
         model = Memo
         fields = "__all__"
-        read_only_fields = ["id", "user", "created_at", "modified_at"]
\ No newline at end of file
+        read_only_fields = ["id", "user", "created_at", "modified_at"]
+
+
+# 메모 목록 ?expand=taggings 용 (prefetch된 태깅과 태그 스타일을 함께 직렬화)
+class MemoWithTaggingsSerializer(MemoSerializer):
+    taggings = TaggingWithStyleSerializer(many=True, read_only=True)
+
+# 일괄 가져오기의 한 줄 (프로젝트/유저는 요청 단위로 정해지므로 DB 조회 없이 검증)
+class MemoImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Memo
+        fields = ["date", "contents"]
+
+
+class MemoDeltaOpSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=["insert", "delete"])
+    pos = serializers.IntegerField(min_value=0)
+    text = serializers.CharField(required=False, trim_whitespace=False)
+    length = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, attrs):
+        if attrs["op"] == "insert" and not attrs.get("text"):
+            raise serializers.ValidationError("insert 연산에는 text가 필요합니다.")
+        if attrs["op"] == "delete" and not attrs.get("length"):
+            raise serializers.ValidationError("delete 연산에는 length가 필요합니다.")
+        return attrs
+
+
+# 메모 부분 수정 (PATCH) 요청 본문
+class MemoDeltaSerializer(serializers.Serializer):
+    MAX_OPS = 500
+
+    ops = MemoDeltaOpSerializer(many=True, allow_empty=False, max_length=MAX_OPS)
+
+
+class MemoRevisionSerializer(serializers.ModelSerializer):
+    # 저장된 압축 데이터 크기 (bytes)
+    size = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = MemoRevision
+        fields = ["number", "is_snapshot", "length", "size", "created_at"]
@@ -1,3 +1,673 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+from datetime import date
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User, TeamMember
+from portfolios.models import Project, ProjectHouse, Log, ProjectDailyMember, ProjectDailyStats
+from taggings.models import Tagging, TagStyle
+from config.conditional import row_validators
+from .models import Memo, MemoChanged, MemoRevision
+from . import search
 
-# Create your tests here.
+
+def create_owner(**fields):
+    return User.objects.create_user(username="owner", email="owner@test.com", **fields)
+
+
+def create_project(owner, **fields):
+    # 테스트 공통 프로젝트 ("테스트", 2025-11-01 ~ 2025-11-10, 초대 코드 code1). 다른 값은 fields로 덮어씀
+    fields = {
+        "project_name": "테스트",
+        "date_start": date(2025, 11, 1),
+        "date_end": date(2025, 11, 10),
+        "invite_code": "code1",
+        **fields,
+    }
+    return Project.objects.create(owner=owner, **fields)
+
+
+TAG_STYLE_COLORS = {"문제": "#FFEC5E", "해결": "#5EC8FF"}
+
+
+def create_tag_style(tag_detail="문제"):
+    return TagStyle.objects.create(tag_detail=tag_detail, tag_color=TAG_STYLE_COLORS[tag_detail])
+
+
+# 쿼리 수를 세는 테스트는 캐시 조회가 DB 쿼리로 섞이지 않도록 메모리 캐시 사용 (운영의 Redis와 같은 조건)
+MEMORY_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class MemoListPaginationTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.user, self.project, role="Admin")
+        Memo.objects.bulk_create(
+            Memo(user=self.user, project=self.project, date=date(2025, 11, 1 + i % 2), contents=f"메모 {i}")
+            for i in range(30)
+        )
+        # 같은 created_at을 가진 메모도 id로 구분되어야 함
+        Memo.objects.update(created_at=timezone.now())
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def walk(self, params):
+        response = self.client.get("/memos/", params)
+        seen = [row["id"] for row in response.data["results"]]
+        while response.data["next_cursor"]:
+            response = self.client.get("/memos/", {**params, "cursor": response.data["next_cursor"]})
+            seen += [row["id"] for row in response.data["results"]]
+        return seen
+
+    def test_pages_cover_all_memos_once(self):
+        seen = self.walk({"project_id": self.project.id, "page_size": 7})
+        self.assertEqual(len(seen), 30)
+        self.assertEqual(seen, sorted(seen, reverse=True))
+
+    def test_pages_with_date_filter(self):
+        seen = self.walk({"project_id": self.project.id, "date": "2025-11-02", "page_size": 4})
+        self.assertEqual(len(seen), 15)
+        self.assertEqual(set(Memo.objects.filter(id__in=seen).values_list("date", flat=True)), {date(2025, 11, 2)})
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/memos/", {"project_id": self.project.id, "cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+
+class MemoSearchTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.other = User.objects.create_user(username="other", email="other@test.com")
+        self.project = create_project(self.user)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.user, self.project, role="Admin")
+        TeamMember.join(self.other, self.project)
+        self.tag_style = create_tag_style()
+
+        self.memo = Memo.objects.create(
+            user=self.user, project=self.project, date=date(2025, 11, 3),
+            contents="회원가입 폼에서 이메일 중복 검사가 빠져 있었다",
+        )
+        self.tagging = Tagging.objects.create(
+            tag_style=self.tag_style, user=self.user, memo=self.memo,
+            tag_contents="이메일 중복 검사", offset_start=10, offset_end=19,
+        )
+        Memo.objects.create(
+            user=self.other, project=self.project, date=date(2025, 11, 3),
+            contents="다른 사람의 회원가입 메모",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_results(self, **params):
+        response = self.client.get("/memos/search/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.data["results"]
+
+    def test_fts_index_is_used(self):
+        self.assertTrue(search.fts_available())
+
+    def test_finds_memo_and_tagging_with_snippet(self):
+        results = self.get_results(q="이메일")
+        self.assertTrue(all(row["rank"] is not None for row in results))
+        self.assertEqual({(row["type"], row["memo_id"]) for row in results}, {
+            ("memo", self.memo.id), ("tagging", self.memo.id),
+        })
+        tagging_row = next(row for row in results if row["type"] == "tagging")
+        self.assertEqual(tagging_row["tagging_id"], self.tagging.id)
+        self.assertEqual(tagging_row["snippet"], "<mark>이메일</mark> 중복 검사")
+
+    def test_scoped_to_user(self):
+        results = self.get_results(q="회원가입")
+        self.assertEqual([row["memo_id"] for row in results], [self.memo.id])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.memo.contents = "결제 모듈 리팩터링"
+        self.memo.save()
+        self.assertEqual([row["type"] for row in self.get_results(q="회원가입")], [])
+        self.assertEqual(len(self.get_results(q="리팩터링")), 1)
+
+        self.memo.delete()
+        self.assertEqual(self.get_results(q="리팩터링"), [])
+        self.assertEqual(self.get_results(q="이메일"), [])
+
+    def test_deleted_project_is_excluded(self):
+        self.project.mark_deleted()
+        self.assertEqual(self.get_results(q="회원가입"), [])
+
+    def test_short_terms_fall_back_to_like(self):
+        results = self.get_results(q="이메일 폼")
+        self.assertEqual([row["type"] for row in results], ["memo"])
+        self.assertIsNone(results[0]["rank"])
+        self.assertIn("<mark>폼</mark>", results[0]["snippet"])
+
+    def test_snippet_escapes_user_html(self):
+        Memo.objects.create(
+            user=self.user, project=self.project, date=date(2025, 11, 4),
+            contents="<script>alert(1)</script> 결제 모듈 <b>",
+        )
+        fts_rows = self.get_results(q="결제 모듈")
+        like_rows = search.like_search(self.user, ["결제", "모"], None, 20)
+        for row in (fts_rows[0], like_rows[0]):
+            self.assertNotIn("<script>", row["snippet"])
+            self.assertNotIn("<b>", row["snippet"])
+            self.assertIn("&lt;/script&gt;", row["snippet"])
+        self.assertIn("<mark>결제</mark>", like_rows[0]["snippet"])
+
+    def test_like_search_covers_taggings(self):
+        terms = ["중복"]
+        like_rows = search.like_search(self.user, terms, None, 20)
+        self.assertEqual({row["type"] for row in like_rows}, {"memo", "tagging"})
+
+    def test_empty_query(self):
+        response = self.client.get("/memos/search/", {"q": " "})
+        self.assertEqual(response.status_code, 400)
+
+
+class MemoCalendarTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user, date_start=date(2025, 10, 25), date_end=date(2025, 11, 30))
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.user, self.project, role="Admin")
+        tag_style = create_tag_style()
+
+        for day, memo_count in [(date(2025, 11, 3), 2), (date(2025, 11, 14), 1), (date(2025, 10, 31), 1)]:
+            for i in range(memo_count):
+                memo = Memo.objects.create(user=self.user, project=self.project, date=day, contents=f"메모 {i}")
+                Tagging.objects.create(
+                    tag_style=tag_style, user=self.user, memo=memo,
+                    tag_contents="메모", offset_start=0, offset_end=2,
+                )
+        Log.objects.create(user=self.user, project=self.project, date=date(2025, 11, 3), reason="DAILY_COMPLETE")
+        Log.objects.create(user=self.user, project=self.project, date=date(2025, 11, 3), reason="TAG_REVIEW_COMPLETE")
+        Log.objects.create(user=self.user, project=self.project, date=date(2025, 11, 14), reason="DAILY_COMPLETE")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_month_counts(self):
+        with self.assertNumQueries(3):
+            response = self.client.get("/memos/calendar/", {"project_id": self.project.id, "month": "2025-11"})
+        self.assertEqual(response.status_code, 200)
+        days = {row["date"]: row for row in response.data["results"]}
+        self.assertEqual(len(days), 30)
+        self.assertEqual(days["2025-11-03"], {
+            "date": "2025-11-03", "memo_count": 2, "tagging_count": 2,
+            "daily_complete": True, "tag_review_complete": True,
+        })
+        self.assertEqual(days["2025-11-14"]["memo_count"], 1)
+        self.assertTrue(days["2025-11-14"]["daily_complete"])
+        self.assertFalse(days["2025-11-14"]["tag_review_complete"])
+        self.assertEqual(days["2025-11-01"]["memo_count"], 0)
+        # 다른 달의 메모는 포함되지 않음
+        self.assertEqual(sum(row["memo_count"] for row in days.values()), 3)
+
+    def test_invalid_params(self):
+        response = self.client.get("/memos/calendar/", {"month": "2025-11"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get("/memos/calendar/", {"project_id": self.project.id, "month": "2025-13"})
+        self.assertEqual(response.status_code, 400)
+
+
+class MemoImportTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.house = ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.user, self.project, role="Admin")
+        # 11/2에는 이미 DAILY_COMPLETE, 11/3에는 TAG_REVIEW_COMPLETE만 받은 상태
+        Log.objects.create(user=self.user, project=self.project, date=date(2025, 11, 2), reason="DAILY_COMPLETE")
+        Log.objects.create(user=self.user, project=self.project, date=date(2025, 11, 3), reason="TAG_REVIEW_COMPLETE")
+        ProjectHouse.objects.filter(pk=self.house.pk).update(current_logs=2)
+        ProjectDailyStats.objects.create(project=self.project, date=date(2025, 11, 2), daily_complete_count=1, active_members=1)
+        ProjectDailyStats.objects.create(project=self.project, date=date(2025, 11, 3), tag_review_count=1, active_members=1)
+        for day in (2, 3):
+            ProjectDailyMember.objects.create(project=self.project, user=self.user, date=date(2025, 11, day))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def post(self, body, content_type):
+        return self.client.post(
+            f"/memos/import/?project_id={self.project.id}", data=body, content_type=content_type,
+        )
+
+    def test_ndjson_import(self):
+        lines = [json.dumps({"date": f"2025-11-0{1 + i % 4}", "contents": f"메모 {i}"}) for i in range(40)]
+        lines.insert(5, "{broken")
+        lines.insert(10, json.dumps({"date": "2025/11/01", "contents": "날짜 형식 오류"}))
+        lines.append("")
+
+        response = self.post("\n".join(lines), "application/x-ndjson")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 40)
+        self.assertEqual([error["line"] for error in response.data["errors"]], [6, 11])
+        self.assertIn("date", response.data["errors"][1]["errors"])
+        self.assertEqual(Memo.objects.filter(user=self.user).count(), 40)
+        self.assertEqual(MemoRevision.objects.filter(number=1, is_snapshot=True).count(), 40)
+
+        # 11/2는 이미 받았으므로 11/1, 11/3, 11/4만 지급
+        self.assertEqual(response.data["log_result"]["dates"], ["2025-11-01", "2025-11-03", "2025-11-04"])
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.current_logs, Log.objects.filter(project=self.project).count())
+        stats = {s.date.day: s for s in ProjectDailyStats.objects.filter(project=self.project)}
+        self.assertEqual((stats[1].daily_complete_count, stats[1].active_members), (1, 1))
+        self.assertEqual((stats[2].daily_complete_count, stats[2].active_members), (1, 1))
+        self.assertEqual((stats[3].daily_complete_count, stats[3].active_members), (1, 1))
+
+    def test_revisions_without_returned_ids(self):
+        # MySQL처럼 bulk_create 후 pk를 채우지 않는 백엔드
+        lines = [json.dumps({"date": "2025-11-01", "contents": f"메모 {i}"}) for i in range(3)]
+        with patch.object(type(connection.features), "can_return_rows_from_bulk_insert", False):
+            response = self.post("\n".join(lines), "application/x-ndjson")
+        self.assertEqual(response.status_code, 201)
+        for memo in Memo.objects.filter(user=self.user):
+            self.assertEqual(MemoRevision.reconstruct(memo, 1), memo.contents)
+
+    def test_log_given_concurrently_is_skipped(self):
+        create = Log.objects.create
+
+        def race(**fields):
+            # 지급 여부 조회 뒤, INSERT 직전에 다른 요청이 11/4 통나무를 먼저 지급한 상황
+            if not Log.objects.filter(date=date(2025, 11, 4)).exists():
+                create(user=self.user, project=self.project, date=date(2025, 11, 4), reason="DAILY_COMPLETE")
+                ProjectHouse.objects.filter(pk=self.house.pk).update(current_logs=3)
+            return create(**fields)
+
+        rows = [{"date": f"2025-11-0{day}", "contents": "메모"} for day in (1, 4)]
+        with patch.object(Log.objects, "create", side_effect=race):
+            response = self.post(json.dumps(rows), "application/json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(response.data["log_result"]["dates"], ["2025-11-01"])
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.current_logs, Log.objects.filter(project=self.project).count())
+
+    def test_json_array_import_skips_logs_outside_project(self):
+        rows = [
+            {"date": "2025-10-20", "contents": "프로젝트 시작 전"},
+            {"date": "2025-11-05", "contents": "기간 안"},
+        ]
+        response = self.post(json.dumps(rows), "application/json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(response.data["log_result"]["dates"], ["2025-11-05"])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.post("{}", "application/json").status_code, 400)
+        self.assertEqual(self.post("[{\"date\": \"x\"}]", "application/json").status_code, 400)
+        self.assertEqual(self.post("a,b", "text/csv").status_code, 415)
+
+        outsider = User.objects.create_user(username="outsider", email="outsider@test.com")
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.post("[]", "application/json").status_code, 403)
+        self.assertEqual(Memo.objects.count(), 0)
+
+
+class MemoExportTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.member = User.objects.create_user(username="member", email="member@test.com")
+        self.project = create_project(self.user)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.user, self.project, role="Admin")
+        TeamMember.join(self.member, self.project)
+        tag_style = create_tag_style()
+
+        for i in range(7):
+            author = self.user if i % 2 else self.member
+            memo = Memo.objects.create(user=author, project=self.project, date=date(2025, 11, 1), contents=f"메모, \"{i}\"")
+            for j in range(i % 3):
+                Tagging.objects.create(
+                    tag_style=tag_style, user=author, memo=memo,
+                    tag_contents="메모", offset_start=j, offset_end=j + 2,
+                )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def export(self, **params):
+        response = self.client.get("/memos/export/", {"project_id": self.project.id, **params})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    def test_ndjson_export(self):
+        # 프로젝트, 팀원 확인, 메모 조회 + 청크(3개씩)마다 태깅 prefetch 1번
+        with patch("memos.exports.CHUNK_SIZE", 3), self.assertNumQueries(3 + 3):
+            response, body = self.export()
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(len(records), 7)
+        self.assertEqual([r["id"] for r in records], sorted(r["id"] for r in records))
+        self.assertEqual(
+            sum(len(r["taggings"]) for r in records),
+            Tagging.objects.filter(memo__project=self.project).count(),
+        )
+        self.assertEqual(records[2]["taggings"][0]["tag_style"]["tag_detail"], "문제")
+        self.assertIn("project-", response["Content-Disposition"])
+
+    def test_csv_gzip_export(self):
+        response, body = self.export(output="csv", gzip="1")
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        rows = list(csv.reader(io.StringIO(gzip.decompress(body).decode("utf-8-sig"))))
+        self.assertEqual(rows[0][:2], ["memo_id", "memo_user_id"])
+        # 태깅이 없는 메모도 한 줄: 0,1,2,0,1,2,0개 → 태깅 6줄 + 태깅 없는 메모 3줄
+        self.assertEqual(len(rows) - 1, 9)
+        self.assertIn('메모, "1"', [row[3] for row in rows[1:]])
+
+    def test_requires_membership(self):
+        outsider = User.objects.create_user(username="outsider", email="outsider@test.com")
+        self.client.force_authenticate(outsider)
+        response = self.client.get("/memos/export/", {"project_id": self.project.id})
+        self.assertEqual(response.status_code, 403)
+
+
+class MemoConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.memos = [
+            Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents=f"메모 {i}")
+            for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_not_modified_until_change(self):
+        params = {"project_id": self.project.id}
+        response = self.client.get("/memos/", params)
+        etag = response["ETag"]
+
+        with patch("memos.views.MemoSerializer") as serializer:
+            response = self.client.get("/memos/", params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        serializer.assert_not_called()
+
+        # 수정은 MAX(modified_at), 삭제는 COUNT로 감지
+        self.memos[0].contents = "수정"
+        self.memos[0].save()
+        response = self.client.get("/memos/", params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response["ETag"]
+        Memo.objects.filter(pk=self.memos[1].pk).delete()
+        response = self.client.get("/memos/", params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_etag_differs_per_page(self):
+        params = {"project_id": self.project.id, "page_size": 2}
+        first = self.client.get("/memos/", params)
+        etag = first["ETag"]
+
+        self.assertNotEqual(self.client.get("/memos/", {**params, "page_size": 3})["ETag"], etag)
+        response = self.client.get("/memos/", {**params, "cursor": first.data["next_cursor"]}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_detail_validators(self):
+        url = f"/memos/{self.memos[0].id}/"
+        response = self.client.get(url)
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(response.status_code, 304)
+
+
+class MemoListExpandTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        styles = [
+            create_tag_style(),
+            create_tag_style("해결"),
+        ]
+        for i in range(10):
+            memo = Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents=f"메모입니다 {i}")
+            for j in range(i % 3):
+                Tagging.objects.create(
+                    tag_style=styles[j % 2], user=self.user, memo=memo,
+                    tag_contents="메모", offset_start=j, offset_end=j + 2,
+                )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @override_settings(CACHES=MEMORY_CACHES)
+    def test_expand_taggings_in_constant_queries(self):
+        # 검증값 집계 2번 + 메모 페이지 1번 + 태깅(태그 스타일 JOIN) prefetch 1번
+        with self.assertNumQueries(4):
+            response = self.client.get("/memos/", {"project_id": self.project.id, "expand": "taggings"})
+        self.assertEqual(response.status_code, 200)
+        results = response.data["results"]
+        self.assertEqual(len(results), 10)
+        by_id = {row["id"]: row for row in results}
+        for memo in Memo.objects.all():
+            self.assertEqual(len(by_id[memo.id]["taggings"]), memo.taggings.count())
+        tagged = next(row for row in results if len(row["taggings"]) == 2)
+        self.assertEqual([t["tag_style"]["tag_detail"] for t in tagged["taggings"]], ["문제", "해결"])
+
+    def test_expand_etag_follows_taggings(self):
+        params = {"project_id": self.project.id, "expand": "taggings"}
+        etag = self.client.get("/memos/", params)["ETag"]
+        Tagging.objects.filter(offset_start=1).delete()
+        self.assertEqual(self.client.get("/memos/", params, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_plain_list_has_no_taggings(self):
+        response = self.client.get("/memos/", {"project_id": self.project.id})
+        self.assertNotIn("taggings", response.data["results"][0])
+        response = self.client.get("/memos/", {"project_id": self.project.id, "expand": "tags"})
+        self.assertEqual(response.status_code, 400)
+
+
+class MemoDeltaTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.memo = Memo.objects.create(
+            user=self.user, project=self.project, date=date(2025, 11, 1), contents="오늘은 로그인 버그를 고쳤다",
+        )
+        tag_style = create_tag_style()
+        # "로그인 버그" (4~10), "고쳤다" (12~15)
+        self.bug = Tagging.objects.create(
+            tag_style=tag_style, user=self.user, memo=self.memo,
+            tag_contents="로그인 버그", offset_start=4, offset_end=10,
+        )
+        self.fix = Tagging.objects.create(
+            tag_style=tag_style, user=self.user, memo=self.memo,
+            tag_contents="고쳤다", offset_start=12, offset_end=15,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f"/memos/{self.memo.id}/"
+
+    def patch(self, ops, **headers):
+        return self.client.patch(self.url, {"ops": ops}, format="json", **headers)
+
+    def assert_tagging(self, tagging, start, end):
+        tagging.refresh_from_db()
+        self.assertEqual((tagging.offset_start, tagging.offset_end), (start, end))
+        self.assertEqual(tagging.tag_contents, self.memo.contents[start:end])
+
+    def test_insert_shifts_and_expands(self):
+        response = self.patch([
+            {"op": "insert", "pos": 0, "text": "어제와 "},
+            {"op": "insert", "pos": 12, "text": "화면 "},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, "어제와 오늘은 로그인 화면 버그를 고쳤다")
+        self.assert_tagging(self.bug, 8, 17)
+        self.assert_tagging(self.fix, 19, 22)
+        self.assertEqual(response.data["taggings"], {"updated": 2, "deleted": []})
+
+    def test_delete_clips_and_removes(self):
+        # "로그인 " 삭제 → 버그 태깅은 "버그"로 잘리고, "고쳤다" 삭제 → 태깅 삭제
+        response = self.patch([
+            {"op": "delete", "pos": 4, "length": 4},
+            {"op": "delete", "pos": 8, "length": 3},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, "오늘은 버그를 ")
+        self.assert_tagging(self.bug, 4, 6)
+        self.assertFalse(Tagging.objects.filter(id=self.fix.id).exists())
+        self.assertEqual(response.data["taggings"]["deleted"], [self.fix.id])
+
+    def test_invalid_ops_change_nothing(self):
+        response = self.patch([
+            {"op": "insert", "pos": 0, "text": "앞 "},
+            {"op": "delete", "pos": 100, "length": 1},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("1", response.data["errors"]["ops"])
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, "오늘은 로그인 버그를 고쳤다")
+        self.assert_tagging(self.bug, 4, 10)
+
+        self.assertEqual(self.patch([{"op": "insert", "pos": 0}]).status_code, 400)
+        self.assertEqual(self.patch([{"op": "insert", "pos": 0, "text": "가" * 500}]).status_code, 400)
+
+    def test_applies_to_stored_row_not_stale_instance(self):
+        stale = Memo.objects.get(pk=self.memo.pk)
+        # stale을 불러온 뒤 다른 요청이 앞에 글자를 넣고 태깅도 옮긴 상황
+        self.memo.apply_delta([{"op": "insert", "pos": 0, "text": "어제와 "}])
+
+        stale.apply_delta([{"op": "insert", "pos": 4, "text": "또 "}])
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, "어제와 또 오늘은 로그인 버그를 고쳤다")
+        self.assertEqual(stale.contents, self.memo.contents)
+        self.assert_tagging(self.bug, 10, 16)
+        self.assert_tagging(self.fix, 18, 21)
+        self.assertEqual(MemoRevision.reconstruct(self.memo, 3), self.memo.contents)
+
+    def test_if_match(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.patch([{"op": "insert", "pos": 0, "text": "!"}], HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        # 이전 ETag로 다시 보내면 충돌
+        response = self.patch([{"op": "insert", "pos": 0, "text": "!"}], HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
+        response = self.patch([{"op": "insert", "pos": 0, "text": "!"}], HTTP_IF_MATCH="*")
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_match_is_checked_on_locked_row(self):
+        etag = row_validators(self.memo)[0]
+        # 뷰가 행을 읽은 뒤, 잠그기 전에 다른 요청이 먼저 수정한 상황
+        Memo.objects.get(pk=self.memo.pk).apply_delta([{"op": "insert", "pos": 0, "text": "먼저 "}])
+
+        with self.assertRaises(MemoChanged):
+            self.memo.apply_delta([{"op": "insert", "pos": 0, "text": "!"}], if_match=[etag])
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, "먼저 오늘은 로그인 버그를 고쳤다")
+
+
+class MemoRevisionTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.memo = Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents="버전 0")
+        self.history = [self.memo.contents]
+        for i in range(1, 25):
+            self.memo.contents = f"버전 {i}: " + "내용 " * i
+            self.memo.save()
+            self.history.append(self.memo.contents)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_every_version_reconstructs(self):
+        revisions = list(MemoRevision.objects.filter(memo=self.memo).order_by("number"))
+        self.assertEqual(len(revisions), 25)
+        self.assertEqual(
+            [r.number for r in revisions if r.is_snapshot],
+            list(range(1, 26, MemoRevision.SNAPSHOT_INTERVAL)),
+        )
+        for number, contents in enumerate(self.history, start=1):
+            with self.assertNumQueries(1):
+                self.assertEqual(MemoRevision.reconstruct(self.memo, number), contents)
+
+    def test_stale_instance_diffs_against_stored_contents(self):
+        stale = Memo.objects.get(pk=self.memo.pk)
+        self.memo.contents = "다른 곳에서 먼저 수정"
+        self.memo.save()
+
+        stale.contents = "늦게 저장한 본문"
+        stale.save()
+        self.assertEqual(MemoRevision.reconstruct(self.memo, 26), "다른 곳에서 먼저 수정")
+        self.assertEqual(MemoRevision.reconstruct(self.memo, 27), "늦게 저장한 본문")
+
+    def test_save_with_deferred_contents(self):
+        memo = Memo.objects.defer("contents").get(pk=self.memo.pk)
+        memo.date = date(2025, 11, 2)
+        memo.save()
+        self.assertEqual(self.memo.revisions.count(), 25)
+
+    def test_memo_without_revisions_starts_with_snapshot(self):
+        memo = Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents="처음")
+        memo.revisions.all().delete()
+        memo.contents = "수정"
+        memo.save()
+        revision = memo.revisions.get()
+        self.assertTrue(revision.is_snapshot)
+        self.assertEqual(MemoRevision.reconstruct(memo, revision.number), "수정")
+
+    def test_unchanged_save_adds_no_revision(self):
+        self.memo.date = date(2025, 11, 2)
+        self.memo.save()
+        self.assertEqual(self.memo.revisions.count(), 25)
+
+    def test_list_and_fetch(self):
+        response = self.client.get(f"/memos/{self.memo.id}/revisions/", {"page_size": 10})
+        self.assertEqual([row["number"] for row in response.data["results"]], list(range(25, 15, -1)))
+        self.assertNotIn("contents", response.data["results"][0])
+        self.assertIsNotNone(response.data["next_cursor"])
+
+        response = self.client.get(f"/memos/{self.memo.id}/revisions/3/")
+        self.assertEqual(response.data["results"]["contents"], self.history[2])
+        self.assertEqual(self.client.get(f"/memos/{self.memo.id}/revisions/99/").status_code, 404)
+
+    def test_restore_keeps_taggings(self):
+        memo = Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents="로그인 버그 수정")
+        tag_style = create_tag_style()
+        tagging = Tagging.objects.create(
+            tag_style=tag_style, user=self.user, memo=memo, tag_contents="버그", offset_start=4, offset_end=6,
+        )
+        memo.apply_delta([{"op": "insert", "pos": 0, "text": "회원가입과 "}])
+
+        response = self.client.post(f"/memos/{memo.id}/revisions/1/restore/")
+        self.assertEqual(response.status_code, 200)
+        memo.refresh_from_db()
+        tagging.refresh_from_db()
+        self.assertEqual(memo.contents, "로그인 버그 수정")
+        self.assertEqual((tagging.offset_start, tagging.offset_end), (4, 6))
+        # 되돌리기도 새 리비전으로 기록
+        self.assertEqual(memo.revisions.count(), 3)
+
+    def test_restore_diffs_against_locked_contents(self):
+        stale = Memo.objects.get(pk=self.memo.pk)
+        self.memo.apply_delta([{"op": "insert", "pos": 0, "text": "다른 곳에서 먼저 "}])
+
+        stale.restore_to(self.history[0])
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, self.history[0])
+        self.assertEqual(stale.contents, self.history[0])
+
+    def test_restore_errors_are_client_errors(self):
+        url = f"/memos/{self.memo.id}/revisions/2/restore/"
+        with patch.object(Memo._meta.get_field("contents"), "max_length", 5):
+            self.assertEqual(self.client.post(url).status_code, 400)
+        with patch("memos.revisions.edit_ops", return_value=[{"op": "delete", "pos": 999, "length": 1}]):
+            self.assertEqual(self.client.post(url).status_code, 409)
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.contents, self.history[-1])
+
+    def test_other_user_cannot_read(self):
+        other = User.objects.create_user(username="other", email="other@test.com")
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(f"/memos/{self.memo.id}/revisions/").status_code, 403)
+        self.assertEqual(self.client.get(f"/memos/{self.memo.id}/revisions/1/").status_code, 403)
@@ -3,5 +3,12 @@ from .views import *
 
 urlpatterns = [
     path('', UserMemoListView.as_view()),
+    path('search/', MemoSearchView.as_view()),
+    path('calendar/', MemoCalendarView.as_view()),
+    path('import/', MemoImportView.as_view()),
+    path('export/', MemoExportView.as_view()),
     path('<int:memo_id>/', UserMemoDetailView.as_view()),
+    path('<int:memo_id>/revisions/', MemoRevisionListView.as_view()),
+    path('<int:memo_id>/revisions/<int:number>/', MemoRevisionDetailView.as_view()),
+    path('<int:memo_id>/revisions/<int:number>/restore/', MemoRevisionRestoreView.as_view()),
 ]
\ No newline at end of file
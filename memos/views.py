@@ -1,15 +1,36 @@
 from django.shortcuts import render
-from .models import Memo
+from django.core.exceptions import ValidationError
+from django.http import Http404, StreamingHttpResponse
+from django.utils.http import parse_etags
+from .models import Memo, MemoChanged, MemoRevision
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404 
-from .serializers import MemoSerializer
+from .serializers import MemoDeltaSerializer, MemoRevisionSerializer, MemoSerializer, MemoWithTaggingsSerializer
+from .deltas import DeltaError
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from drf_yasg.utils import swagger_auto_schema
-from datetime import datetime
-from portfolios.models import Log
+from drf_yasg.utils import no_body, swagger_auto_schema
+import calendar
+from datetime import datetime, timedelta
+from django.db.models import Count, Prefetch
+from django.db.models.functions import Length
+from django.utils import timezone
+from accounts.models import TeamMember
+from portfolios.models import Log, Project
+from taggings.models import Tagging
+from taggings.registry import tag_styles
 from drf_yasg import openapi
+from config.conditional import conditional_response, list_validators, make_etag, row_validators
+from config.pagination import KeysetPagination
+from .search import search
+from .exports import EXPORT_FORMATS, gzip_chunks
+from .imports import ImportTooLarge, MAX_ROWS as MAX_IMPORT_ROWS, import_memos, iter_json_array, iter_ndjson
+
+class MemoPagination(KeysetPagination):
+    page_size = 50
+    max_page_size = 200
+
 
 class UserMemoListView(APIView):
     permission_classes = [IsAuthenticated]
@@ -74,6 +95,25 @@ class UserMemoListView(APIView):
                 openapi.IN_QUERY,
                 description="날짜(YYYY-MM-DD)",
                 type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="이전 응답의 next_cursor 값",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                'page_size',
+                openapi.IN_QUERY,
+                description="페이지 크기 (기본 50, 최대 200)",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                'expand',
+                openapi.IN_QUERY,
+                description="taggings이면 각 메모에 태깅 목록(태그 스타일 포함)을 함께 반환",
+                type=openapi.TYPE_STRING,
+                enum=["taggings"],
             )
         ],
         responses={
@@ -82,6 +122,8 @@ class UserMemoListView(APIView):
                 schema=openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
+                        "next": openapi.Schema(type=openapi.TYPE_STRING, example="http://localhost:8000/memos/?project_id=7&cursor=WyIyMDI1LTExLTE0VDIzOjQyOjQ5LjI0ODcwNiswOTowMCIsIjkiXQ"),
+                        "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, example="WyIyMDI1LTExLTE0VDIzOjQyOjQ5LjI0ODcwNiswOTowMCIsIjkiXQ"),
                         "results": openapi.Schema(
                             type=openapi.TYPE_ARRAY,
                             items=openapi.Schema(
@@ -100,6 +142,7 @@ class UserMemoListView(APIView):
                     }
                 )
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
             400: openapi.Response(
                 description="잘못된 날짜 형식",
                 schema=openapi.Schema(
@@ -119,7 +162,8 @@ class UserMemoListView(APIView):
         project_id = request.query_params.get("project_id")
         date = request.query_params.get("date")  # "2025-11-12"
 
-        memos = Memo.objects.filter(user=user)
+        # 삭제 표시된 프로젝트의 메모는 제외
+        memos = Memo.objects.filter(user=user, project__deleted_at__isnull=True)
 
         # 프로젝트 기준 필터링
         if project_id:
@@ -133,9 +177,34 @@ class UserMemoListView(APIView):
             except ValueError:
                 return Response({"error": "Invalid date format (YYYY-MM-DD expected)"}, status=status.HTTP_400_BAD_REQUEST)
 
-        memos = memos.order_by("-created_at")
-        serializer = MemoSerializer(memos, many=True, context={"request": request})
-        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+        expand = request.query_params.get("expand")
+        if expand not in (None, "taggings"):
+            return Response({"error": "expand는 taggings만 지원합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # (created_at, id) 기준 커서 페이지네이션 (최신순)
+        paginator = MemoPagination()
+        etag, last_modified = list_validators(memos, *paginator.etag_parts(request))
+        serializer_class = MemoSerializer
+        if expand == "taggings":
+            # 메모마다 태깅 API를 따로 호출하지 않도록 페이지 단위로 한 번에 prefetch
+            # (메모 1번 + 태깅·태그 스타일 JOIN 1번)
+            # 태깅이나 태그 스타일만 바뀌어도 응답이 달라지므로 태깅 검증값과 TagStyle 버전도 함께 반영
+            tagging_etag, tagging_modified = list_validators(
+                Tagging.objects.filter(memo__in=memos.values("id")), tag_styles.version()
+            )
+            etag = make_etag(etag, tagging_etag)
+            last_modified = max(filter(None, [last_modified, tagging_modified]), default=None)
+
+            taggings = Tagging.objects.select_related("tag_style").order_by("offset_start", "id")
+            memos = memos.prefetch_related(Prefetch("taggings", queryset=taggings))
+            serializer_class = MemoWithTaggingsSerializer
+
+        def build():
+            page = paginator.paginate_queryset(memos, request, view=self)
+            serializer = serializer_class(page, many=True, context={"request": request})
+            return paginator.get_paginated_response(serializer.data)
+
+        return conditional_response(request, etag, last_modified, build)
 
 class UserMemoDetailView(APIView):
     permission_classes = [IsAuthenticated]
@@ -163,6 +232,7 @@ class UserMemoDetailView(APIView):
                     }
                 )
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
             403: openapi.Response(
                 description="권한 없음",
                 schema=openapi.Schema(
@@ -193,8 +263,11 @@ class UserMemoDetailView(APIView):
         memo = get_object_or_404(Memo, id=memo_id)
         if request.user != memo.user:
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
-        serializer = MemoSerializer(memo)
-        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+        etag, last_modified = row_validators(memo)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: Response({"results": MemoSerializer(memo).data}, status=status.HTTP_200_OK),
+        )
     
     # 메모 수정
     @swagger_auto_schema(
@@ -253,6 +326,88 @@ class UserMemoDetailView(APIView):
             serializer.save()
             return Response({"results": serializer.data}, status=status.HTTP_200_OK)
         return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    # 메모 부분 수정 (텍스트 델타) + 태깅 오프셋 재계산
+    @swagger_auto_schema(
+        request_body=MemoDeltaSerializer,
+        manual_parameters=[
+            openapi.Parameter(
+                'If-Match',
+                openapi.IN_HEADER,
+                description="마지막으로 받은 ETag. 그 사이 메모가 바뀌었으면 412",
+                type=openapi.TYPE_STRING,
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                description="메모 수정 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                "id": openapi.Schema(type=openapi.TYPE_INTEGER, example=9),
+                                "contents": openapi.Schema(type=openapi.TYPE_STRING, example="수정된 메모 내용입니다."),
+                                "modified_at": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14T23:55:10.123456+09:00"),
+                            }
+                        ),
+                        "taggings": openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                "updated": openapi.Schema(type=openapi.TYPE_INTEGER, example=2),
+                                "deleted": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_INTEGER), example=[31]),
+                            }
+                        ),
+                    }
+                )
+            ),
+            400: openapi.Response(
+                description="잘못된 연산",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "errors": openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            example={"ops": {"1": "pos(40)가 본문 길이(12)를 넘습니다."}}
+                        )
+                    }
+                )
+            ),
+            403: "권한 없음",
+            404: "메모를 찾지 못함",
+            412: "If-Match 불일치 (다른 곳에서 먼저 수정됨)",
+        }
+    )
+    def patch(self, request, memo_id):
+        memo = get_object_or_404(Memo, id=memo_id)
+        if request.user != memo.user:
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = MemoDeltaSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        # If-Match가 있으면 클라이언트가 본 버전 그대로일 때만 적용 (잠근 행으로 비교, 아니면 412)
+        if_match = request.headers.get("If-Match")
+        try:
+            result = memo.apply_delta(
+                serializer.validated_data["ops"], if_match=parse_etags(if_match) if if_match else None
+            )
+        except MemoChanged:
+            return Response(
+                {"detail": "다른 곳에서 먼저 수정된 메모입니다."}, status=status.HTTP_412_PRECONDITION_FAILED
+            )
+        except DeltaError as exc:
+            return Response({"errors": {"ops": {str(exc.index): exc.message}}}, status=status.HTTP_400_BAD_REQUEST)
+        except ValidationError as exc:
+            return Response({"errors": exc.message_dict}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = Response({
+            "results": MemoSerializer(memo).data,
+            "taggings": result,
+        }, status=status.HTTP_200_OK)
+        response["ETag"] = row_validators(memo)[0]
+        return response
     
     # 메모 삭제
     @swagger_auto_schema(
@@ -268,3 +423,429 @@ class UserMemoDetailView(APIView):
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
         memo.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+class MemoSearchView(APIView):
+    permission_classes = [IsAuthenticated]
+    MAX_LIMIT = 50
+
+    # 메모/태깅 전문 검색
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description="검색어 (공백으로 구분된 단어는 모두 포함)", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('project_id', openapi.IN_QUERY, description="프로젝트 ID", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="최대 결과 수 (기본 20, 최대 50)", type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Response(
+                description="검색 성공 (관련도 순, 일치 부분은 <mark>로 표시)",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "type": openapi.Schema(type=openapi.TYPE_STRING, example="tagging"),
+                                    "memo_id": openapi.Schema(type=openapi.TYPE_INTEGER, example=9),
+                                    "tagging_id": openapi.Schema(type=openapi.TYPE_INTEGER, example=31),
+                                    "project_id": openapi.Schema(type=openapi.TYPE_INTEGER, example=7),
+                                    "date": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14"),
+                                    "snippet": openapi.Schema(type=openapi.TYPE_STRING, example="…<mark>회원가입</mark> 예외 처리 누락"),
+                                    "rank": openapi.Schema(type=openapi.TYPE_NUMBER, example=-1.52),
+                                }
+                            )
+                        )
+                    }
+                )
+            ),
+            400: openapi.Response(
+                description="검색어 없음",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={"error": openapi.Schema(type=openapi.TYPE_STRING, example="검색어(q)를 입력해 주세요.")}
+                )
+            ),
+        }
+    )
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response({"error": "검색어(q)를 입력해 주세요."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 20)), self.MAX_LIMIT))
+        except ValueError:
+            limit = 20
+
+        project_id = request.query_params.get("project_id")
+        if project_id and not project_id.isdigit():
+            return Response({"error": "project_id는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = search(request.user, query, project_id, limit)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class MemoCalendarView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 한 달치 일별 메모/태깅 수와 통나무 지급 여부 (캘린더 히트맵용)
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('project_id', openapi.IN_QUERY, description="프로젝트 ID", type=openapi.TYPE_INTEGER, required=True),
+            openapi.Parameter('month', openapi.IN_QUERY, description="조회할 달(YYYY-MM), 기본 이번 달", type=openapi.TYPE_STRING),
+        ],
+        responses={
+            200: openapi.Response(
+                description="캘린더 조회 성공 (해당 달의 모든 날짜 포함)",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "project_id": openapi.Schema(type=openapi.TYPE_INTEGER, example=7),
+                        "month": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11"),
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "date": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14"),
+                                    "memo_count": openapi.Schema(type=openapi.TYPE_INTEGER, example=3),
+                                    "tagging_count": openapi.Schema(type=openapi.TYPE_INTEGER, example=5),
+                                    "daily_complete": openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True),
+                                    "tag_review_complete": openapi.Schema(type=openapi.TYPE_BOOLEAN, example=False),
+                                }
+                            )
+                        )
+                    }
+                )
+            ),
+            400: openapi.Response(
+                description="잘못된 요청",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={"error": openapi.Schema(type=openapi.TYPE_STRING, example="Invalid month format (YYYY-MM expected)")}
+                )
+            ),
+        }
+    )
+    def get(self, request):
+        user = request.user
+        project_id = request.query_params.get("project_id")
+        if not project_id or not project_id.isdigit():
+            return Response({"error": "project_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        month = request.query_params.get("month")
+        if month:
+            try:
+                first_day = datetime.strptime(month, "%Y-%m").date()
+            except ValueError:
+                return Response({"error": "Invalid month format (YYYY-MM expected)"}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            first_day = timezone.localdate().replace(day=1)
+        last_day = first_day.replace(day=calendar.monthrange(first_day.year, first_day.month)[1])
+        date_range = (first_day, last_day)
+
+        # 날짜별 GROUP BY 집계 3번으로 한 달 전체를 계산 (날짜 수와 무관하게 쿼리 수 고정)
+        memo_counts = dict(
+            Memo.objects.filter(
+                user=user, project_id=project_id, project__deleted_at__isnull=True, date__range=date_range,
+            )
+            .values("date")
+            .annotate(count=Count("id"))
+            .values_list("date", "count")
+        )
+        tagging_counts = dict(
+            Tagging.objects.filter(
+                memo__user=user, memo__project_id=project_id,
+                memo__project__deleted_at__isnull=True, memo__date__range=date_range,
+            )
+            .values("memo__date")
+            .annotate(count=Count("id"))
+            .values_list("memo__date", "count")
+        )
+        awarded = set(
+            Log.objects.filter(user=user, project_id=project_id, date__range=date_range)
+            .values_list("date", "reason")
+        )
+
+        results = []
+        day = first_day
+        while day <= last_day:
+            results.append({
+                "date": day.isoformat(),
+                "memo_count": memo_counts.get(day, 0),
+                "tagging_count": tagging_counts.get(day, 0),
+                "daily_complete": (day, "DAILY_COMPLETE") in awarded,
+                "tag_review_complete": (day, "TAG_REVIEW_COMPLETE") in awarded,
+            })
+            day += timedelta(days=1)
+
+        return Response({
+            "project_id": int(project_id),
+            "month": first_day.strftime("%Y-%m"),
+            "results": results,
+        }, status=status.HTTP_200_OK)
+
+
+class MemoImportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+    # 다른 노트 도구에서 옮겨 온 메모 일괄 가져오기
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('project_id', openapi.IN_QUERY, description="프로젝트 ID", type=openapi.TYPE_INTEGER, required=True),
+        ],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            description="JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson, 한 줄에 메모 하나)",
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "date": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14"),
+                    "contents": openapi.Schema(type=openapi.TYPE_STRING, example="옮겨 온 메모입니다."),
+                }
+            )
+        ),
+        responses={
+            201: openapi.Response(
+                description="가져오기 성공 (잘못된 줄은 건너뛰고 errors에 줄 번호와 함께 표시)",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "created": openapi.Schema(type=openapi.TYPE_INTEGER, example=120),
+                        "errors": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                            example=[{"line": 3, "errors": {"date": ["Date has wrong format. Use one of these formats instead: YYYY-MM-DD."]}}]
+                        ),
+                        "log_result": openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                "awarded": openapi.Schema(type=openapi.TYPE_INTEGER, example=2),
+                                "dates": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING), example=["2025-11-03", "2025-11-04"]),
+                            }
+                        ),
+                    }
+                )
+            ),
+            400: "잘못된 요청 (유효한 줄이 없거나 JSON 형식 오류)",
+            403: "프로젝트 팀원이 아님",
+            404: "프로젝트를 찾을 수 없음",
+            413: "한 번에 가져올 수 있는 줄 수 초과",
+            415: "지원하지 않는 Content-Type",
+        }
+    )
+    def post(self, request):
+        project_id = request.query_params.get("project_id")
+        if not project_id or not project_id.isdigit():
+            return Response({"error": "project_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+        project = get_object_or_404(Project, id=project_id)
+        if not TeamMember.objects.filter(user=request.user, project=project).exists():
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+
+        # request.data로 본문 전체를 파싱하지 않고 원본 스트림을 직접 읽음
+        stream = request._request
+        if request.content_type.startswith(self.NDJSON_CONTENT_TYPES):
+            rows = iter_ndjson(stream)
+        elif request.content_type.startswith("application/json"):
+            rows = iter_json_array(stream)
+        else:
+            return Response({"error": "application/json 또는 application/x-ndjson만 지원합니다."}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+        try:
+            result = import_memos(request.user, project, rows)
+        except ValueError:
+            return Response({"error": "JSON 배열 형식이 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+        except ImportTooLarge:
+            return Response({"error": f"한 번에 최대 {MAX_IMPORT_ROWS}개까지 가져올 수 있습니다."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        if not result["created"]:
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
+class MemoExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 프로젝트 전체 메모/태깅 내보내기 (백업·분석용, 스트리밍)
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('project_id', openapi.IN_QUERY, description="프로젝트 ID", type=openapi.TYPE_INTEGER, required=True),
+            openapi.Parameter('output', openapi.IN_QUERY, description="ndjson(기본, 메모 한 줄에 태깅 포함) 또는 csv(태깅 한 줄)", type=openapi.TYPE_STRING, enum=["ndjson", "csv"]),
+            openapi.Parameter('gzip', openapi.IN_QUERY, description="1이면 gzip으로 압축", type=openapi.TYPE_BOOLEAN),
+        ],
+        responses={
+            200: "파일 스트림 (Content-Disposition: attachment)",
+            400: "잘못된 요청",
+            403: "프로젝트 팀원이 아님",
+            404: "프로젝트를 찾을 수 없음",
+        }
+    )
+    def get(self, request):
+        project_id = request.query_params.get("project_id")
+        if not project_id or not project_id.isdigit():
+            return Response({"error": "project_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            return Response({"error": "output은 ndjson 또는 csv여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        project = get_object_or_404(Project, id=project_id)
+        if not TeamMember.objects.filter(user=request.user, project=project).exists():
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+
+        make_chunks, content_type, extension = EXPORT_FORMATS[output]
+        chunks = make_chunks(project)
+        filename = f"project-{project.id}-memos.{extension}"
+        if request.query_params.get("gzip") in ("1", "true"):
+            chunks = gzip_chunks(chunks)
+            content_type = "application/gzip"
+            filename += ".gz"
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class MemoRevisionPagination(KeysetPagination):
+    ordering = ("-number",)
+    page_size = 50
+    max_page_size = 200
+
+
+def get_own_memo(request, memo_id):
+    memo = get_object_or_404(Memo, id=memo_id)
+    if request.user != memo.user:
+        return None
+    return memo
+
+
+class MemoRevisionListView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 메모 리비전 목록 (본문 없이 메타데이터만, 최신순)
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="이전 응답의 next_cursor 값", type=openapi.TYPE_STRING),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기 (기본 50, 최대 200)", type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Response(
+                description="리비전 목록 조회 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "next": openapi.Schema(type=openapi.TYPE_STRING, example=None),
+                        "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, example=None),
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "number": openapi.Schema(type=openapi.TYPE_INTEGER, example=12),
+                                    "is_snapshot": openapi.Schema(type=openapi.TYPE_BOOLEAN, example=False),
+                                    "length": openapi.Schema(type=openapi.TYPE_INTEGER, example=134),
+                                    "size": openapi.Schema(type=openapi.TYPE_INTEGER, example=21),
+                                    "created_at": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14T23:42:49.248706+09:00"),
+                                }
+                            )
+                        ),
+                    }
+                )
+            ),
+            403: "권한 없음",
+            404: "메모를 찾지 못함",
+        }
+    )
+    def get(self, request, memo_id):
+        memo = get_own_memo(request, memo_id)
+        if memo is None:
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+
+        revisions = memo.revisions.defer("data").annotate(size=Length("data"))
+        paginator = MemoRevisionPagination()
+        page = paginator.paginate_queryset(revisions, request, view=self)
+        return paginator.get_paginated_response(MemoRevisionSerializer(page, many=True).data)
+
+
+class MemoRevisionDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 특정 리비전의 본문 복원 조회
+    @swagger_auto_schema(
+        responses={
+            200: openapi.Response(
+                description="리비전 조회 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                "number": openapi.Schema(type=openapi.TYPE_INTEGER, example=12),
+                                "contents": openapi.Schema(type=openapi.TYPE_STRING, example="예전 메모 내용입니다."),
+                            }
+                        )
+                    }
+                )
+            ),
+            403: "권한 없음",
+            404: "메모 또는 리비전을 찾지 못함",
+        }
+    )
+    def get(self, request, memo_id, number):
+        memo = get_own_memo(request, memo_id)
+        if memo is None:
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            contents = MemoRevision.reconstruct(memo, number)
+        except MemoRevision.DoesNotExist:
+            raise Http404
+        return Response({"results": {"number": number, "contents": contents}}, status=status.HTTP_200_OK)
+
+
+class MemoRevisionRestoreView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 특정 리비전으로 되돌리기 (새 리비전으로 기록되며, 태깅 오프셋도 함께 옮김)
+    @swagger_auto_schema(
+        request_body=no_body,
+        responses={
+            200: openapi.Response(
+                description="되돌리기 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                            "id": openapi.Schema(type=openapi.TYPE_INTEGER, example=9),
+                            "contents": openapi.Schema(type=openapi.TYPE_STRING, example="예전 메모 내용입니다."),
+                        }),
+                        "taggings": openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                            "updated": openapi.Schema(type=openapi.TYPE_INTEGER, example=1),
+                            "deleted": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_INTEGER), example=[]),
+                        }),
+                    }
+                )
+            ),
+            400: "복원할 본문이 메모 최대 길이를 넘음",
+            403: "권한 없음",
+            404: "메모 또는 리비전을 찾지 못함",
+            409: "복원 델타를 현재 본문에 적용하지 못함",
+        }
+    )
+    def post(self, request, memo_id, number):
+        memo = get_own_memo(request, memo_id)
+        if memo is None:
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            contents = MemoRevision.reconstruct(memo, number)
+        except MemoRevision.DoesNotExist:
+            raise Http404
+
+        # 본문을 통째로 덮어쓰지 않고, 잠근 행의 현재 본문과의 차이를 델타로 적용해 기존 태깅 위치를 보존
+        try:
+            result = memo.restore_to(contents)
+        except DeltaError as exc:
+            return Response({"errors": {"ops": {str(exc.index): exc.message}}}, status=status.HTTP_409_CONFLICT)
+        except ValidationError as exc:
+            return Response({"errors": exc.message_dict}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"results": MemoSerializer(memo).data, "taggings": result}, status=status.HTTP_200_OK)
@@ -1,6 +1,7 @@
 from django.contrib import admin
-from .models import Project, Log, ProjectHouse
+from .models import Project, Log, ProjectHouse, ProjectDailyStats
 
 admin.site.register(Project)
 admin.site.register(Log)
 admin.site.register(ProjectHouse)
+admin.site.register(ProjectDailyStats)
\ No newline at end of file
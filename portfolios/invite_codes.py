@@ -0,0 +1,64 @@
+"""
+프로젝트 초대 코드 생성/검증
+
+초대 코드는 Crockford Base32 문자 8자리(40bit 난수) + 체크 문자 1자리로 구성됩니다.
+체크 문자는 Luhn mod 32 알고리즘으로 계산하며,
+프론트에서도 같은 방식으로 계산해 DB 조회 전에 오타를 걸러낼 수 있습니다.
+생성기는 settings.INVITE_CODE_GENERATOR 로 교체할 수 있습니다.
+"""
+import re
+import secrets
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+BODY_LENGTH = 8
+
+# 헷갈리기 쉬운 문자는 같은 값으로 취급 (Crockford Base32 규칙)
+_CONFUSABLES = str.maketrans({"I": "1", "L": "1", "O": "0"})
+
+# uuid4().hex[:10] 로 만들던 기존 초대 코드
+_LEGACY_PATTERN = re.compile(r"^[0-9a-f]{10}$")
+
+
+def checksum_char(body):
+    # Luhn mod N: 한 글자 오타와 대부분의 인접 문자 뒤바뀜을 검출
+    base = len(ALPHABET)
+    factor = 2
+    total = 0
+    for char in reversed(body):
+        addend = factor * ALPHABET.index(char)
+        total += addend // base + addend % base
+        factor = 1 if factor == 2 else 2
+    return ALPHABET[(base - total % base) % base]
+
+
+def generate_invite_code():
+    body = "".join(secrets.choice(ALPHABET) for _ in range(BODY_LENGTH))
+    return body + checksum_char(body)
+
+
+def normalize_invite_code(raw):
+    """
+    사용자가 입력한 초대 코드를 DB에 저장된 형태로 변환합니다.
+    형식이나 체크 문자가 맞지 않으면 None을 반환합니다.
+    """
+    if not isinstance(raw, str):
+        return None
+    raw = raw.strip()
+    if _LEGACY_PATTERN.match(raw):
+        return raw
+
+    code = raw.replace("-", "").replace(" ", "").upper().translate(_CONFUSABLES)
+    if len(code) != BODY_LENGTH + 1 or any(char not in ALPHABET for char in code):
+        return None
+    if checksum_char(code[:-1]) != code[-1]:
+        return None
+    return code
+
+
+def get_invite_code_generator():
+    path = getattr(settings, "INVITE_CODE_GENERATOR", None)
+    if path:
+        return import_string(path)
+    return generate_invite_code
@@ -0,0 +1,96 @@
+import time
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from portfolios.models import Project
+
+
+def purge_targets():
+    """
+    삭제 표시된 프로젝트에서 지울 하위 테이블과 프로젝트 조건 (FK 참조 순서대로)
+    """
+    return [
+        (apps.get_model("taggings", "Tagging"), "memo__project_id"),
+        (apps.get_model("memos", "MemoRevision"), "memo__project_id"),
+        (apps.get_model("memos", "Memo"), "project_id"),
+        (apps.get_model("portfolios", "Log"), "project_id"),
+        (apps.get_model("portfolios", "ProjectDailyStats"), "project_id"),
+        (apps.get_model("portfolios", "ProjectDailyMember"), "project_id"),
+        (apps.get_model("accounts", "TeamMember"), "project_id"),
+        (apps.get_model("portfolios", "ProjectHouse"), "project_id"),
+        (Project, "id"),
+    ]
+
+
+def delete_batch(model, ids):
+    # ORM delete()의 cascade 수집 없이 id 목록으로 바로 DELETE
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.pk.column)
+    placeholders = ", ".join(["%s"] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", ids)
+
+
+def purge_project(project_id, batch_size, report=None):
+    """
+    프로젝트 하나의 하위 데이터를 batch_size 단위로 삭제하고, 마지막에 프로젝트 행을 삭제합니다.
+    배치마다 트랜잭션을 나누어 쓰기 잠금을 오래 잡지 않습니다.
+    """
+    deleted = {}
+    for model, lookup in purge_targets():
+        manager = Project.all_objects if model is Project else model._default_manager
+        label = model._meta.label
+        deleted[label] = 0
+        while True:
+            ids = list(
+                manager.filter(**{lookup: project_id})
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                delete_batch(model, ids)
+            deleted[label] += len(ids)
+            if report:
+                report(project_id, label, deleted[label])
+    return deleted
+
+
+class Command(BaseCommand):
+    help = "삭제 표시된 프로젝트의 하위 데이터를 배치 단위로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="DELETE 한 번에 지울 행 수 (기본 500)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="배치 사이 대기 시간(초). 다른 요청이 쓰기 잠금을 얻을 틈을 줌",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        def report(project_id, label, count):
+            self.stdout.write(f"[{project_id}] {label}: {count}개 삭제")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        project_ids = list(
+            Project.all_objects.filter(deleted_at__isnull=False)
+            .order_by("deleted_at")
+            .values_list("id", flat=True)
+        )
+        for project_id in project_ids:
+            deleted = purge_project(project_id, batch_size, report)
+            self.stdout.write(self.style.SUCCESS(
+                f"[{project_id}] 삭제 완료 (총 {sum(deleted.values())}행)"
+            ))
+        self.stdout.write(f"{len(project_ids)}개 프로젝트 정리 완료")
@@ -0,0 +1,139 @@
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Count, Max, Min
+
+# spawn으로 띄운 워커는 django.setup() 전에 이 모듈을 import 하므로 모델은 함수 안에서 apps.get_model로 가져옴
+
+
+def recompute_range(start_id, end_id, chunk_size):
+    """
+    project_id가 [start_id, end_id] 범위인 통나무집을 다시 계산하고 갱신한 개수를 반환합니다.
+    chunk마다 한 트랜잭션에서 통나무집 행을 잠근 뒤 통나무 수와 팀원 수를 GROUP BY 쿼리 두 번으로 집계하므로,
+    집계와 저장 사이에 지급된 통나무가 덮어써지지 않습니다. (reconcile_houses와 같은 방식)
+    """
+    ProjectHouse = apps.get_model('portfolios', 'ProjectHouse')
+
+    houses = (
+        ProjectHouse.objects.filter(project__id__range=(start_id, end_id))
+        .select_related("project")
+        .only("id", "project_id", "difficulty_ratio", "project__date_start", "project__date_end")
+        .order_by("project_id")
+    )
+
+    # 읽기 커서를 열어둔 채로 쓰면 SQLite에서 프로세스 간 잠금이 꼬이므로
+    # project_id 기준으로 chunk 단위로 읽고, 다 읽은 뒤에 저장
+    updated = 0
+    last_id = start_id - 1
+    while True:
+        with transaction.atomic():
+            # 재계산 중에 통나무가 지급되거나 팀원이 바뀌지 않도록 행 잠금
+            batch = list(houses.select_for_update().filter(project__id__gt=last_id)[:chunk_size])
+            if not batch:
+                break
+            _recompute_batch(batch)
+        # 공유 캐시(settings.CACHES)이므로 워커 프로세스에서 지워도 웹 워커들에 반영됨
+        cache.delete_many([ProjectHouse.cache_key(house.project_id) for house in batch])
+        updated += len(batch)
+        last_id = batch[-1].project_id
+    return updated
+
+
+def _recompute_batch(batch):
+    TeamMember = apps.get_model('accounts', 'TeamMember')
+    Log = apps.get_model('portfolios', 'Log')
+    ProjectHouse = apps.get_model('portfolios', 'ProjectHouse')
+
+    project_range = (batch[0].project_id, batch[-1].project_id)
+    log_counts = dict(
+        Log.objects.filter(project__id__range=project_range)
+        .values("project")
+        .annotate(total=Count("id"))
+        .values_list("project", "total")
+    )
+    member_counts = dict(
+        TeamMember.objects.filter(project__id__range=project_range)
+        .values("project")
+        .annotate(total=Count("id"))
+        .values_list("project", "total")
+    )
+    for house in batch:
+        house.current_logs = log_counts.get(house.project_id, 0)
+        house.total_required_logs = house.calculate_required_logs(
+            member_count=member_counts.get(house.project_id, 0)
+        )
+    ProjectHouse.objects.bulk_update(batch, ["current_logs", "total_required_logs"])
+
+
+def _init_worker():
+    # spawn된 프로세스는 부모의 환경변수(DJANGO_SETTINGS_MODULE)만 물려받으므로 Django를 새로 초기화
+    django.setup()
+
+
+def _recompute_in_worker(start_id, end_id, chunk_size):
+    return recompute_range(start_id, end_id, chunk_size)
+
+
+class Command(BaseCommand):
+    help = "모든 통나무집의 current_logs, total_required_logs를 일괄 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="bulk_update 한 번에 저장할 통나무집 수 (기본 500)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="project id 범위를 나누어 처리할 프로세스 수 (기본 1)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        workers = options["workers"]
+        if chunk_size < 1 or workers < 1:
+            raise CommandError("--chunk-size와 --workers는 1 이상이어야 합니다.")
+
+        ProjectHouse = apps.get_model('portfolios', 'ProjectHouse')
+        bounds = ProjectHouse.objects.aggregate(low=Min("project_id"), high=Max("project_id"))
+        if bounds["low"] is None:
+            self.stdout.write("재계산할 통나무집이 없습니다.")
+            return
+
+        started = time.perf_counter()
+        if workers == 1:
+            updated = recompute_range(bounds["low"], bounds["high"], chunk_size)
+        else:
+            # project id 범위를 workers개의 구간으로 균등 분할
+            step = (bounds["high"] - bounds["low"]) // workers + 1
+            ranges = [
+                (start, min(start + step - 1, bounds["high"]))
+                for start in range(bounds["low"], bounds["high"] + 1, step)
+            ]
+            # fork는 Windows에 없고 macOS에서는 안전하지 않으므로 모든 OS에서 동작하는 spawn 사용
+            # (워커는 각자 새 DB 연결을 엶)
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            ) as executor:
+                futures = [
+                    executor.submit(_recompute_in_worker, start, end, chunk_size)
+                    for start, end in ranges
+                ]
+                updated = sum(future.result() for future in futures)
+        elapsed = time.perf_counter() - started
+
+        rate = updated / elapsed if elapsed else float(updated)
+        self.stdout.write(self.style.SUCCESS(
+            f"{updated}개 통나무집 재계산 완료 ({elapsed:.2f}s, {rate:.1f} projects/sec)"
+        ))
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from portfolios.models import Project, ProjectHouse
+
+
+class Command(BaseCommand):
+    help = "팀원 수와 통나무집 카운터(current_logs, total_required_logs)를 실제 데이터와 비교하여 오차를 보정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            dest="project_id",
+            help="특정 프로젝트 id만 보정",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="보정하지 않고 오차만 출력",
+        )
+
+    def handle(self, *args, **options):
+        houses = ProjectHouse.objects.order_by("id")
+        if options["project_id"]:
+            houses = houses.filter(project_id=options["project_id"])
+
+        fixed = 0
+        for house_id in list(houses.values_list("id", flat=True)):
+            with transaction.atomic():
+                # 보정 중에 통나무가 지급되지 않도록 행 잠금
+                locked = (
+                    ProjectHouse.objects.select_for_update()
+                    .select_related("project")
+                    .get(pk=house_id)
+                )
+                project = locked.project
+                before = (project.member_count, locked.current_logs, locked.total_required_logs)
+                project.member_count = project.teammember_set.count()
+                locked.current_logs = project.log_set.count()
+                locked.total_required_logs = locked.calculate_required_logs()
+                after = (project.member_count, locked.current_logs, locked.total_required_logs)
+
+                if before == after:
+                    continue
+
+                fixed += 1
+                self.stdout.write(
+                    f"[{locked.project_id}] member_count {before[0]} -> {after[0]}, "
+                    f"current_logs {before[1]} -> {after[1]}, "
+                    f"total_required_logs {before[2]} -> {after[2]}"
+                )
+                if not options["dry_run"]:
+                    Project.all_objects.filter(pk=project.pk).update(member_count=project.member_count)
+                    locked.save(update_fields=["current_logs", "total_required_logs"])
+                    ProjectHouse.invalidate_cache(locked.project_id)
+
+        verb = "발견" if options["dry_run"] else "보정"
+        self.stdout.write(self.style.SUCCESS(f"오차 {verb}: {fixed}개 통나무집"))
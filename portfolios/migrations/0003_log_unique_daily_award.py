@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:26
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_logs(apps, schema_editor):
+    # 동시 요청으로 중복 지급된 통나무를 하나만 남기고 삭제
+    Log = apps.get_model('portfolios', 'Log')
+    duplicates = (
+        Log.objects.values('user', 'project', 'reason', 'date')
+        .annotate(keep_id=Min('id'), total=models.Count('id'))
+        .filter(total__gt=1)
+    )
+    for row in list(duplicates):
+        Log.objects.filter(
+            user=row['user'],
+            project=row['project'],
+            reason=row['reason'],
+            date=row['date'],
+        ).exclude(id=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolios', '0002_alter_log_unique_together_alter_project_project_name_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_logs, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='log',
+            name='portfolios__user_id_6b397f_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='log',
+            constraint=models.UniqueConstraint(fields=('user', 'project', 'reason', 'date'), name='unique_log_per_user_project_reason_date'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_daily_stats(apps, schema_editor):
+    # 기존 통나무 기록을 날짜별로 집계하여 채워 넣음
+    Log = apps.get_model('portfolios', 'Log')
+    ProjectDailyStats = apps.get_model('portfolios', 'ProjectDailyStats')
+    rows = (
+        Log.objects.values('project', 'date')
+        .annotate(
+            daily_complete_count=Count('id', filter=Q(reason='DAILY_COMPLETE')),
+            tag_review_count=Count('id', filter=Q(reason='TAG_REVIEW_COMPLETE')),
+            active_members=Count('user', distinct=True),
+        )
+        .order_by()
+    )
+    ProjectDailyStats.objects.bulk_create(
+        [
+            ProjectDailyStats(
+                project_id=row['project'],
+                date=row['date'],
+                daily_complete_count=row['daily_complete_count'],
+                tag_review_count=row['tag_review_count'],
+                active_members=row['active_members'],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolios', '0003_log_unique_daily_award'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('daily_complete_count', models.PositiveIntegerField(default=0)),
+                ('tag_review_count', models.PositiveIntegerField(default=0)),
+                ('active_members', models.PositiveIntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='portfolios.project')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('project', 'date'), name='unique_daily_stats_per_project_date')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:29
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_member_count(apps, schema_editor):
+    # 기존 프로젝트의 팀원 수를 채워 넣음
+    Project = apps.get_model('portfolios', 'Project')
+    TeamMember = apps.get_model('accounts', 'TeamMember')
+    counts = (
+        TeamMember.objects.values('project')
+        .annotate(total=Count('id'))
+        .values_list('project', 'total')
+    )
+    for project_id, total in counts:
+        Project.objects.filter(pk=project_id).update(member_count=total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolios', '0004_projectdailystats'),
+        ('accounts', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='member_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_member_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolios', '0006_project_deleted_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
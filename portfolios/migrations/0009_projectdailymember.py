@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_daily_members(apps, schema_editor):
+    # 기존 통나무에서 (프로젝트, 유저, 날짜)별 활동 기록을 채움
+    Log = apps.get_model("portfolios", "Log")
+    ProjectDailyMember = apps.get_model("portfolios", "ProjectDailyMember")
+    rows = Log.objects.values_list("project_id", "user_id", "date").distinct().iterator(chunk_size=2000)
+    ProjectDailyMember.objects.bulk_create(
+        (ProjectDailyMember(project_id=project_id, user_id=user_id, date=day) for project_id, user_id, day in rows),
+        batch_size=2000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolios', '0008_create_cache_table'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDailyMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_members', to='portfolios.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('project', 'user', 'date'), name='unique_daily_member_per_project_date')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_members, migrations.RunPython.noop),
+    ]
@@ -1,19 +1,56 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import ExpressionWrapper, F, OuterRef, Subquery
+from django.db.models.functions import Cast, Floor
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db import IntegrityError
-from django.apps import apps
-import pytz
-from datetime import datetime, time, timezone as dt_timezone
+from django.core.cache import cache
+
+# 삭제 표시(deleted_at)된 프로젝트는 기본 조회에서 제외
+class ActiveProjectManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
 
 class Project(models.Model):
+    MAX_MEMBERS = 6
+
     project_name = models.CharField(max_length=10)
     date_start = models.DateField()
     date_end = models.DateField()
     owner = models.ForeignKey('accounts.User', on_delete=models.CASCADE)
     invite_code = models.CharField(max_length=20, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    modified_at = models.DateTimeField(auto_now=True)
+    # 팀원 수 (TeamMember 추가/삭제 시 조건부 UPDATE로 함께 변경)
+    member_count = models.PositiveSmallIntegerField(default=0)
+    # 삭제 요청 시각 (하위 데이터는 purge_deleted_projects 커맨드가 나누어 삭제)
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = ActiveProjectManager()
+    all_objects = models.Manager()
+
+    CACHE_TIMEOUT = 60 * 60
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 불러온 시점의 기간을 기억해두고, 저장 시 기간이 바뀌었는지 비교
+        instance._loaded_dates = (
+            instance.__dict__.get("date_start"),
+            instance.__dict__.get("date_end"),
+        )
+        return instance
+
+    @staticmethod
+    def cache_key(project_id):
+        return f"project_detail:{project_id}"
+
+    def invalidate_cache(self):
+        # 대시보드의 프로젝트 섹션 캐시 (커밋된 뒤에 지워야 다른 요청이 이전 값을 다시 캐싱하지 않음)
+        key = self.cache_key(self.pk)
+        transaction.on_commit(lambda: cache.delete(key))
+
     def project_duration(self):
         return (self.date_end - self.date_start).days + 1
 
@@ -28,8 +65,46 @@ class Project(models.Model):
     
     def save(self, *args, **kwargs):
         # full_clean()으로 clean() 포함 모든 validator 실행
-        self.full_clean()
+        # invite_code 중복은 unique 인덱스가 보장하므로 사전 조회(validate_unique)는 생략
+        self.full_clean(validate_unique=False)
+        adding = self._state.adding
+        dates_changed = getattr(self, "_loaded_dates", None) != (self.date_start, self.date_end)
+        if not adding and kwargs.get("update_fields") is None:
+            # member_count, deleted_at은 전용 UPDATE로만 변경 (오래된 값으로 덮어쓰지 않도록)
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ("member_count", "deleted_at")
+            ]
         super().save(*args, **kwargs)
+        self._loaded_dates = (self.date_start, self.date_end)
+
+        if adding:
+            return
+
+        self.invalidate_cache()
+
+        # 기존 프로젝트의 기간이 바뀐 경우에만 통나무집 목표치 재계산
+        if dates_changed:
+            ProjectHouse.refresh_required_logs(self)
+        # 프로젝트 이름도 통나무집 응답에 포함되므로 캐시 무효화
+        ProjectHouse.invalidate_cache(self.pk)
+
+    def delete(self, *args, **kwargs):
+        project_id = self.pk
+        self.invalidate_cache()
+        result = super().delete(*args, **kwargs)
+        ProjectHouse.invalidate_cache(project_id)
+        return result
+
+    def mark_deleted(self):
+        """
+        프로젝트를 즉시 삭제된 것으로 표시합니다.
+        연관된 메모, 태깅, 통나무 등은 purge_deleted_projects 커맨드가 나누어 삭제합니다.
+        """
+        self.deleted_at = timezone.now()
+        Project.all_objects.filter(pk=self.pk).update(deleted_at=self.deleted_at)
+        self.invalidate_cache()
+        ProjectHouse.invalidate_cache(self.pk)
 
     def __str__(self):
         return self.project_name
@@ -47,48 +122,82 @@ class Log(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        indexes = [
-            models.Index(fields=["user", "project", "reason", "created_at"])
+        constraints = [
+            # 같은 날 같은 사유로는 통나무 1개만 지급 (동시 요청에도 DB가 보장)
+            models.UniqueConstraint(
+                fields=["user", "project", "reason", "date"],
+                name="unique_log_per_user_project_reason_date",
+            ),
         ]
 
     # 하루 최대 2개 통나무 지급 함수
     @classmethod
     def give_log(cls, user, project, reason):
-        kr_tz = pytz.timezone("Asia/Seoul")
-        now_kr = timezone.now().astimezone(kr_tz)
-        today_kr = now_kr.date()
-
         valid_reasons = dict(cls.REASONS).keys()
         if reason not in valid_reasons:
             raise ValueError("잘못된 통나무 지급 사유입니다.")
 
-        # 한국 시간 기준 하루 구간
-        start_kr = kr_tz.localize(datetime.combine(today_kr, time.min))
-        end_kr = kr_tz.localize(datetime.combine(today_kr, time.max))
+        # TIME_ZONE(Asia/Seoul) 기준 오늘 날짜
+        today_kr = timezone.localdate()
 
-        # created_at(UTC 저장)을 한국 시간 기준으로 비교하기 위해 UTC로 변환
-        already_given = cls.objects.filter(
-            user=user,
-            project=project,
-            reason=reason,
-            created_at__gte=start_kr.astimezone(dt_timezone.utc),
-            created_at__lte=end_kr.astimezone(dt_timezone.utc),
-        ).exists()
-
-        if already_given:
+        # 사전 조회 없이 바로 INSERT 하고, 이미 지급된 경우 unique 제약 위반으로 판단
+        # 통나무 생성과 통나무집 카운터 증가를 하나의 트랜잭션으로 처리
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    user=user,
+                    project=project,
+                    date=today_kr,
+                    reason=reason
+                )
+                ProjectHouse.objects.filter(project=project).update(
+                    current_logs=F("current_logs") + 1
+                )
+                ProjectHouse.invalidate_cache(project.pk)
+                ProjectDailyStats.record_log(user, project, today_kr, reason)
+        except IntegrityError:
             return {"success": False, "message": f"이미 오늘 {reason} 보상을 받았습니다."}
 
-        log = cls.objects.create(
-            user=user,
-            project=project,
-            date=today_kr,
-            reason=reason
+        return {"success": True, "message": f"통나무 지급 성공 ({reason})"}
+
+    @classmethod
+    def give_past_logs(cls, user, project, reason, dates):
+        """
+        여러 날짜의 통나무를 한 번에 지급합니다. (메모 일괄 가져오기용)
+        프로젝트 기간 안이면서 오늘 이전인 날짜 중, 아직 지급되지 않은 날짜에만 지급하고
+        지급한 날짜 목록을 돌려줍니다. 호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+        """
+        last_day = min(project.date_end, timezone.localdate())
+        dates = {day for day in dates if project.date_start <= day <= last_day}
+        if not dates:
+            return []
+
+        existing = set(
+            cls.objects.filter(user=user, project=project, reason=reason, date__in=dates).values_list("date", flat=True)
         )
+        new_dates = sorted(day for day in dates if day not in existing)
+        if not new_dates:
+            return []
 
-        house = ProjectHouse.objects.get(project=project)
-        house.update_progress()
+        # 조회 뒤 동시에 지급된 날짜(give_log 등)는 날짜별 savepoint INSERT의 unique 제약 충돌로 건너뛰고 가져오기는 계속 진행
+        # (ProjectDailyMember.mark_active와 같은 방식으로, INSERT가 성공한 날짜만 이번에 지급한 것으로 셈)
+        awarded = []
+        for day in new_dates:
+            try:
+                with transaction.atomic():
+                    cls.objects.create(user=user, project=project, date=day, reason=reason)
+            except IntegrityError:
+                continue
+            awarded.append(day)
+        if not awarded:
+            return []
 
-        return {"success": True, "message": f"통나무 지급 성공 ({reason})"}
+        ProjectHouse.objects.filter(project=project).update(
+            current_logs=F("current_logs") + len(awarded)
+        )
+        ProjectHouse.invalidate_cache(project.pk)
+        ProjectDailyStats.record_logs(user, project, reason, awarded)
+        return awarded
 
 
 class ProjectHouse(models.Model):
@@ -97,19 +206,143 @@ class ProjectHouse(models.Model):
     total_required_logs = models.PositiveIntegerField(default=0)
     current_logs = models.PositiveIntegerField(default=0)
 
-    def calculate_required_logs(self):
-        TeamMember = apps.get_model('accounts', 'TeamMember')
-        member_count = TeamMember.objects.filter(project=self.project).count()
+    CACHE_TIMEOUT = 60 * 60
+
+    @staticmethod
+    def cache_key(project_id):
+        return f"project_house:{project_id}"
+
+    @staticmethod
+    def contribution_cache_key(project_id):
+        return f"project_contribution:{project_id}"
+
+    @classmethod
+    def invalidate_cache(cls, project_id):
+        # 통나무/팀원/프로젝트 정보가 바뀌면 통나무집과 기여도 캐시를 함께 무효화
+        # 트랜잭션이 커밋된 뒤에 지워야 다른 요청이 이전 값을 다시 캐싱하지 않음
+        keys = [cls.cache_key(project_id), cls.contribution_cache_key(project_id)]
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    def calculate_required_logs(self, member_count=None):
+        # 일괄 재계산 시에는 직접 집계한 팀원 수를 넘겨받음
+        if member_count is None:
+            member_count = self.project.member_count
         duration = self.project.project_duration()
         return int(member_count * duration * 2 * self.difficulty_ratio)
 
+    @classmethod
+    def refresh_required_logs(cls, project):
+        """
+        팀원 수나 프로젝트 기간이 바뀌었을 때만 호출되어 목표 통나무 수를 다시 계산합니다.
+        팀원 수는 DB의 최신 member_count를 서브쿼리로 읽어 UPDATE 한 번으로 처리합니다.
+        """
+        member_count = Subquery(
+            Project.all_objects.filter(pk=OuterRef("project_id")).values("member_count")[:1]
+        )
+        required = ExpressionWrapper(
+            member_count * (project.project_duration() * 2) * F("difficulty_ratio"),
+            output_field=models.FloatField(),
+        )
+        cls.objects.filter(project=project).update(
+            total_required_logs=Cast(Floor(required), models.PositiveIntegerField())
+        )
+        cls.invalidate_cache(project.pk)
+
+    # 전체 재집계 (카운터 오차 보정용)
     def update_progress(self):
         self.current_logs = Log.objects.filter(project=self.project).count()
         self.total_required_logs = self.calculate_required_logs()
         self.save()
+        self.invalidate_cache(self.project_id)
 
     @property
     def progress_percent(self):
         if self.total_required_logs == 0:
             return 0
         return round((self.current_logs / self.total_required_logs) * 100, 1)
+
+
+# 프로젝트별 일일 통나무 집계 (타임라인/차트용, give_log에서 증분 갱신)
+class ProjectDailyStats(models.Model):
+    REASON_FIELDS = {
+        "DAILY_COMPLETE": "daily_complete_count",
+        "TAG_REVIEW_COMPLETE": "tag_review_count",
+    }
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="daily_stats")
+    date = models.DateField()
+    daily_complete_count = models.PositiveIntegerField(default=0)
+    tag_review_count = models.PositiveIntegerField(default=0)
+    active_members = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["project", "date"], name="unique_daily_stats_per_project_date"),
+        ]
+
+    @property
+    def total_logs(self):
+        return self.daily_complete_count + self.tag_review_count
+
+    @classmethod
+    def record_log(cls, user, project, date, reason):
+        """
+        give_log 트랜잭션 안에서 호출되어 해당 날짜의 집계를 1 증가시킵니다.
+        그날 해당 유저의 첫 통나무라면 활동 인원도 함께 증가시킵니다.
+        """
+        cls.objects.bulk_create([cls(project=project, date=date)], ignore_conflicts=True)
+        updates = {cls.REASON_FIELDS[reason]: F(cls.REASON_FIELDS[reason]) + 1}
+        if ProjectDailyMember.mark_active(user, project, date):
+            updates["active_members"] = F("active_members") + 1
+        cls.objects.filter(project=project, date=date).update(**updates)
+
+    @classmethod
+    def record_logs(cls, user, project, reason, dates):
+        """
+        give_past_logs용 일괄 버전. 집계 행 INSERT 1번, UPDATE 최대 2번으로 집계합니다.
+        (활동 인원은 아직 기록되지 않은 날짜만 ProjectDailyMember INSERT 결과로 판단)
+        """
+        cls.objects.bulk_create(
+            [cls(project=project, date=day) for day in dates], ignore_conflicts=True
+        )
+        active = set(
+            ProjectDailyMember.objects.filter(project=project, user=user, date__in=dates).values_list("date", flat=True)
+        )
+        first_log_dates = {
+            day for day in dates
+            if day not in active and ProjectDailyMember.mark_active(user, project, day)
+        }
+        field = cls.REASON_FIELDS[reason]
+        first = [day for day in dates if day in first_log_dates]
+        rest = [day for day in dates if day not in first_log_dates]
+        if first:
+            cls.objects.filter(project=project, date__in=first).update(
+                **{field: F(field) + 1, "active_members": F("active_members") + 1}
+            )
+        if rest:
+            cls.objects.filter(project=project, date__in=rest).update(**{field: F(field) + 1})
+
+
+# 프로젝트별로 그날 통나무를 받은 팀원 (ProjectDailyStats.active_members 집계용)
+class ProjectDailyMember(models.Model):
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="daily_members")
+    user = models.ForeignKey('accounts.User', on_delete=models.CASCADE)
+    date = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["project", "user", "date"], name="unique_daily_member_per_project_date"),
+        ]
+
+    @classmethod
+    def mark_active(cls, user, project, date):
+        """
+        그날 해당 유저의 첫 통나무이면 True를 돌려줍니다.
+        give_log처럼 사전 조회 없이 INSERT 하고 unique 제약 위반 여부로 판단하므로, 동시에 지급되어도 한 요청만 True를 받습니다.
+        """
+        try:
+            with transaction.atomic():
+                cls.objects.create(project=project, user=user, date=date)
+        except IntegrityError:
+            return False
+        return True
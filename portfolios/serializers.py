@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import *
-import uuid  # 초대 코드 생성을 위해 uuid 모듈 추가
+from django.db import IntegrityError, transaction
+from .invite_codes import get_invite_code_generator
 from accounts.models import TeamMember
 
 class ProjectCreateSerializer(serializers.ModelSerializer):
@@ -9,27 +10,27 @@ class ProjectCreateSerializer(serializers.ModelSerializer):
         fields = ['id', 'project_name', 'owner', 'date_start', 'date_end', 'invite_code', 'created_at']
         read_only_fields = ['id', 'owner', 'invite_code']
 
+    # 초대 코드 충돌 시 재시도 횟수 (40bit 난수라 사실상 한 번에 성공)
+    INVITE_CODE_ATTEMPTS = 5
+
     def create(self, validated_data):
         """
         Project 생성 요청 시, 고유한 invite_code를 생성하여 함께 저장합니다.
+        중복 여부는 미리 조회하지 않고 unique 인덱스에 맡기며, 충돌(IntegrityError) 시에만 재시도합니다.
         """
-        
-        # 1. 고유한 초대 코드 생성 (예: uuid4의 앞 10자리)
-        # 10자리로 했지만, models.py의 max_length(20) 안에서 자유롭게 정할 수 있습니다.
-        invite_code = str(uuid.uuid4().hex)[:10]
-        
-        # 2. (낮은 확률이지만) 코드가 중복되지 않는지 확인
-        while Project.objects.filter(invite_code=invite_code).exists():
-            invite_code = str(uuid.uuid4().hex)[:10]
-            
-        # 3. validated_data에 초대 코드와 view에서 받은 owner를 추가하여 Project 객체 생성
+        generate = get_invite_code_generator()
+
         # view의 .save(owner=request.user)에서 넘겨준 owner가 validated_data에 포함되어 있습니다.
-        project = Project.objects.create(
-            **validated_data,
-            invite_code=invite_code
-        )
-        
-        return project
+        for _ in range(self.INVITE_CODE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return Project.objects.create(
+                        **validated_data,
+                        invite_code=generate()
+                    )
+            except IntegrityError:
+                continue
+        raise serializers.ValidationError("초대 코드 생성에 실패했습니다. 다시 시도해 주세요.")
     
 # 프로젝트 조회 및 수정을 위한 시리얼라이져
 class ProjectSerializer(serializers.ModelSerializer):
@@ -64,7 +65,7 @@ class ProjectHouseSerializer(serializers.ModelSerializer):
         ]
 
     def get_member_count(self, obj):
-        return obj.project.teammember_set.count()
+        return obj.project.member_count
 
     def get_duration_days(self, obj):
         return (obj.project.date_end - obj.project.date_start).days + 1
@@ -83,7 +84,11 @@ class ContributionSerializer(serializers.ModelSerializer):
         fields = ["nickname", "role", "total_logs", "max_possible_logs", "contribution_percent"]
 
     def get_total_logs(self, obj):
-        return Log.objects.filter(user=obj.user, project=obj.project).count()
+        # 뷰에서 GROUP BY 한 번으로 집계한 값을 context로 넘겨받음
+        log_counts = self.context.get("log_counts")
+        if log_counts is not None:
+            return log_counts.get(obj.user_id, 0)
+        return Log.objects.filter(user_id=obj.user_id, project_id=obj.project_id).count()
 
     def get_max_possible_logs(self, obj):
         duration = (obj.project.date_end - obj.project.date_start).days + 1
@@ -1,3 +1,726 @@
-from django.test import TestCase
+import threading
+import time
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User, TeamMember
+from memos.models import Memo
+from taggings.models import Tagging, TagStyle
+from .models import Project, ProjectHouse, Log, ProjectDailyStats
+from .management.commands import recompute_houses
+from .invite_codes import generate_invite_code, normalize_invite_code
 
-# Create your tests here.
+
+def create_owner(**fields):
+    return User.objects.create_user(username="owner", email="owner@test.com", **fields)
+
+
+def create_project(owner, **fields):
+    # 테스트 공통 프로젝트 ("테스트", 2025-11-01 ~ 2025-11-10, 초대 코드 code1). 다른 값은 fields로 덮어씀
+    fields = {
+        "project_name": "테스트",
+        "date_start": date(2025, 11, 1),
+        "date_end": date(2025, 11, 10),
+        "invite_code": "code1",
+        **fields,
+    }
+    return Project.objects.create(owner=owner, **fields)
+
+
+TAG_STYLE_COLORS = {"문제": "#FFEC5E", "해결": "#5EC8FF"}
+
+
+def create_tag_style(tag_detail="문제"):
+    return TagStyle.objects.create(tag_detail=tag_detail, tag_color=TAG_STYLE_COLORS[tag_detail])
+
+
+# 쿼리 수를 세는 테스트는 캐시 조회가 DB 쿼리로 섞이지 않도록 메모리 캐시 사용 (운영의 Redis와 같은 조건)
+MEMORY_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class ProjectHouseProgressTest(TestCase):
+    def setUp(self):
+        self.owner = create_owner()
+        self.project = create_project(self.owner)
+        self.house = ProjectHouse.objects.create(project=self.project)
+        TeamMember.objects.create(user=self.owner, project=self.project, role="Admin")
+
+    def test_give_log_increments_counter(self):
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+        Log.give_log(self.owner, self.project, "TAG_REVIEW_COMPLETE")
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.current_logs, 2)
+
+    def test_required_logs_follow_membership_and_dates(self):
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.total_required_logs, int(1 * 10 * 2 * 0.85))
+
+        member = User.objects.create_user(username="member", email="member@test.com")
+        team_member = TeamMember.objects.create(user=member, project=self.project, role="Member")
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.total_required_logs, int(2 * 10 * 2 * 0.85))
+
+        self.project.date_end = date(2025, 11, 20)
+        self.project.save()
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.total_required_logs, int(2 * 20 * 2 * 0.85))
+
+        team_member.delete()
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.total_required_logs, int(1 * 20 * 2 * 0.85))
+
+    def test_member_cap_uses_counter(self):
+        for i in range(Project.MAX_MEMBERS - 1):
+            user = User.objects.create_user(username=f"member{i}", email=f"member{i}@test.com")
+            TeamMember.objects.create(user=user, project=self.project, role="Member")
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, Project.MAX_MEMBERS)
+
+        # 메모리상의 값이 오래되어도 조건부 UPDATE가 7번째 가입을 막음
+        stale_project = Project.objects.get(pk=self.project.pk)
+        stale_project.member_count = 0
+        extra = User.objects.create_user(username="extra", email="extra@test.com")
+        with self.assertRaises(ValidationError):
+            TeamMember.objects.create(user=extra, project=stale_project, role="Member")
+        self.assertEqual(TeamMember.objects.filter(project=self.project).count(), Project.MAX_MEMBERS)
+
+        # QuerySet.delete()와 인스턴스 delete() 모두 팀원 수에 반영
+        self.assertEqual(TeamMember.objects.filter(user__username="member1").delete()[0], 1)
+        TeamMember.objects.get(user__username="member0").delete()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, Project.MAX_MEMBERS - 2)
+
+        # 탈퇴(User 삭제)로 인한 CASCADE 삭제도 반영되어 다시 가입할 수 있음
+        User.objects.get(username="member2").delete()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, Project.MAX_MEMBERS - 3)
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.total_required_logs, int((Project.MAX_MEMBERS - 3) * 10 * 2 * 0.85))
+        TeamMember.objects.create(user=extra, project=self.project, role="Member")
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, Project.MAX_MEMBERS - 2)
+
+    def test_reconcile_fixes_drift(self):
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+        ProjectHouse.objects.filter(pk=self.house.pk).update(current_logs=7, total_required_logs=0)
+
+        Project.objects.filter(pk=self.project.pk).update(member_count=3)
+
+        call_command("reconcile_houses", stdout=StringIO())
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, 1)
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.current_logs, 1)
+        self.assertEqual(self.house.total_required_logs, int(1 * 10 * 2 * 0.85))
+
+    def test_recompute_houses_after_ratio_change(self):
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+        ProjectHouse.objects.filter(pk=self.house.pk).update(difficulty_ratio=0.5, current_logs=0)
+
+        out = StringIO()
+        call_command("recompute_houses", chunk_size=1, stdout=out)
+
+        self.house.refresh_from_db()
+        self.assertEqual(self.house.current_logs, 1)
+        self.assertEqual(self.house.total_required_logs, int(1 * 10 * 2 * 0.5))
+        self.assertIn("projects/sec", out.getvalue())
+
+    def test_recompute_houses_counts_logs_per_chunk(self):
+        other = create_project(self.owner, invite_code="code2")
+        other_house = ProjectHouse.objects.create(project=other)
+        recompute_batch = recompute_houses._recompute_batch
+
+        def give_log_between_chunks(batch):
+            # 첫 chunk를 처리한 뒤, 다음 chunk가 잠기기 전에 다른 프로젝트에 통나무가 지급된 상황
+            recompute_batch(batch)
+            if batch[0].project_id == self.project.id:
+                Log.give_log(self.owner, other, "DAILY_COMPLETE")
+
+        with patch.object(recompute_houses, "_recompute_batch", side_effect=give_log_between_chunks):
+            call_command("recompute_houses", chunk_size=1, stdout=StringIO())
+
+        other_house.refresh_from_db()
+        self.assertEqual(other_house.current_logs, 1)
+
+
+class SharedCacheConfigTest(TestCase):
+    def test_default_cache_is_shared_between_workers(self):
+        # 통나무집 캐시 무효화가 다른 워커에도 전달되려면 프로세스 로컬 캐시이면 안 됨
+        self.assertNotIsInstance(caches["default"], LocMemCache)
+        cache.set("shared-cache-test", 1)
+        self.assertEqual(cache.get("shared-cache-test"), 1)
+
+
+@override_settings(CACHES=MEMORY_CACHES)
+class ProjectHouseViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_owner()
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.objects.create(user=self.owner, project=self.project, role="Admin")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = f"/projects/{self.project.id}/house/"
+
+    def test_get_is_cached(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["member_count"], 1)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_log_award_invalidates_cache(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["current_logs"], 1)
+
+
+class ProjectHouseDefaultCacheTest(TestCase):
+    # 설정의 기본 캐시 그대로 사용 (REDIS_URL이 없으면 DB 캐시 테이블)
+    def setUp(self):
+        self.owner = create_owner()
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.objects.create(user=self.owner, project=self.project, role="Admin")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = f"/projects/{self.project.id}/house/"
+
+    def test_get_does_not_write(self):
+        for _ in range(2):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            writes = [query["sql"] for query in queries if not query["sql"].startswith("SELECT")]
+            self.assertEqual(writes, [])
+        self.assertEqual(response.data["member_count"], 1)
+
+
+@override_settings(CACHES=MEMORY_CACHES)
+class ContributionViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_owner(nickname="owner")
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.objects.create(user=self.owner, project=self.project, role="Admin")
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = f"/projects/{self.project.id}/house/contribution/"
+
+    def add_member(self, name):
+        user = User.objects.create_user(username=name, email=f"{name}@test.com", nickname=name)
+        with self.captureOnCommitCallbacks(execute=True):
+            TeamMember.objects.create(user=user, project=self.project, role="Member")
+            Log.give_log(user, self.project, "DAILY_COMPLETE")
+            Log.give_log(user, self.project, "TAG_REVIEW_COMPLETE")
+
+    def test_query_count_is_constant(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 1)
+
+        # 캐시된 경우 프로젝트 조회만 실행
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        for i in range(4):
+            self.add_member(f"member{i}")
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 5)
+
+    def test_totals_per_member(self):
+        self.add_member("member")
+        response = self.client.get(self.url)
+        totals = {row["nickname"]: row["total_logs"] for row in response.data}
+        self.assertEqual(totals, {"owner": 1, "member": 2})
+        self.assertEqual(response.data[0]["contribution_percent"], 5.0)
+
+
+class GiveLogConcurrencyTest(TransactionTestCase):
+    def setUp(self):
+        self.owner = create_owner()
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+
+    # 잠금 재시도 상한 (0.01초 간격, 약 5초)
+    MAX_RETRIES = 500
+
+    def test_parallel_awards_create_one_row_per_day(self):
+        barrier = threading.Barrier(8)
+        results = []
+        errors = []
+
+        def award(reason):
+            try:
+                barrier.wait(timeout=10)
+                # 테스트용 공유 메모리 SQLite는 busy timeout 없이 바로 잠금 에러를 내므로 재시도
+                for _ in range(self.MAX_RETRIES):
+                    try:
+                        results.append(Log.give_log(self.owner, self.project, reason)["success"])
+                        break
+                    except OperationalError:
+                        time.sleep(0.01)
+                else:
+                    errors.append(f"{reason}: 잠금이 풀리지 않음")
+            except Exception as e:
+                errors.append(f"{reason}: {e!r}")
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=award, args=(reason,))
+            for reason in ["DAILY_COMPLETE", "TAG_REVIEW_COMPLETE"] * 4
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads), "스레드가 끝나지 않음")
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 8)
+        self.assertEqual(results.count(True), 2)
+        self.assertEqual(Log.objects.filter(reason="DAILY_COMPLETE").count(), 1)
+        self.assertEqual(Log.objects.filter(reason="TAG_REVIEW_COMPLETE").count(), 1)
+        self.assertEqual(ProjectHouse.objects.get(project=self.project).current_logs, 2)
+        # 두 사유가 동시에 지급되어도 그날 활동 인원은 한 번만 증가
+        stats = ProjectDailyStats.objects.get(project=self.project)
+        self.assertEqual((stats.daily_complete_count, stats.tag_review_count, stats.active_members), (1, 1, 1))
+
+
+class ProjectTimelineTest(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.owner = create_owner()
+        self.member = User.objects.create_user(username="member", email="member@test.com")
+        self.project = create_project(self.owner, date_start=self.today - timedelta(days=2), date_end=self.today + timedelta(days=1))
+        ProjectHouse.objects.create(project=self.project)
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_give_log_updates_daily_stats(self):
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+        Log.give_log(self.owner, self.project, "TAG_REVIEW_COMPLETE")
+        Log.give_log(self.member, self.project, "DAILY_COMPLETE")
+        Log.give_log(self.member, self.project, "DAILY_COMPLETE")
+
+        stats = ProjectDailyStats.objects.get(project=self.project, date=self.today)
+        self.assertEqual(stats.daily_complete_count, 2)
+        self.assertEqual(stats.tag_review_count, 1)
+        self.assertEqual(stats.active_members, 2)
+
+    def test_timeline_is_dense(self):
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+        ProjectDailyStats.objects.create(
+            project=self.project, date=self.today - timedelta(days=2),
+            daily_complete_count=1, tag_review_count=1, active_members=1,
+        )
+
+        response = self.client.get(f"/projects/{self.project.id}/house/timeline/")
+
+        results = response.data["results"]
+        self.assertEqual(len(results), 4)
+        self.assertEqual([row["total_logs"] for row in results], [2, 0, 1, 0])
+        self.assertEqual(results[-1]["cumulative_logs"], 3)
+
+
+def colliding_invite_code():
+    # 첫 호출은 이미 존재하는 코드, 이후에는 정상 코드를 반환
+    colliding_invite_code.calls += 1
+    if colliding_invite_code.calls == 1:
+        return "TAKEN0000"
+    return generate_invite_code()
+
+
+class InviteCodeTest(TestCase):
+    def setUp(self):
+        self.owner = create_owner()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_generated_codes_validate(self):
+        code = generate_invite_code()
+        self.assertEqual(normalize_invite_code(code.lower()), code)
+        self.assertEqual(normalize_invite_code(f"{code[:4]}-{code[4:]}"), code)
+
+        for index in range(len(code)):
+            for char in "0123456789ABCDEFGHJKMNPQRSTVWXYZ":
+                if char == code[index]:
+                    continue
+                typo = code[:index] + char + code[index + 1:]
+                self.assertIsNone(normalize_invite_code(typo))
+
+    def test_legacy_hex_codes_still_accepted(self):
+        self.assertEqual(normalize_invite_code("a94bf2e13c"), "a94bf2e13c")
+
+    @override_settings(INVITE_CODE_GENERATOR="portfolios.tests.colliding_invite_code")
+    def test_create_retries_on_collision(self):
+        Project.objects.create(
+            project_name="기존",
+            date_start=date(2025, 11, 1),
+            date_end=date(2025, 11, 10),
+            owner=self.owner,
+            invite_code="TAKEN0000",
+        )
+        colliding_invite_code.calls = 0
+
+        response = self.client.post("/projects/", {
+            "project_name": "새 프로젝트",
+            "date_start": "2025-11-01",
+            "date_end": "2025-11-10",
+        })
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(colliding_invite_code.calls, 2)
+        self.assertIsNotNone(normalize_invite_code(response.data["invite_code"]))
+
+    def test_create_rolls_back_when_admin_join_fails(self):
+        with patch.object(TeamMember, "join", side_effect=ValidationError("실패")):
+            response = self.client.post("/projects/", {
+                "project_name": "새 프로젝트",
+                "date_start": "2025-11-01",
+                "date_end": "2025-11-10",
+            })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Project.all_objects.exists())
+        self.assertFalse(ProjectHouse.objects.exists())
+
+    def test_join_rejects_typo_without_query(self):
+        with self.assertNumQueries(0):
+            response = self.client.post("/projects/invite/", {"invite_code": "NOTACODE!"})
+        self.assertEqual(response.status_code, 400)
+
+
+class InviteJoinTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_owner()
+        self.member = User.objects.create_user(username="member", email="member@test.com")
+        self.project = create_project(self.owner, invite_code=generate_invite_code())
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.owner, self.project, role="Admin")
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def join(self):
+        return self.client.post("/projects/invite/", {"invite_code": self.project.invite_code})
+
+    def test_join_query_count(self):
+        # 조회·중복 확인·인원 제한 INSERT는 3개 이내 (프로젝트 조회, 인원 제한 UPDATE, INSERT — 중복 확인은 unique 제약이 대신함)
+        # 같은 트랜잭션에서 다른 테이블인 통나무집 목표치 UPDATE 1개를 더해 가입 한 번의 예산은 4개
+        # 테스트에서는 트랜잭션 시작/끝이 SAVEPOINT 2개로 함께 집계됨
+        with CaptureQueriesContext(connection) as queries:
+            response = self.join()
+        self.assertEqual(response.status_code, 201)
+        statements = [query["sql"] for query in queries.captured_queries if "SAVEPOINT" not in query["sql"]]
+        self.assertEqual(len(statements), 4)
+        self.assertIn(ProjectHouse._meta.db_table, statements[-1])
+        self.assertEqual(len(queries.captured_queries), 6)
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, 2)
+        house = ProjectHouse.objects.get(project=self.project)
+        self.assertEqual(house.total_required_logs, int(2 * 10 * 2 * 0.85))
+
+    def test_duplicate_join_is_rejected(self):
+        self.join()
+        response = self.join()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["message"], "이미 해당 프로젝트에 속해있습니다.")
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, 2)
+
+    def test_full_project_is_rejected(self):
+        Project.objects.filter(pk=self.project.pk).update(member_count=Project.MAX_MEMBERS)
+        response = self.join()
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(TeamMember.objects.filter(user=self.member).exists())
+
+    def test_already_joined_wins_over_full(self):
+        Project.objects.filter(pk=self.project.pk).update(member_count=Project.MAX_MEMBERS)
+        with self.assertRaises(ValidationError) as raised:
+            TeamMember.join(self.owner, self.project)
+        self.assertEqual(raised.exception.code, "already_joined")
+
+    def test_join_after_project_deleted(self):
+        # 초대 코드로 프로젝트를 찾은 뒤 가입 전에 삭제 표시된 경우
+        stale = Project.objects.get(pk=self.project.pk)
+        self.project.mark_deleted()
+        with self.assertRaises(ValidationError) as raised:
+            TeamMember.join(self.member, stale)
+        self.assertEqual(raised.exception.code, "project_not_found")
+        self.assertFalse(TeamMember.objects.filter(user=self.member).exists())
+        self.assertEqual(Project.all_objects.get(pk=self.project.pk).member_count, 1)
+
+
+class ProjectListPaginationTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        other = User.objects.create_user(username="other", email="other@test.com")
+        for i in range(25):
+            project = Project.objects.create(
+                project_name=f"p{i}",
+                date_start=date(2025, 11, 1),
+                date_end=date(2025, 11, 10),
+                owner=self.user,
+                invite_code=f"code{i}",
+            )
+            TeamMember.join(self.user, project, role="Admin")
+            TeamMember.join(other, project)
+        # 같은 created_at을 가진 프로젝트도 id로 구분되어야 함 (팀원 행에 복사된 값도 함께)
+        now = timezone.now()
+        Project.objects.update(created_at=now)
+        TeamMember.objects.update(project_created_at=now)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_pages_cover_all_projects_once(self):
+        response = self.client.get("/projects/", {"page_size": 10})
+        seen = [row["id"] for row in response.data["results"]]
+        while response.data["next_cursor"]:
+            response = self.client.get("/projects/", {
+                "page_size": 10, "cursor": response.data["next_cursor"],
+            })
+            seen += [row["id"] for row in response.data["results"]]
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(seen, sorted(seen, reverse=True))
+
+    def test_excludes_projects_not_joined_or_deleted(self):
+        outsider = Project.objects.create(
+            project_name="outsider",
+            date_start=date(2025, 11, 1),
+            date_end=date(2025, 11, 10),
+            owner=self.user,
+            invite_code="codeout",
+        )
+        deleted = Project.objects.order_by("id").first()
+        deleted.delete()
+
+        response = self.client.get("/projects/", {"page_size": 100})
+        seen = [row["id"] for row in response.data["results"]]
+
+        self.assertEqual(len(seen), 24)
+        self.assertNotIn(outsider.id, seen)
+        self.assertNotIn(deleted.id, seen)
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/projects/", {"cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+
+class ProjectDeletionTest(TestCase):
+    def setUp(self):
+        self.owner = create_owner()
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.owner, self.project, role="Admin")
+        Log.give_log(self.owner, self.project, "DAILY_COMPLETE")
+
+        tag_style = create_tag_style()
+        for i in range(5):
+            memo = Memo.objects.create(
+                user=self.owner, project=self.project, date=date(2025, 11, 1), contents=f"메모 {i}"
+            )
+            Tagging.objects.create(
+                tag_style=tag_style, user=self.owner, memo=memo,
+                tag_contents="메모", offset_start=0, offset_end=2,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_delete_marks_and_purge_removes_children(self):
+        response = self.client.delete(f"/projects/{self.project.id}/")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(self.client.get(f"/projects/{self.project.id}/").status_code, 404)
+        self.assertEqual(self.client.get("/projects/").data["results"], [])
+        self.assertTrue(Memo.objects.filter(project_id=self.project.id).exists())
+
+        out = StringIO()
+        call_command("purge_deleted_projects", batch_size=2, stdout=out)
+
+        self.assertFalse(Project.all_objects.filter(pk=self.project.id).exists())
+        self.assertFalse(Memo.objects.exists())
+        self.assertFalse(Tagging.objects.exists())
+        self.assertFalse(Log.objects.exists())
+        self.assertFalse(TeamMember.objects.exists())
+        self.assertFalse(ProjectHouse.objects.exists())
+        self.assertIn("memos.Memo: 4개 삭제", out.getvalue())
+
+
+@override_settings(CACHES=MEMORY_CACHES)
+class ProjectDashboardTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_owner(nickname="owner")
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.owner, self.project, role="Admin")
+        create_tag_style()
+        Memo.objects.create(
+            user=self.owner, project=self.project, date=timezone.localdate(), contents="오늘 메모"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = f"/projects/{self.project.id}/dashboard/"
+
+    def test_all_sections_with_fixed_queries(self):
+        # 프로젝트+팀원 확인 1, 통나무집 1, 기여도 2, 태그 스타일 1, 메모 1
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
+        self.assertEqual(
+            set(response.data), {"project", "house", "contribution", "tag_styles", "memos"}
+        )
+        self.assertEqual(response.data["memos"][0]["contents"], "오늘 메모")
+
+        # 모든 섹션이 캐싱된 뒤에는 프로젝트 조회만 실행
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_include_selects_sections(self):
+        response = self.client.get(self.url, {"include": "house,memos"})
+        self.assertEqual(set(response.data), {"house", "memos"})
+
+        response = self.client.get(self.url, {"include": "house,unknown"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_member_is_forbidden(self):
+        outsider = User.objects.create_user(username="outsider", email="outsider@test.com")
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_project_save_invalidates_section(self):
+        self.client.get(self.url, {"include": "project"})
+        self.assertIsNotNone(cache.get(Project.cache_key(self.project.pk)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.project_name = "새 이름"
+            self.project.save()
+        self.assertIsNone(cache.get(Project.cache_key(self.project.pk)))
+        response = self.client.get(self.url, {"include": "project"})
+        self.assertEqual(response.data["project"]["project_name"], "새 이름")
+
+    def test_memo_write_invalidates_section(self):
+        self.client.get(self.url, {"include": "memos"})
+        with self.captureOnCommitCallbacks(execute=True):
+            Memo.objects.create(
+                user=self.owner, project=self.project, date=timezone.localdate(), contents="새 메모"
+            )
+        response = self.client.get(self.url, {"include": "memos"})
+        self.assertEqual(len(response.data["memos"]), 2)
+
+
+class ProjectDashboardSharedCacheTest(TestCase):
+    """
+    대시보드의 기여도/메모 섹션 캐시를 다른 워커가 같은 공유 캐시로 보고 무효화하는지 확인
+    """
+    def setUp(self):
+        cache.clear()
+        self.owner = create_owner(nickname="owner")
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.owner, self.project, role="Admin")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = f"/projects/{self.project.id}/dashboard/"
+        # 다른 워커 프로세스가 만드는 것과 같은 설정의 별도 캐시 연결
+        self.other_worker = caches.create_connection("default")
+        self.memo_key = Memo.daily_cache_key(self.owner.pk, self.project.pk, timezone.localdate())
+        self.contribution_key = ProjectHouse.contribution_cache_key(self.project.pk)
+
+    def test_sections_cached_here_are_visible_to_other_workers(self):
+        self.client.get(self.url, {"include": "contribution,memos"})
+        self.assertEqual(self.other_worker.get(self.memo_key), [])
+        self.assertEqual(len(self.other_worker.get(self.contribution_key)), 1)
+
+    def test_writes_here_invalidate_other_workers(self):
+        self.client.get(self.url, {"include": "contribution,memos"})
+        member = User.objects.create_user(username="member", email="member@test.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            Memo.objects.create(
+                user=self.owner, project=self.project, date=timezone.localdate(), contents="새 메모"
+            )
+            TeamMember.join(member, self.project)
+
+        self.assertIsNone(self.other_worker.get(self.memo_key))
+        self.assertIsNone(self.other_worker.get(self.contribution_key))
+        response = self.client.get(self.url, {"include": "contribution,memos"})
+        self.assertEqual(len(response.data["memos"]), 1)
+        self.assertEqual(len(response.data["contribution"]), 2)
+
+
+class ProjectConditionalGetTest(TestCase):
+    def setUp(self):
+        self.owner = create_owner()
+        self.project = create_project(self.owner)
+        ProjectHouse.objects.create(project=self.project)
+        TeamMember.join(self.owner, self.project, role="Admin")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_detail_revalidates_after_edit(self):
+        url = f"/projects/{self.project.id}/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.project.project_name = "새 이름"
+        self.project.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["project_name"], "새 이름")
+
+    def test_list_revalidates_after_join(self):
+        etag = self.client.get("/projects/")["ETag"]
+        self.assertEqual(self.client.get("/projects/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        other = Project.objects.create(
+            project_name="다른",
+            date_start=date(2025, 11, 1),
+            date_end=date(2025, 11, 10),
+            owner=self.owner,
+            invite_code="code2",
+        )
+        TeamMember.join(self.owner, other, role="Admin")
+        response = self.client.get("/projects/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_list_etag_differs_per_page(self):
+        other = create_project(self.owner, invite_code="code2")
+        TeamMember.join(self.owner, other, role="Admin")
+        first = self.client.get("/projects/", {"page_size": 1})
+        etag = first["ETag"]
+
+        self.assertNotEqual(self.client.get("/projects/", {"page_size": 2})["ETag"], etag)
+        response = self.client.get(
+            "/projects/", {"page_size": 1, "cursor": first.data["next_cursor"]}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["id"], self.project.id)
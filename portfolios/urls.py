@@ -4,8 +4,10 @@ from .views import *
 urlpatterns = [
     path('', ProjectCreateView.as_view(), name='project-create'),
     path('<int:pk>/', ProjectDetailView.as_view(), name='project-detail'),
+    path('<int:pk>/dashboard/', ProjectDashboardView.as_view(), name="project-dashboard"),
     path('<int:pk>/house/', ProjectHouseView.as_view(), name="project-house"),
     path('<int:pk>/house/contribution/', ContributionView.as_view(), name="project-house-contribution"),
+    path('<int:pk>/house/timeline/', ProjectTimelineView.as_view(), name="project-house-timeline"),
 
     path('invite/', InviteCodeView.as_view(), name='invite_code'),
     
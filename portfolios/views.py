@@ -2,12 +2,24 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from .serializers import *
 from .models import Project
+from .invite_codes import normalize_invite_code
 from accounts.models import TeamMember
 from accounts.serializers import TeamMemberSerializer
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 from rest_framework.permissions import IsAuthenticated, BasePermission
 from django.http import Http404
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef
+from config.cache import read_through
+from config.conditional import conditional_response, list_validators, make_etag, row_validators
+from config.pagination import KeysetPagination
+from django.utils import timezone
+from memos.models import Memo
+from memos.serializers import MemoSerializer
+from taggings.registry import tag_styles
+from datetime import timedelta
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -19,7 +31,7 @@ project_detail_schema = openapi.Schema(
         "date_start": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-10"),
         "date_end": openapi.Schema(type=openapi.TYPE_STRING, example="2025-12-10"),
         "owner": openapi.Schema(type=openapi.TYPE_INTEGER, example=1),
-        "invite_code": openapi.Schema(type=openapi.TYPE_STRING, example="a94bf2e13c"),
+        "invite_code": openapi.Schema(type=openapi.TYPE_STRING, example="7K3MZQ8P3"),
         "created_at": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14T23:50:00.123456+09:00"),
     }
 )
@@ -32,6 +44,13 @@ class IsProjectOwner(BasePermission):
         # obj는 'get_object' 메서드에서 반환된 Project 인스턴스입니다.
         return obj.owner == request.user
 
+class ProjectListPagination(KeysetPagination):
+    """
+    내 프로젝트 목록은 TeamMember 행을 (프로젝트 생성 시각, 프로젝트 id) 순으로 넘깁니다.
+    """
+    ordering = ("-project_created_at", "-project")
+
+
 class ProjectCreateView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -67,22 +86,20 @@ class ProjectCreateView(APIView):
             # serializer.save()가 호출될 때,
             # 'owner'를 request.user로 지정하여 넘겨줍니다.
             # 이 'owner' 값은 serializer의 create 메서드로 전달됩니다.
-            project = serializer.save(owner=request.user)
+            # 프로젝트, 통나무집, Admin 팀원을 하나의 트랜잭션으로 생성 (중간에 실패하면 모두 롤백)
+            with transaction.atomic():
+                project = serializer.save(owner=request.user)
 
-            # 생성한 사람 Admin으로 설정
-            TeamMember.objects.create(
-                user=request.user,
-                project=project,
-                role="Admin"
-            )
+                # 프로젝트의 통나무집 기본값으로 생성
+                ProjectHouse.objects.create(
+                    project=project,
+                    difficulty_ratio=0.85, 
+                    total_required_logs=0,   
+                    current_logs=0
+                )
 
-            # 프로젝트의 통나무집 기본값으로 생성
-            ProjectHouse.objects.create(
-                project=project,
-                difficulty_ratio=0.85, 
-                total_required_logs=0,   
-                current_logs=0
-            )
+                # 생성한 사람 Admin으로 설정 (팀원 추가 시 통나무집 목표치가 계산됨)
+                TeamMember.join(request.user, project, role="Admin")
         except ValidationError as e:
             # 모델에서 발생한 clean() 예외 처리 (프로젝트 6명 인원 제한)
             return Response(
@@ -91,32 +108,63 @@ class ProjectCreateView(APIView):
             )
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
-    # 로그인한 사용자의 모든 프로젝트 리스트 조회
+    # 로그인한 사용자의 프로젝트 리스트 조회 (최신순, 커서 페이지네이션)
     @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="이전 응답의 next_cursor 값",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                'page_size',
+                openapi.IN_QUERY,
+                description="페이지 크기 (기본 20, 최대 100)",
+                type=openapi.TYPE_INTEGER,
+            )
+        ],
         responses={
             200: openapi.Response(
                 description="로그인한 사용자의 프로젝트 리스트 조회 성공",
                 schema=openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
+                        "next": openapi.Schema(type=openapi.TYPE_STRING, example="http://localhost:8000/projects/?cursor=WyIyMDI1LTExLTE0VDIzOjUwOjAwKzA5OjAwIiwiMTIiXQ"),
+                        "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, example="WyIyMDI1LTExLTE0VDIzOjUwOjAwKzA5OjAwIiwiMTIiXQ"),
                         "results": openapi.Schema(
                             type=openapi.TYPE_ARRAY,
                             items=project_detail_schema
                         )
                     }
                 )
-            )
+            ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
         }
     )
     def get(self, request):
         user = request.user
-        
-        projects = Project.objects.filter(
-            teammember__user=user
-        ).distinct().order_by("-created_at")
 
-        serializer = ProjectSerializer(projects, many=True, context={"request": request})
-        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+        # 프로젝트 전체가 아니라 내 팀원 행을 (user, project_created_at, project) 인덱스 범위로 훑고,
+        # 페이지에 해당하는 프로젝트만 JOIN으로 함께 읽음
+        memberships = TeamMember.objects.filter(
+            user=user, project__deleted_at__isnull=True
+        ).select_related("project")
+
+        # (프로젝트 created_at, id) 기준 커서 페이지네이션 (최신순)
+        paginator = ProjectListPagination()
+
+        def build():
+            page = paginator.paginate_queryset(memberships, request, view=self)
+            serializer = ProjectSerializer(
+                [membership.project for membership in page], many=True, context={"request": request}
+            )
+            return paginator.get_paginated_response(serializer.data)
+
+        etag, last_modified = list_validators(
+            Project.objects.filter(teammember__user=user), *paginator.etag_parts(request)
+        )
+        return conditional_response(request, etag, last_modified, build)
     
 # 조회, 수정, 삭제를 위한 뷰
 class ProjectDetailView(APIView):
@@ -144,6 +192,7 @@ class ProjectDetailView(APIView):
                 description="프로젝트 상세 조회 성공",
                 schema=project_detail_schema
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
             403: openapi.Response(
                 description="권한 없음",
                 schema=openapi.Schema(
@@ -169,8 +218,11 @@ class ProjectDetailView(APIView):
     )
     def get(self, request, pk):
         project = self.get_object(pk)
-        serializer = ProjectSerializer(project) # 조회용 Serializer 사용
-        return Response(serializer.data)
+        etag, last_modified = row_validators(project)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: Response(ProjectSerializer(project).data), # 조회용 Serializer 사용
+        )
 
     # --- 수정 (PUT: 전체 수정) ---
     @swagger_auto_schema(
@@ -261,7 +313,15 @@ class ProjectDetailView(APIView):
     # --- 삭제 (DELETE) ---
     @swagger_auto_schema(
         responses={
-            204: openapi.Response(description="프로젝트 삭제 성공"),
+            202: openapi.Response(
+                description="프로젝트 삭제 요청 접수 (하위 데이터는 백그라운드에서 삭제)",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "message": openapi.Schema(type=openapi.TYPE_STRING, example="프로젝트 삭제가 요청되었습니다.")
+                    }
+                )
+            ),
             403: openapi.Response(
                 description="권한 없음",
                 schema=openapi.Schema(
@@ -280,8 +340,12 @@ class ProjectDetailView(APIView):
     )
     def delete(self, request, pk):
         project = self.get_object(pk)
-        project.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        # 즉시 삭제 표시만 하고, 하위 데이터는 purge_deleted_projects 커맨드가 나누어 삭제
+        project.mark_deleted()
+        return Response(
+            {"message": "프로젝트 삭제가 요청되었습니다."},
+            status=status.HTTP_202_ACCEPTED
+        )
         
 # class TagStyleCreateView(APIView):
 #     permission_classes = [IsAuthenticated]
@@ -342,8 +406,8 @@ class InviteCodeView(APIView):
             properties={
                 "invite_code": openapi.Schema(
                     type=openapi.TYPE_STRING,
-                    example="a94bf2e13c",
-                    description="프로젝트 초대 코드"
+                    example="7K3MZQ8P3",
+                    description="프로젝트 초대 코드 (대소문자, 하이픈 무시)"
                 )
             },
             required=["invite_code"]
@@ -389,30 +453,29 @@ class InviteCodeView(APIView):
         }
     )
     def post(self, request):
-        invite_code = request.data.get("invite_code")
-        project = get_object_or_404(Project, invite_code=invite_code)
-        user = request.user
-
-        # 이미 해당 프로젝트에 가입되어 있는지 확인
-        if TeamMember.objects.filter(user=user, project=project).exists():
+        # 체크 문자가 맞지 않는 코드(오타)는 DB 조회 없이 거절
+        invite_code = normalize_invite_code(request.data.get("invite_code"))
+        if invite_code is None:
             return Response(
-                {"message": "이미 해당 프로젝트에 속해있습니다."},
+                {"message": "유효하지 않은 초대 코드 형식입니다."},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        # 실제 가입 시도
+        project = get_object_or_404(
+            Project.objects.only("id", "project_name", "date_start", "date_end", "created_at"),
+            invite_code=invite_code,
+        )
+
+        # 중복 확인, 인원 제한, 통나무집 목표치 갱신까지 하나의 트랜잭션에서 처리
         try:
-            team_member = TeamMember.objects.create(
-                user=user,
-                project=project,
-                role="Member"
-            )
+            team_member = TeamMember.join(request.user, project)
         except ValidationError as e:
-            # 모델에서 발생한 clean() 예외 처리 (프로젝트 6명 인원 제한)
-            return Response(
-                {"error": e.message if hasattr(e, "message") else str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            if e.code == "already_joined":
+                return Response({"message": e.message}, status=status.HTTP_400_BAD_REQUEST)
+            if e.code == "project_not_found":
+                # 코드 조회 후 가입 전에 프로젝트가 삭제된 경우
+                return Response({"detail": e.message}, status=status.HTTP_404_NOT_FOUND)
+            # 프로젝트 6명 인원 제한
+            return Response({"error": e.message}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response(
             {
@@ -435,6 +498,22 @@ project_house_schema = openapi.Schema(
     }
 )
 
+def get_house_payload(project_id):
+    """
+    통나무집 응답({"data", "etag"})을 캐시에서 가져오고, 없으면 만들어서 캐싱합니다.
+    통나무 지급/팀원 변경/기간 변경 시 무효화되고, DB 캐시에서는 캐시를 채우지 않으므로 조회 시 DB 쓰기가 없습니다.
+    """
+    def build():
+        house = get_object_or_404(
+            ProjectHouse.objects.select_related("project"),
+            project_id=project_id,
+            project__deleted_at__isnull=True,
+        )
+        data = dict(ProjectHouseSerializer(house).data)
+        return {"data": data, "etag": make_etag(data)}
+
+    return read_through(ProjectHouse.cache_key(project_id), build, ProjectHouse.CACHE_TIMEOUT)
+
 class ProjectHouseView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -444,6 +523,7 @@ class ProjectHouseView(APIView):
                 description="프로젝트 진행도 조회 성공",
                 schema=project_house_schema
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match 일치)"),
             404: openapi.Response(
                 description="프로젝트 또는 하우스를 찾을 수 없음",
                 schema=openapi.Schema(
@@ -456,16 +536,11 @@ class ProjectHouseView(APIView):
         }
     )
     def get(self, request, pk):
-        project = get_object_or_404(Project, id=pk)
-        house = get_object_or_404(ProjectHouse, project=project)
-
-        # 진행률 업데이트
-        house.current_logs = Log.objects.filter(project=project).count()
-        house.total_required_logs = house.calculate_required_logs()
-        house.save()
-
-        serializer = ProjectHouseSerializer(house)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        cached = get_house_payload(pk)
+        return conditional_response(
+            request, cached["etag"], None,
+            lambda: Response(cached["data"], status=status.HTTP_200_OK),
+        )
 
   
 contribution_schema = openapi.Schema(
@@ -479,6 +554,31 @@ contribution_schema = openapi.Schema(
     }
 )
 
+def get_contribution_data(project):
+    """
+    팀원별 기여도 목록을 캐시에서 가져오고, 없으면 쿼리 2번(팀원, GROUP BY 집계)으로 만들어 캐싱합니다.
+    워커들이 함께 쓰는 공유 캐시(settings.CACHES)에 두므로, 어느 워커에서 무효화해도 모든 워커에 반영됩니다.
+    """
+    key = ProjectHouse.contribution_cache_key(project.pk)
+    data = cache.get(key)
+    if data is None:
+        team_members = TeamMember.objects.filter(project=project).select_related("user", "project")
+
+        # 팀원별 통나무 수를 GROUP BY 쿼리 한 번으로 집계
+        log_counts = dict(
+            Log.objects.filter(project=project)
+            .values("user")
+            .annotate(total=Count("id"))
+            .values_list("user", "total")
+        )
+
+        serializer = ContributionSerializer(
+            team_members, many=True, context={"log_counts": log_counts}
+        )
+        data = [dict(row) for row in serializer.data]
+        cache.set(key, data, ProjectHouse.CACHE_TIMEOUT)
+    return data
+
 class ContributionView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -504,6 +604,188 @@ class ContributionView(APIView):
     )
     def get(self, request, pk):
         project = get_object_or_404(Project, id=pk)
-        team_members = TeamMember.objects.filter(project=project)
-        serializer = ContributionSerializer(team_members, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_contribution_data(project), status=status.HTTP_200_OK)
+
+
+timeline_schema = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "date": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-14"),
+        "daily_complete_count": openapi.Schema(type=openapi.TYPE_INTEGER, example=3),
+        "tag_review_count": openapi.Schema(type=openapi.TYPE_INTEGER, example=2),
+        "total_logs": openapi.Schema(type=openapi.TYPE_INTEGER, example=5),
+        "active_members": openapi.Schema(type=openapi.TYPE_INTEGER, example=3),
+        "cumulative_logs": openapi.Schema(type=openapi.TYPE_INTEGER, example=21),
+    }
+)
+
+class ProjectTimelineView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 프로젝트 기간 전체의 일별 통나무 집계 (기록이 없는 날은 0으로 채움)
+    @swagger_auto_schema(
+        responses={
+            200: openapi.Response(
+                description="프로젝트 일별 타임라인 조회 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "project_id": openapi.Schema(type=openapi.TYPE_INTEGER, example=7),
+                        "date_start": openapi.Schema(type=openapi.TYPE_STRING, example="2025-11-10"),
+                        "date_end": openapi.Schema(type=openapi.TYPE_STRING, example="2025-12-10"),
+                        "results": openapi.Schema(type=openapi.TYPE_ARRAY, items=timeline_schema),
+                    }
+                )
+            ),
+            404: openapi.Response(
+                description="프로젝트를 찾을 수 없음",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(type=openapi.TYPE_STRING, example="Not found.")
+                    }
+                )
+            )
+        }
+    )
+    def get(self, request, pk):
+        project = get_object_or_404(Project, id=pk)
+
+        # 원본 Log 테이블 대신 일별 집계 테이블만 조회
+        stats_by_date = {
+            stats.date: stats
+            for stats in ProjectDailyStats.objects.filter(
+                project=project,
+                date__range=(project.date_start, project.date_end),
+            )
+        }
+
+        results = []
+        cumulative = 0
+        day = project.date_start
+        while day <= project.date_end:
+            stats = stats_by_date.get(day) or ProjectDailyStats(project=project, date=day)
+            cumulative += stats.total_logs
+            results.append({
+                "date": day.isoformat(),
+                "daily_complete_count": stats.daily_complete_count,
+                "tag_review_count": stats.tag_review_count,
+                "total_logs": stats.total_logs,
+                "active_members": stats.active_members,
+                "cumulative_logs": cumulative,
+            })
+            day += timedelta(days=1)
+
+        return Response({
+            "project_id": project.id,
+            "date_start": project.date_start,
+            "date_end": project.date_end,
+            "results": results,
+        }, status=status.HTTP_200_OK)
+
+
+class ProjectDashboardView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    SECTIONS = ("project", "house", "contribution", "tag_styles", "memos")
+
+    # 프로젝트 상세, 통나무집, 기여도, 태그 스타일, 오늘 내 메모를 한 번에 조회
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                'include',
+                openapi.IN_QUERY,
+                description="포함할 섹션 (쉼표 구분, 기본 전체): project,house,contribution,tag_styles,memos",
+                type=openapi.TYPE_STRING,
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                description="프로젝트 대시보드 조회 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "project": project_detail_schema,
+                        "house": project_house_schema,
+                        "contribution": openapi.Schema(type=openapi.TYPE_ARRAY, items=contribution_schema),
+                        "tag_styles": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT)),
+                        "memos": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT)),
+                    }
+                )
+            ),
+            400: openapi.Response(
+                description="잘못된 include 값",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(type=openapi.TYPE_STRING, example="알 수 없는 섹션입니다: foo")
+                    }
+                )
+            ),
+            403: openapi.Response(
+                description="프로젝트 팀원이 아님",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(type=openapi.TYPE_STRING, example="Permission denied")
+                    }
+                )
+            ),
+            404: openapi.Response(
+                description="프로젝트 없음",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "detail": openapi.Schema(type=openapi.TYPE_STRING, example="Not found.")
+                    }
+                )
+            ),
+        }
+    )
+    def get(self, request, pk):
+        include = request.query_params.get("include")
+        sections = [name.strip() for name in include.split(",") if name.strip()] if include else self.SECTIONS
+        unknown = [name for name in sections if name not in self.SECTIONS]
+        if unknown:
+            return Response(
+                {"error": f"알 수 없는 섹션입니다: {', '.join(unknown)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 프로젝트 조회와 팀원 여부 확인을 쿼리 한 번으로 처리
+        project = get_object_or_404(
+            Project.objects.annotate(
+                is_member=Exists(TeamMember.objects.filter(project=OuterRef("pk"), user=request.user))
+            ),
+            pk=pk,
+        )
+        if not project.is_member:
+            return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
+
+        # 섹션별로 공유 캐시에 따로 캐싱되므로, 캐시가 없는 섹션만 DB를 조회
+        data = {}
+        if "project" in sections:
+            data["project"] = read_through(
+                Project.cache_key(project.pk), lambda: dict(ProjectSerializer(project).data), Project.CACHE_TIMEOUT
+            )
+        if "house" in sections:
+            data["house"] = get_house_payload(project.pk)["data"]
+        if "contribution" in sections:
+            data["contribution"] = get_contribution_data(project)
+        if "tag_styles" in sections:
+            version, rows = tag_styles.all()
+            data["tag_styles"] = rows
+        if "memos" in sections:
+            today = timezone.localdate()
+            data["memos"] = cache.get_or_set(
+                Memo.daily_cache_key(request.user.pk, project.pk, today),
+                lambda: [
+                    dict(row) for row in MemoSerializer(
+                        Memo.objects.filter(user=request.user, project=project, date=today).order_by("-created_at"),
+                        many=True,
+                    ).data
+                ],
+                Memo.CACHE_TIMEOUT,
+            )
+
+        return Response(data, status=status.HTTP_200_OK)
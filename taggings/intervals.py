@@ -0,0 +1,15 @@
+def overlap_groups(spans):
+    """
+    (start, end, key) 구간들을 서로 겹치는 것끼리 묶습니다. (반열린 구간, 정렬 후 한 번 훑기)
+    한 그룹 안의 구간은 겹침으로 이어져 있으므로, 크기가 2 이상인 그룹의 구간은 모두 다른 구간과 겹칩니다.
+    그룹마다 (합친 start, 합친 end, [key, ...])를 돌려줍니다.
+    """
+    groups = []
+    for start, end, key in sorted(spans, key=lambda span: (span[0], span[1])):
+        if groups and start < groups[-1][1]:
+            group = groups[-1]
+            group[1] = max(group[1], end)
+            group[2].append(key)
+        else:
+            groups.append([start, end, [key]])
+    return [tuple(group) for group in groups]
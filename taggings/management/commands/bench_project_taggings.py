@@ -0,0 +1,95 @@
+import time
+from collections import defaultdict
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from accounts.models import User
+from memos.models import Memo
+from portfolios.models import Project
+from taggings.models import Tagging, TagStyle
+from taggings.serializers import TaggingSerializer
+from taggings.views import group_taggings
+
+
+class Rollback(Exception):
+    pass
+
+
+def legacy_group_taggings(taggings):
+    # 이전 ProjectTaggingView: 모델 인스턴스로 그룹핑 후 카테고리별 직렬화 + 사용하지 않는 전체 직렬화
+    grouped = defaultdict(list)
+    for tagging in taggings.select_related("tag_style", "memo").order_by("-created_at"):
+        grouped[tagging.tag_style].append(tagging)
+    categories = []
+    for tag_style, tagging_list in grouped.items():
+        categories.append({
+            "tag_style": {"id": tag_style.id, "tag_detail": tag_style.tag_detail, "tag_color": tag_style.tag_color},
+            "taggings": TaggingSerializer(tagging_list, many=True).data,
+        })
+    TaggingSerializer(taggings, many=True).data
+    return categories
+
+
+class Command(BaseCommand):
+    help = "프로젝트 태깅 그룹 조회의 이전 방식과 단일 패스 방식을 비교합니다. (데이터는 롤백됨)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--taggings", type=int, default=50_000, help="생성할 태깅 수 (기본 50000)")
+        parser.add_argument("--styles", type=int, default=8, help="태그 스타일 수 (기본 8)")
+        parser.add_argument("--limit", type=int, default=20, help="카테고리별 제한 측정값 (기본 20)")
+        parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (기본 3)")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def measure(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings) * 1000
+
+    def run(self, options):
+        total = options["taggings"]
+        user = User.objects.create_user(username="bench_tagging_user", email="bench-tagging@example.com")
+        project = Project.objects.create(
+            project_name="bench",
+            date_start=date(2020, 1, 1),
+            date_end=date(2030, 1, 1),
+            owner=user,
+            invite_code="BENCHTAG00",
+        )
+        styles = TagStyle.objects.bulk_create([
+            TagStyle(tag_detail=f"bench-{i}", tag_color=f"#{i:06X}") for i in range(options["styles"])
+        ])
+        memos = Memo.objects.bulk_create([
+            Memo(user=user, project=project, date=date(2025, 1, 1), contents="벤치마크 메모입니다")
+            for _ in range(max(1, total // 10))
+        ])
+
+        self.stdout.write(f"태깅 {total}개 생성 중...")
+        Tagging.objects.bulk_create(
+            (
+                Tagging(
+                    tag_style=styles[i % len(styles)], user=user, memo=memos[i % len(memos)],
+                    tag_contents="벤치마크", offset_start=0, offset_end=4,
+                )
+                for i in range(total)
+            ),
+            batch_size=5000,
+        )
+        taggings = Tagging.objects.filter(user=user, memo__project=project)
+
+        legacy_ms = self.measure(lambda: legacy_group_taggings(taggings), options["repeat"])
+        single_ms = self.measure(lambda: group_taggings(taggings), options["repeat"])
+        limited_ms = self.measure(lambda: group_taggings(taggings, options["limit"]), options["repeat"])
+
+        self.stdout.write(f"이전 방식 (인스턴스 + 이중 직렬화): {legacy_ms:.0f}ms")
+        self.stdout.write(f"단일 패스 (values)                : {single_ms:.0f}ms ({legacy_ms / single_ms:.1f}배)")
+        self.stdout.write(f"단일 패스 + limit={options['limit']}            : {limited_ms:.0f}ms")
@@ -0,0 +1,89 @@
+import random
+import time
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from accounts.models import User
+from memos.models import Memo
+from portfolios.models import Project
+from taggings.models import Tagging, TagStyle
+
+
+class Rollback(Exception):
+    pass
+
+
+def naive_overlapping(memo, start, end):
+    # 이전 방식: 메모의 태깅을 모두 읽어 파이썬에서 하나씩 비교
+    return [
+        tagging for tagging in Tagging.objects.filter(memo=memo)
+        if tagging.offset_start < end and tagging.offset_end > start
+    ]
+
+
+class Command(BaseCommand):
+    help = "메모 태깅 구간 겹침 조회의 선형 탐색과 인덱스 조회를 비교합니다. (데이터는 롤백됨)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--memos", type=int, default=50, help="생성할 메모 수 (기본 50)")
+        parser.add_argument("--taggings", type=int, default=400, help="메모당 태깅 수 (기본 400)")
+        parser.add_argument("--queries", type=int, default=20, help="메모당 구간 조회 수 (기본 20)")
+        parser.add_argument("--width", type=int, default=20, help="조회 구간 길이 (기본 20)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본 0)")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def measure(self, func, queries):
+        started = time.perf_counter()
+        found = sum(len(func(memo, start, end)) for memo, start, end in queries)
+        return (time.perf_counter() - started) * 1000, found
+
+    def run(self, options):
+        rng = random.Random(options["seed"])
+        length = Memo._meta.get_field("contents").max_length
+        user = User.objects.create_user(username="bench_overlap_user", email="bench-overlap@example.com")
+        project = Project.objects.create(
+            project_name="bench",
+            date_start=date(2020, 1, 1),
+            date_end=date(2030, 1, 1),
+            owner=user,
+            invite_code="BENCHOVL00",
+        )
+        style = TagStyle.objects.create(tag_detail="bench-overlap", tag_color="#0000FE")
+        memos = Memo.objects.bulk_create([
+            Memo(user=user, project=project, date=date(2025, 1, 1), contents="가" * length)
+            for _ in range(options["memos"])
+        ])
+
+        self.stdout.write(f"메모 {len(memos)}개 x 태깅 {options['taggings']}개 생성 중...")
+        taggings = []
+        for memo in memos:
+            for _ in range(options["taggings"]):
+                start = rng.randrange(length)
+                end = min(length, start + rng.randint(1, 30))
+                taggings.append(Tagging(
+                    tag_style=style, user=user, memo=memo,
+                    tag_contents=memo.contents[start:end], offset_start=start, offset_end=end,
+                ))
+        Tagging.objects.bulk_create(taggings, batch_size=5000)
+
+        queries = []
+        for memo in memos:
+            for _ in range(options["queries"]):
+                start = rng.randrange(length - options["width"])
+                queries.append((memo, start, start + options["width"]))
+
+        naive_ms, naive_found = self.measure(naive_overlapping, queries)
+        indexed_ms, indexed_found = self.measure(lambda memo, start, end: list(Tagging.overlapping(memo, start, end)), queries)
+        if naive_found != indexed_found:
+            self.stderr.write(f"결과 불일치: {naive_found} != {indexed_found}")
+
+        self.stdout.write(f"조회 {len(queries)}회, 일치 태깅 평균 {indexed_found / len(queries):.1f}개")
+        self.stdout.write(f"선형 탐색 (전체 로드): {naive_ms:.0f}ms ({naive_ms / len(queries):.2f}ms/회)")
+        self.stdout.write(f"인덱스 구간 조회     : {indexed_ms:.0f}ms ({indexed_ms / len(queries):.2f}ms/회, {naive_ms / indexed_ms:.1f}배)")
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0004_memorevision'),
+        ('taggings', '0002_alter_tagging_tag_contents'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tagging',
+            index=models.Index(fields=['memo', 'offset_start', 'offset_end'], name='tagging_memo_offsets_idx'),
+        ),
+    ]
@@ -1,8 +1,11 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
 from accounts.models import User
 from memos.models import Memo
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
+from .intervals import overlap_groups
+from .registry import tag_styles
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True) # 객체를 생성할 때 날짜와 시간 저장
@@ -22,12 +25,34 @@ class TagStyle(models.Model):
     tag_detail = models.CharField(max_length=20, unique=True)
     tag_color = models.CharField(max_length=7, unique=True, validators=[HEX_COLOR_VALIDATOR])
 
+    @classmethod
+    def invalidate_cache(cls):
+        # 커밋 후 버전을 올려 모든 워커의 TagStyle 레지스트리(taggings/registry.py)가 다시 읽게 함
+        transaction.on_commit(tag_styles.bump)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.invalidate_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.invalidate_cache()
+        return result
+
     # class Meta:
     #     constraints = [
     #         models.UniqueConstraint(fields=["project", "tag_detail"], name="unique_tag_detail_per_project"),
     #         models.UniqueConstraint(fields=["project", "tag_color"], name="unique_tag_color_per_project"),
     #     ]
 
+# 같은 메모·같은 태그 스타일 안에서 하이라이트가 겹칠 때의 처리 (settings.TAGGING_OVERLAP_POLICY)
+OVERLAP_ALLOW, OVERLAP_REJECT, OVERLAP_MERGE = "allow", "reject", "merge"
+
+
+def overlap_policy():
+    return getattr(settings, "TAGGING_OVERLAP_POLICY", OVERLAP_ALLOW)
+
+
 class Tagging(BaseModel):
     id = models.AutoField(primary_key=True)
     tag_style = models.ForeignKey(TagStyle, on_delete=models.CASCADE, related_name="taggings")
@@ -37,11 +62,136 @@ class Tagging(BaseModel):
     offset_start = models.PositiveIntegerField(default=0)
     offset_end = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            # 구간 겹침 조회: 메모 범위 안에서 offset_start < end 를 인덱스로 자르고 offset_end > start 를 인덱스에서 바로 확인
+            models.Index(fields=["memo", "offset_start", "offset_end"], name="tagging_memo_offsets_idx"),
+        ]
+
+    @classmethod
+    def overlapping(cls, memo, start, end):
+        """
+        메모에서 [start, end) 구간과 겹치는 태깅 (반열린 구간이라 경계만 맞닿은 태깅은 제외)
+        """
+        return cls.objects.filter(memo=memo, offset_start__lt=end, offset_end__gt=start)
+
+    def same_style_overlaps(self):
+        return (
+            Tagging.overlapping(self.memo_id, self.offset_start, self.offset_end)
+            .filter(tag_style_id=self.tag_style_id)
+            .exclude(pk=self.pk)
+        )
+
+    def merge_overlaps(self):
+        """
+        겹치는 같은 스타일 태깅을 이 태깅의 구간으로 합치고 삭제합니다.
+        합친 구간이 다른 태깅과 또 겹칠 수 있으므로 더 이상 겹치지 않을 때까지 반복합니다.
+        """
+        absorbed = []
+        while True:
+            spans = list(self.same_style_overlaps().exclude(pk__in=absorbed).values_list("pk", "offset_start", "offset_end"))
+            if not spans:
+                break
+            for pk, start, end in spans:
+                absorbed.append(pk)
+                self.offset_start = min(self.offset_start, start)
+                self.offset_end = max(self.offset_end, end)
+        if absorbed:
+            self.tag_contents = self.memo.contents[self.offset_start:self.offset_end]
+            Tagging.objects.filter(pk__in=absorbed).delete()
+        return absorbed
+
+    @classmethod
+    def bulk_create_for_memo(cls, memo, user, items):
+        """
+        검증된 항목(tag_style id, tag_contents, offset_start, offset_end) 목록을 한 트랜잭션에 bulk_create 합니다.
+        건별 save()의 full_clean() 대신 메모 길이, 태그 스타일 존재, 겹침 정책을 메모리에서 한 번에 검사합니다.
+        (태그 스타일은 프로세스 레지스트리에서, 기존 태깅 구간은 쿼리 한 번으로 읽음)
+        """
+        with transaction.atomic():
+            # 메모 행을 잠그고 다시 읽어, 검사 중에 본문(apply_delta)이나 태깅(다른 일괄 생성)이 바뀌지 않게 함
+            memo = Memo.objects.select_for_update().get(pk=memo.pk)
+            length = len(memo.contents)
+            for index, item in enumerate(items):
+                if item["offset_end"] > length:
+                    raise ValidationError(f"{index}번째 태깅의 offset_end가 메모 길이({length})를 넘습니다.")
+
+            styles = {pk: tag_styles.get(pk) for pk in {item["tag_style"] for item in items}}
+            # 다른 워커가 방금 지운 태그 스타일은 건별 저장과 같이 INSERT의 FK 제약 위반(IntegrityError)으로 거절됨
+            missing = sorted(pk for pk, style in styles.items() if style is None)
+            if missing:
+                raise ValidationError(f"존재하지 않는 태그 스타일입니다: {missing}")
+
+            taggings = [
+                cls(
+                    tag_style=styles[item["tag_style"]], user=user, memo=memo,
+                    tag_contents=item["tag_contents"],
+                    offset_start=item["offset_start"], offset_end=item["offset_end"],
+                )
+                for item in items
+            ]
+            policy = overlap_policy()
+            if policy != OVERLAP_ALLOW:
+                taggings, absorbed = cls.apply_overlap_policy(memo, taggings, policy)
+                if absorbed:
+                    cls.objects.filter(pk__in=absorbed).delete()
+            return cls.objects.bulk_create(taggings)
+
+    @classmethod
+    def apply_overlap_policy(cls, memo, taggings, policy):
+        """
+        새 태깅과 메모의 기존 태깅을 스타일별로 겹침 그룹으로 묶어 정책을 적용합니다.
+        reject: 새 태깅이 포함된 그룹에 구간이 둘 이상이면 거절
+        merge: 새 태깅이 포함된 그룹을 하나의 태깅으로 합치고, 그룹의 기존 태깅은 삭제 대상으로 돌려줌
+        """
+        spans = {}
+        existing = cls.objects.filter(memo=memo, tag_style_id__in={t.tag_style_id for t in taggings})
+        for pk, style_id, start, end in existing.values_list("pk", "tag_style_id", "offset_start", "offset_end"):
+            spans.setdefault(style_id, []).append((start, end, ("existing", pk)))
+        for index, tagging in enumerate(taggings):
+            spans.setdefault(tagging.tag_style_id, []).append(
+                (tagging.offset_start, tagging.offset_end, ("new", index))
+            )
+
+        keep, absorbed = set(), []
+        for style_spans in spans.values():
+            for start, end, keys in overlap_groups(style_spans):
+                indexes = [index for kind, index in keys if kind == "new"]
+                if not indexes:
+                    continue
+                if len(keys) > 1 and policy == OVERLAP_REJECT:
+                    raise ValidationError(f"{min(indexes)}번째 태깅이 같은 태그 스타일의 하이라이트와 겹칩니다.")
+                # merge: 그룹의 첫 새 태깅을 합친 구간으로 넓혀 남기고 나머지는 버림
+                tagging = taggings[indexes[0]]
+                if len(keys) > 1:
+                    tagging.offset_start, tagging.offset_end = start, end
+                    tagging.tag_contents = memo.contents[start:end]
+                keep.add(indexes[0])
+                absorbed += [pk for kind, pk in keys if kind == "existing"]
+        return [taggings[index] for index in sorted(keep)], absorbed
+
     def clean(self):
         if self.offset_start > self.offset_end:
             raise ValidationError("offset_start는 offset_end보다 클 수 없습니다.")
-        
-    def save(self, *args, **kwargs):
+        if (
+            overlap_policy() == OVERLAP_REJECT
+            and self.memo_id and self.tag_style_id
+            and self.same_style_overlaps().exists()
+        ):
+            raise ValidationError("같은 태그 스타일의 하이라이트와 겹칩니다.")
+
+    def clean_for_save(self):
         # full_clean()으로 clean() 포함 모든 validator 실행
-        self.full_clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        # 레지스트리에서 가져온 태그 스타일은 이미 확인됐으므로 FK 존재 확인 쿼리를 건너뜀 (DB FK 제약이 최종 보장)
+        registered = Tagging.tag_style.is_cached(self) and getattr(self.tag_style, "from_registry", False)
+        self.full_clean(exclude=["tag_style"] if registered else None)
+
+    def save(self, *args, **kwargs):
+        if overlap_policy() != OVERLAP_MERGE:
+            self.clean_for_save()
+            super().save(*args, **kwargs)
+            return
+        with transaction.atomic():
+            self.merge_overlaps()
+            self.clean_for_save()
+            super().save(*args, **kwargs)
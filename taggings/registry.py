@@ -0,0 +1,97 @@
+import time
+import uuid
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.dispatch import receiver
+
+
+class TagStyleRegistry:
+    """
+    워커 프로세스마다 한 번 읽어 메모리에 두는 TagStyle 목록입니다.
+    공유 캐시의 버전 값은 요청마다 한 번(요청 밖에서는 VERSION_TTL초마다) 확인하고,
+    TagStyle 저장/삭제로 버전이 올라갔을 때만 DB에서 다시 읽습니다.
+    """
+    VERSION_KEY = "tag_styles:version"
+    # 요청 밖(관리 명령 등)에서 버전을 다시 확인하기까지의 시간 (초)
+    VERSION_TTL = 1.0
+
+    def __init__(self):
+        # (버전, {id: TagStyle}, 직렬화된 목록, 이 버전에 없는 것으로 확인된 id) 를 한 번에 바꿔 끼워 스레드 간에 섞이지 않게 함
+        self._state = (None, {}, [], set())
+        # (마지막으로 확인한 버전, 확인한 시각)
+        self._checked = (None, None)
+
+    def version(self):
+        version, checked_at = self._checked
+        if checked_at is not None and time.monotonic() - checked_at < self.VERSION_TTL:
+            return version
+        version = cache.get(self.VERSION_KEY)
+        if version is None:
+            # 캐시에서 버전이 사라진 경우 새 값으로 다시 시작 (동시에 여러 워커가 시도해도 하나만 저장됨)
+            cache.add(self.VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(self.VERSION_KEY)
+        self._checked = (version, time.monotonic())
+        return version
+
+    def expire(self):
+        # 다음 version() 호출에서 공유 캐시를 다시 확인
+        self._checked = (None, None)
+
+    def bump(self):
+        # incr는 캐시 백엔드에 따라 읽고 쓰기가 나뉘어 동시 변경이 같은 값으로 합쳐질 수 있으므로
+        # 매번 겹치지 않는 새 값으로 덮어씀
+        version = uuid.uuid4().hex
+        cache.set(self.VERSION_KEY, version, None)
+        # 변경한 프로세스는 TTL을 기다리지 않고 바로 새 버전으로 다시 읽음
+        self._checked = (version, time.monotonic())
+
+    def reload(self, version):
+        from .models import TagStyle
+        from .serializers import TagStyleSerializer
+
+        styles = list(TagStyle.objects.order_by("id"))
+        for style in styles:
+            # Tagging.save()가 이미 확인된 태그 스타일로 보고 FK 재조회를 건너뜀
+            style.from_registry = True
+        rows = [dict(row) for row in TagStyleSerializer(styles, many=True).data]
+        self._state = (version, {style.id: style for style in styles}, rows, set())
+        return self._state
+
+    def load(self):
+        # 버전을 먼저 읽고 DB를 읽어야, 그 사이의 변경이 다음 버전 확인에서 반영됨
+        version = self.version()
+        state = self._state
+        if state[0] != version:
+            state = self.reload(version)
+        return state
+
+    def all(self):
+        """
+        (버전, 직렬화된 TagStyle 목록)
+        """
+        version, _, rows, _ = self.load()
+        return version, rows
+
+    def get(self, pk):
+        """
+        id로 TagStyle을 찾습니다. 없으면 다른 프로세스가 방금 추가했을 수 있으므로 한 번만 다시 읽어 확인하고,
+        그래도 없는 id는 같은 버전 동안 기억해 다시 읽지 않습니다.
+        """
+        version, styles, _, missing = self.load()
+        if pk in styles:
+            return styles[pk]
+        if pk in missing:
+            return None
+        _, styles, _, missing = self.reload(version)
+        if pk not in styles:
+            missing.add(pk)
+        return styles.get(pk)
+
+
+tag_styles = TagStyleRegistry()
+
+
+@receiver(request_started)
+def expire_tag_style_version(sender, **kwargs):
+    # 요청마다 버전을 한 번만 확인 (같은 요청 안의 load()/get()은 확인한 버전을 그대로 사용)
+    tag_styles.expire()
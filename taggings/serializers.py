@@ -1,14 +1,50 @@
 from rest_framework import serializers
 from .models import Tagging, TagStyle
+from .registry import tag_styles
+
+# tag_style 존재 확인을 DB 대신 프로세스 TagStyle 레지스트리로 처리
+class RegisteredTagStyleField(serializers.PrimaryKeyRelatedField):
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        tag_style = tag_styles.get(pk)
+        if tag_style is None:
+            self.fail("does_not_exist", pk_value=data)
+        return tag_style
 
 class TaggingSerializer(serializers.ModelSerializer):
+    tag_style = RegisteredTagStyleField(queryset=TagStyle.objects.all())
+
     class Meta:
         model = Tagging
         fields = "__all__"
         read_only_fields = ["id", "user", "memo"]
 
+# 여러 하이라이트 일괄 생성 (POST 본문이 리스트일 때)의 한 항목
+# tag_style 존재 확인과 메모 길이 검사는 Tagging.bulk_create_for_memo에서 한 번에 처리
+class TaggingBulkItemSerializer(serializers.Serializer):
+    MAX_ITEMS = 200
+
+    tag_style = serializers.IntegerField(min_value=1)
+    tag_contents = serializers.CharField(max_length=500)
+    offset_start = serializers.IntegerField(min_value=0)
+    offset_end = serializers.IntegerField(min_value=0)
+
+    def validate(self, attrs):
+        if attrs["offset_start"] > attrs["offset_end"]:
+            raise serializers.ValidationError("offset_start는 offset_end보다 클 수 없습니다.")
+        return attrs
+
 class TagStyleSerializer(serializers.ModelSerializer):
     class Meta:
         model = TagStyle
         fields = ["id", "tag_detail", "tag_color"]
-        read_only_fields = ["id"]
\ No newline at end of file
+        read_only_fields = ["id"]
+
+# 메모 목록 ?expand=taggings 용 (태그 스타일을 id 대신 객체로 포함)
+class TaggingWithStyleSerializer(TaggingSerializer):
+    tag_style = TagStyleSerializer(read_only=True)
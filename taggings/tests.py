@@ -1,3 +1,445 @@
-from django.test import TestCase
+from datetime import date
+from unittest.mock import patch
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from accounts.models import User
+from memos.models import Memo
+from portfolios.models import Log, Project
+from .models import Tagging, TagStyle
+from .registry import tag_styles
+from .serializers import TaggingSerializer
+from .views import TAG_STYLE_GONE_MESSAGE
 
-# Create your tests here.
+
+def create_owner(**fields):
+    return User.objects.create_user(username="owner", email="owner@test.com", **fields)
+
+
+def create_project(owner, **fields):
+    # 테스트 공통 프로젝트 ("테스트", 2025-11-01 ~ 2025-11-10, 초대 코드 code1). 다른 값은 fields로 덮어씀
+    fields = {
+        "project_name": "테스트",
+        "date_start": date(2025, 11, 1),
+        "date_end": date(2025, 11, 10),
+        "invite_code": "code1",
+        **fields,
+    }
+    return Project.objects.create(owner=owner, **fields)
+
+
+TAG_STYLE_COLORS = {"문제": "#FFEC5E", "해결": "#5EC8FF"}
+
+
+def create_tag_style(tag_detail="문제"):
+    return TagStyle.objects.create(tag_detail=tag_detail, tag_color=TAG_STYLE_COLORS[tag_detail])
+
+
+# 쿼리 수를 세는 테스트는 캐시 조회가 DB 쿼리로 섞이지 않도록 메모리 캐시 사용 (운영의 Redis와 같은 조건)
+MEMORY_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class TaggingConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.memo = Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents="메모입니다")
+        self.tag_style = create_tag_style()
+        self.tagging = Tagging.objects.create(
+            tag_style=self.tag_style, user=self.user, memo=self.memo,
+            tag_contents="메모", offset_start=0, offset_end=2,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_revalidates(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        return etag
+
+    def test_memo_taggings(self):
+        url = f"/taggings/memo/{self.memo.id}/"
+        etag = self.assert_revalidates(url)
+        Tagging.objects.create(
+            tag_style=self.tag_style, user=self.user, memo=self.memo,
+            tag_contents="입니다", offset_start=2, offset_end=5,
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_project_taggings_follow_project_name(self):
+        url = f"/taggings/project/{self.project.id}/"
+        etag = self.assert_revalidates(url)
+        self.project.project_name = "새 이름"
+        self.project.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_tagging_detail(self):
+        url = f"/taggings/{self.tagging.id}/"
+        etag = self.assert_revalidates(url)
+        self.tagging.tag_contents = "메"
+        self.tagging.offset_end = 1
+        self.tagging.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class ProjectTaggingViewTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.styles = [
+            create_tag_style(),
+            create_tag_style("해결"),
+        ]
+        memo = Memo.objects.create(user=self.user, project=self.project, date=date(2025, 11, 1), contents="메모입니다")
+        for i in range(7):
+            Tagging.objects.create(
+                tag_style=self.styles[i % 2], user=self.user, memo=memo,
+                tag_contents="메모", offset_start=0, offset_end=2,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f"/taggings/project/{self.project.id}/"
+
+    @override_settings(CACHES=MEMORY_CACHES)
+    def test_matches_serializer_output(self):
+        # 검증값 집계 1번 + 그룹 조회 1번 (+ 프로젝트 조회)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        categories = response.data["categories"]
+        self.assertEqual([c["tag_style"]["tag_detail"] for c in categories], ["문제", "해결"])
+        self.assertEqual([c["total"] for c in categories], [4, 3])
+        for category in categories:
+            expected = TaggingSerializer(
+                Tagging.objects.filter(tag_style_id=category["tag_style"]["id"]).order_by("-created_at", "-id"),
+                many=True,
+            ).data
+            self.assertEqual(category["taggings"], expected)
+
+    def test_tag_style_filter_and_limit(self):
+        response = self.client.get(self.url, {"tag_style": self.styles[1].id})
+        self.assertEqual(len(response.data["categories"]), 1)
+        self.assertEqual(len(response.data["categories"][0]["taggings"]), 3)
+
+        response = self.client.get(self.url, {"limit": 2})
+        categories = response.data["categories"]
+        self.assertEqual([len(c["taggings"]) for c in categories], [2, 2])
+        self.assertEqual([c["total"] for c in categories], [4, 3])
+        newest = Tagging.objects.filter(tag_style=self.styles[0]).order_by("-created_at", "-id")[:2]
+        self.assertEqual([t["id"] for t in categories[0]["taggings"]], [t.id for t in newest])
+
+        self.assertEqual(self.client.get(self.url, {"limit": 0}).status_code, 400)
+
+
+class TaggingOverlapTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.memo = Memo.objects.create(
+            user=self.user, project=self.project, date=date(2025, 11, 1), contents="0123456789abcdefghij",
+        )
+        self.styles = [
+            create_tag_style(),
+            create_tag_style("해결"),
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def tag(self, start, end, style=0):
+        return Tagging.objects.create(
+            tag_style=self.styles[style], user=self.user, memo=self.memo,
+            tag_contents=self.memo.contents[start:end], offset_start=start, offset_end=end,
+        )
+
+    def post(self, start, end, style=0):
+        return self.client.post(f"/taggings/memo/{self.memo.id}/", {
+            "tag_style": self.styles[style].id,
+            "tag_contents": self.memo.contents[start:end],
+            "offset_start": start,
+            "offset_end": end,
+        }, format="json")
+
+    def test_range_returns_overlapping_taggings_in_offset_order(self):
+        inside = self.tag(6, 8)
+        crossing = self.tag(2, 6)
+        self.tag(0, 3)  # 경계만 맞닿음
+        self.tag(10, 12)  # 경계만 맞닿음
+        response = self.client.get(f"/taggings/memo/{self.memo.id}/?range=3:10")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["id"] for row in response.data["results"]], [crossing.id, inside.id])
+
+    def test_invalid_range(self):
+        for value in ["5", "5:5", "7:3", "a:b", "-1:3"]:
+            response = self.client.get(f"/taggings/memo/{self.memo.id}/?range={value}")
+            self.assertEqual(response.status_code, 400, value)
+
+    def test_range_etag_differs_from_full_list(self):
+        self.tag(0, 3)
+        full = self.client.get(f"/taggings/memo/{self.memo.id}/")["ETag"]
+        ranged = self.client.get(f"/taggings/memo/{self.memo.id}/?range=0:20")["ETag"]
+        self.assertNotEqual(full, ranged)
+
+    def test_allow_policy_keeps_overlaps(self):
+        self.tag(0, 5)
+        self.assertEqual(self.post(3, 8).status_code, 201)
+        self.assertEqual(Tagging.objects.filter(memo=self.memo).count(), 2)
+
+    @override_settings(TAGGING_OVERLAP_POLICY="reject")
+    def test_reject_policy(self):
+        self.tag(0, 5)
+        self.assertEqual(self.post(3, 8).status_code, 400)
+        # 맞닿기만 하거나 다른 스타일이면 허용
+        self.assertEqual(self.post(5, 8).status_code, 201)
+        self.assertEqual(self.post(3, 8, style=1).status_code, 201)
+
+    @override_settings(TAGGING_OVERLAP_POLICY="merge")
+    def test_merge_policy_absorbs_overlaps(self):
+        self.tag(0, 4)
+        self.tag(6, 9)
+        other_style = self.tag(2, 7, style=1)
+        response = self.post(3, 7)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["results"]["offset_start"], 0)
+        self.assertEqual(response.data["results"]["offset_end"], 9)
+        self.assertEqual(response.data["results"]["tag_contents"], "012345678")
+        self.assertEqual(
+            sorted(Tagging.objects.filter(memo=self.memo).values_list("id", flat=True)),
+            sorted([response.data["results"]["id"], other_style.id]),
+        )
+
+
+class TaggingBulkCreateTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        self.project = create_project(self.user)
+        self.memo = Memo.objects.create(
+            user=self.user, project=self.project, date=date(2025, 11, 1), contents="0123456789abcdefghij",
+        )
+        self.styles = [
+            create_tag_style(),
+            create_tag_style("해결"),
+        ]
+        self.url = f"/taggings/memo/{self.memo.id}/"
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def item(self, start, end, style=0):
+        return {
+            "tag_style": self.styles[style].id,
+            "tag_contents": self.memo.contents[start:end],
+            "offset_start": start,
+            "offset_end": end,
+        }
+
+    def test_creates_all_and_awards_log_once(self):
+        items = [self.item(i, i + 2, style=i % 2) for i in range(0, 20, 2)]
+        response = self.client.post(self.url, items, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertTrue(all(row["id"] for row in response.data["results"]))
+        self.assertTrue(response.data["log_result"]["success"])
+        self.assertEqual(Tagging.objects.filter(memo=self.memo).count(), 10)
+        self.assertEqual(Log.objects.filter(project=self.project, reason="TAG_REVIEW_COMPLETE").count(), 1)
+
+        # 두 번째 요청은 생성되지만 통나무는 이미 지급됨
+        response = self.client.post(self.url, [self.item(0, 1)], format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(response.data["log_result"]["success"])
+
+    def test_query_count_does_not_grow_with_items(self):
+        def post(count):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, [self.item(0, 2)] * count, format="json")
+            self.assertEqual(response.status_code, 201)
+            return len(queries)
+
+        post(1)  # 통나무 지급은 첫 요청에서만 일어나므로 먼저 한 번 보냄
+        self.assertEqual(post(2), post(50))
+
+    def test_offset_beyond_memo_is_rejected(self):
+        response = self.client.post(self.url, [self.item(0, 2), self.item(18, 21)], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("1번째", response.data["error"])
+        self.assertFalse(Tagging.objects.exists())
+
+    def test_checks_against_locked_memo_not_stale_instance(self):
+        stale = Memo.objects.get(pk=self.memo.pk)
+        # stale을 불러온 뒤 본문이 짧아진 상황
+        self.memo.apply_delta([{"op": "delete", "pos": 5, "length": len(self.memo.contents) - 5}])
+        with self.assertRaises(ValidationError):
+            Tagging.bulk_create_for_memo(stale, self.user, [
+                {"tag_style": self.styles[0].id, "tag_contents": "56789", "offset_start": 5, "offset_end": 10},
+            ])
+        self.assertFalse(Tagging.objects.exists())
+
+    def test_unknown_tag_style_is_rejected(self):
+        item = self.item(0, 2)
+        item["tag_style"] = 999
+        response = self.client.post(self.url, [item], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Tagging.objects.exists())
+
+    def test_invalid_items(self):
+        self.assertEqual(self.client.post(self.url, [], format="json").status_code, 400)
+        response = self.client.post(self.url, [self.item(5, 2)], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_other_user_forbidden(self):
+        other = User.objects.create_user(username="other", email="other@test.com")
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.post(self.url, [self.item(0, 2)], format="json").status_code, 403)
+
+    @override_settings(TAGGING_OVERLAP_POLICY="reject")
+    def test_reject_policy(self):
+        Tagging.objects.create(
+            tag_style=self.styles[0], user=self.user, memo=self.memo,
+            tag_contents="01234", offset_start=0, offset_end=5,
+        )
+        response = self.client.post(self.url, [self.item(5, 8), self.item(6, 9)], format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(self.url, [self.item(5, 8), self.item(3, 6, style=1)], format="json")
+        self.assertEqual(response.status_code, 201)
+        response = self.client.post(self.url, [self.item(10, 12), self.item(4, 6)], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("1번째", response.data["error"])
+
+    @override_settings(TAGGING_OVERLAP_POLICY="merge")
+    def test_merge_policy(self):
+        existing = Tagging.objects.create(
+            tag_style=self.styles[0], user=self.user, memo=self.memo,
+            tag_contents="01234", offset_start=0, offset_end=5,
+        )
+        response = self.client.post(
+            self.url, [self.item(12, 15), self.item(4, 7), self.item(6, 9), self.item(4, 7, style=1)], format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        spans = [(row["tag_style"], row["offset_start"], row["offset_end"], row["tag_contents"]) for row in response.data["results"]]
+        self.assertEqual(spans, [
+            (self.styles[0].id, 12, 15, "cde"),
+            (self.styles[0].id, 0, 9, "012345678"),
+            (self.styles[1].id, 4, 7, "456"),
+        ])
+        self.assertFalse(Tagging.objects.filter(pk=existing.pk).exists())
+        self.assertEqual(Tagging.objects.filter(memo=self.memo).count(), 3)
+
+
+class TagStyleRegistryTest(TestCase):
+    def setUp(self):
+        self.user = create_owner()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.style = create_tag_style()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @override_settings(CACHES=MEMORY_CACHES)
+    def test_list_served_from_memory_with_version_etag(self):
+        response = self.client.get("/taggings/tagstyle/")
+        self.assertEqual(response.data["results"], [{"id": self.style.id, "tag_detail": "문제", "tag_color": "#FFEC5E"}])
+        etag = response["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/taggings/tagstyle/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+            self.assertEqual(self.client.get("/taggings/tagstyle/").status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_tag_style("해결")
+        response = self.client.get("/taggings/tagstyle/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_reloads_only_after_version_bump(self):
+        tag_styles.all()
+        # 다른 프로세스의 변경을 흉내: DB만 바뀌고 버전은 그대로면 메모리 값을 그대로 사용
+        TagStyle.objects.filter(pk=self.style.pk).update(tag_detail="바뀜")
+        self.assertEqual(tag_styles.all()[1][0]["tag_detail"], "문제")
+        tag_styles.bump()
+        self.assertEqual(tag_styles.all()[1][0]["tag_detail"], "바뀜")
+
+    @override_settings(CACHES=MEMORY_CACHES)
+    def test_serializer_validates_tag_style_without_queries(self):
+        tag_styles.all()
+        data = {"tag_style": self.style.id, "tag_contents": "메모", "offset_start": 0, "offset_end": 2}
+        with self.assertNumQueries(0):
+            serializer = TaggingSerializer(data=data)
+            self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["tag_style"], self.style)
+
+        serializer = TaggingSerializer(data={**data, "tag_style": 999})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("tag_style", serializer.errors)
+        self.assertFalse(TaggingSerializer(data={**data, "tag_style": "abc"}).is_valid())
+
+    def test_save_skips_tag_style_lookup_for_registry_instance(self):
+        project = create_project(self.user)
+        memo = Memo.objects.create(user=self.user, project=project, date=date(2025, 11, 1), contents="메모 본문")
+
+        def save_queries(tag_style):
+            tagging = Tagging(
+                tag_style=tag_style, user=self.user, memo=memo,
+                tag_contents="메모", offset_start=0, offset_end=2,
+            )
+            with CaptureQueriesContext(connection) as queries:
+                tagging.save()
+            return len(queries)
+
+        registered = tag_styles.get(self.style.pk)
+        self.assertEqual(save_queries(registered), save_queries(TagStyle.objects.get(pk=self.style.pk)) - 1)
+
+    @override_settings(CACHES=MEMORY_CACHES)
+    def test_version_checked_once_per_request(self):
+        tag_styles.all()
+        with patch("taggings.registry.cache", wraps=cache) as shared:
+            tag_styles.all()
+            tag_styles.get(self.style.pk)
+            self.assertEqual(shared.get.call_count, 0)
+            self.client.get("/taggings/tagstyle/")
+            self.assertEqual(shared.get.call_count, 1)
+
+    @override_settings(CACHES=MEMORY_CACHES)
+    def test_unknown_id_is_read_once_per_version(self):
+        tag_styles.all()
+        with self.assertNumQueries(1):
+            self.assertIsNone(tag_styles.get(999))
+            self.assertIsNone(tag_styles.get(999))
+
+    def test_deleted_style_drops_out(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TagStyle.objects.get(pk=self.style.pk).delete()
+        self.assertIsNone(tag_styles.get(self.style.pk))
+        self.assertEqual(self.client.get("/taggings/tagstyle/").data["results"], [])
+
+
+class DeletedTagStyleCommitTest(TransactionTestCase):
+    def setUp(self):
+        user = create_owner()
+        project = create_project(user)
+        memo = Memo.objects.create(user=user, project=project, date=date(2025, 11, 1), contents="메모 본문")
+        self.kept, self.style = create_tag_style(), create_tag_style("해결")
+        tag_styles.all()
+        # 다른 워커가 지웠지만 이 워커의 레지스트리에는 남아 있는 태그 스타일
+        TagStyle.objects.filter(pk=self.style.pk).delete()
+        self.assertIsNotNone(tag_styles.get(self.style.pk))
+
+        self.url = f"/taggings/memo/{memo.id}/"
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def item(self, style):
+        return {"tag_style": style.pk, "tag_contents": "메모", "offset_start": 0, "offset_end": 2}
+
+    def test_single_create_with_style_deleted_elsewhere_is_400(self):
+        response = self.client.post(self.url, self.item(self.style), format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], TAG_STYLE_GONE_MESSAGE)
+        self.assertFalse(Tagging.objects.exists())
+        self.assertFalse(Log.objects.exists())
+
+    def test_bulk_create_with_style_deleted_elsewhere_is_400(self):
+        response = self.client.post(self.url, [self.item(self.kept), self.item(self.style)], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], TAG_STYLE_GONE_MESSAGE)
+        self.assertFalse(Tagging.objects.exists())
+        self.assertFalse(Log.objects.exists())
@@ -5,14 +5,19 @@ from .models import Tagging, TagStyle
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404 
-from .serializers import TaggingSerializer, TagStyleSerializer
+from .serializers import TaggingBulkItemSerializer, TaggingSerializer
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
 from django.core.exceptions import ValidationError
-from collections import defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
 from portfolios.models import Log
 from drf_yasg import openapi
+from config.conditional import conditional_response, list_validators, make_etag, row_validators
+from .registry import tag_styles
 
 tagging_schema = openapi.Schema(
     type=openapi.TYPE_OBJECT,
@@ -29,6 +34,19 @@ tagging_schema = openapi.Schema(
     }
 )
 
+# 레지스트리에는 남아 있지만 다른 요청이 이미 지운 태그 스타일로 저장하려 한 경우
+TAG_STYLE_GONE_MESSAGE = "존재하지 않는 태그 스타일입니다."
+
+
+def parse_range(value):
+    """
+    "a:b" 형식의 구간을 (a, b)로 바꿉니다. 형식이 틀리거나 a >= b이면 None
+    """
+    start, sep, end = value.partition(":")
+    if not sep or not start.isdigit() or not end.isdigit() or int(start) >= int(end):
+        return None
+    return int(start), int(end)
+
 
 # 한 메모에 대한 태깅
 class MemoTaggingView(APIView):
@@ -36,6 +54,11 @@ class MemoTaggingView(APIView):
 
     # 메모에 태깅 추가
     @swagger_auto_schema(
+        operation_description="""
+    태깅 하나를 객체로 보내거나, 여러 하이라이트를 리스트로 한 번에 보낼 수 있습니다. (최대 200개)
+    - 리스트이면 메모 길이 기준 offset 검사 후 한 트랜잭션으로 일괄 생성하고, results도 리스트로 돌려줍니다.
+    - TAG_REVIEW_COMPLETE 통나무는 요청당 한 번만 지급합니다.
+        """,
         request_body=TaggingSerializer,
         responses={
             201: openapi.Response(
@@ -95,12 +118,17 @@ class MemoTaggingView(APIView):
         if request.user != memo.user:
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
         
+        if isinstance(request.data, list):
+            return self.post_many(request, memo)
+
         serializer = TaggingSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         try:
-            serializer.save(memo=memo, user=request.user)
-            log_result = Log.give_log(request.user, memo.project, "TAG_REVIEW_COMPLETE")
+            # 태깅이 커밋될 때만 통나무도 함께 지급되도록 한 트랜잭션으로 처리
+            with transaction.atomic():
+                serializer.save(memo=memo, user=request.user)
+                log_result = Log.give_log(request.user, memo.project, "TAG_REVIEW_COMPLETE")
        
         except ValidationError as e:
             # 모델에서 발생한 clean() 예외 처리 (프로젝트 6명 인원 제한)
@@ -108,6 +136,9 @@ class MemoTaggingView(APIView):
                 {"error": e.message if hasattr(e, "message") else str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        except IntegrityError:
+            # 레지스트리 확인 뒤 다른 요청이 태그 스타일을 지운 경우 (FK 제약 위반)
+            return Response({"error": TAG_STYLE_GONE_MESSAGE}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(
             {
@@ -116,9 +147,44 @@ class MemoTaggingView(APIView):
             },
             status=status.HTTP_201_CREATED,
         )
+
+    def post_many(self, request, memo):
+        # 여러 하이라이트 일괄 생성: 검증은 메모리에서, INSERT는 bulk_create 한 번, 통나무 지급도 한 번
+        serializer = TaggingBulkItemSerializer(
+            data=request.data, many=True, allow_empty=False, max_length=TaggingBulkItemSerializer.MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            # 태깅이 커밋될 때만 통나무도 함께 지급되도록 한 트랜잭션으로 처리
+            with transaction.atomic():
+                taggings = Tagging.bulk_create_for_memo(memo, request.user, serializer.validated_data)
+                log_result = Log.give_log(request.user, memo.project, "TAG_REVIEW_COMPLETE")
+        except ValidationError as e:
+            return Response(
+                {"error": e.message if hasattr(e, "message") else str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except IntegrityError:
+            return Response({"error": TAG_STYLE_GONE_MESSAGE}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "results": TaggingSerializer(taggings, many=True).data,
+                "log_result": log_result,
+            },
+            status=status.HTTP_201_CREATED,
+        )
     
     # 한 메모의 태깅 리스트
     @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                'range', openapi.IN_QUERY,
+                description="start:end 구간과 겹치는 태깅만 offset_start 순으로 조회 (반열린 구간, 예: 10:20)",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
         responses={
             200: openapi.Response(
                 description="태깅 리스트 조회 성공",
@@ -132,6 +198,16 @@ class MemoTaggingView(APIView):
                     }
                 )
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
+            400: openapi.Response(
+                description="잘못된 range",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(type=openapi.TYPE_STRING, example="range는 start:end 형식이며 start < end 여야 합니다.")
+                    }
+                )
+            ),
             403: openapi.Response(
                 description="권한 없음",
                 schema=openapi.Schema(
@@ -159,9 +235,24 @@ class MemoTaggingView(APIView):
         memo = get_object_or_404(Memo, id=memo_id)
         if request.user != memo.user:
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
-        taggings = Tagging.objects.filter(memo=memo).order_by("-created_at")
-        serializer = TaggingSerializer(taggings, many=True, context={"request": request})
-        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+        range_param = request.query_params.get("range")
+        if range_param is None:
+            taggings = Tagging.objects.filter(memo=memo).order_by("-created_at")
+        else:
+            span = parse_range(range_param)
+            if span is None:
+                return Response(
+                    {"error": "range는 start:end 형식이며 start < end 여야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            taggings = Tagging.overlapping(memo, *span).order_by("offset_start", "id")
+        etag, last_modified = list_validators(taggings, range_param)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: Response({
+                "results": TaggingSerializer(taggings, many=True, context={"request": request}).data
+            }, status=status.HTTP_200_OK),
+        )
     
     @swagger_auto_schema(
         operation_summary="메모의 모든 태깅 삭제",
@@ -232,11 +323,68 @@ tag_style_schema = openapi.Schema(
     }
 )
 
+def group_taggings(taggings, limit=None):
+    """
+    태깅을 태그 스타일별 카테고리로 묶습니다.
+    DB가 (tag_style, -created_at) 순으로 정렬한 values() 행을 한 번 훑으면서 카테고리를 만들고,
+    TaggingSerializer와 같은 형식으로 내보냅니다. (모델 인스턴스/시리얼라이저 생성 없음)
+    limit이 있으면 카테고리별 최신 limit개만 (ROW_NUMBER 윈도 함수로 DB에서 자름) 돌려줍니다.
+    """
+    rows = taggings.annotate(
+        tag_detail=F("tag_style__tag_detail"),
+        tag_color=F("tag_style__tag_color"),
+        # 잘리기 전 카테고리 전체 개수
+        total=Window(Count("id"), partition_by=[F("tag_style_id")]),
+    )
+    if limit:
+        rows = rows.annotate(
+            rank=Window(RowNumber(), partition_by=[F("tag_style_id")], order_by=[F("created_at").desc(), F("id").desc()]),
+        ).filter(rank__lte=limit)
+    rows = rows.order_by("tag_style_id", "-created_at", "-id").values(
+        "id", "created_at", "modified_at", "tag_contents", "offset_start", "offset_end",
+        "tag_style_id", "user_id", "memo_id", "tag_detail", "tag_color", "total",
+    )
+
+    # DRF DateTimeField와 같은 형식. 행마다 현재 타임존을 다시 찾지 않도록 한 번만 조회
+    tz = timezone.get_current_timezone()
+
+    def to_datetime(value):
+        text = value.astimezone(tz).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    categories = []
+    current = None
+    for row in rows:
+        if current is None or current["tag_style"]["id"] != row["tag_style_id"]:
+            current = {
+                "tag_style": {"id": row["tag_style_id"], "tag_detail": row["tag_detail"], "tag_color": row["tag_color"]},
+                "total": row["total"],
+                "taggings": [],
+            }
+            categories.append(current)
+        current["taggings"].append({
+            "id": row["id"],
+            "created_at": to_datetime(row["created_at"]),
+            "modified_at": to_datetime(row["modified_at"]),
+            "tag_contents": row["tag_contents"],
+            "offset_start": row["offset_start"],
+            "offset_end": row["offset_end"],
+            "tag_style": row["tag_style_id"],
+            "user": row["user_id"],
+            "memo": row["memo_id"],
+        })
+    return categories
+
+
 class ProjectTaggingView(APIView):
     permission_classes = [IsAuthenticated]
 
-    # 로그인한 사용자의 한 프로젝트 태깅 리스트 조회
+    # 로그인한 사용자의 한 프로젝트 태깅 리스트 조회 (태그 스타일별 그룹)
     @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('tag_style', openapi.IN_QUERY, description="이 태그 스타일만 조회", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="카테고리별 최대 태깅 수 (최신순, 기본 전체)", type=openapi.TYPE_INTEGER),
+        ],
         responses={
             200: openapi.Response(
                 description="로그인한 사용자의 프로젝트별 태깅 카테고리 조회 성공",
@@ -251,6 +399,7 @@ class ProjectTaggingView(APIView):
                                 type=openapi.TYPE_OBJECT,
                                 properties={
                                     "tag_style": tag_style_schema,
+                                    "total": openapi.Schema(type=openapi.TYPE_INTEGER, example=42),
                                     "taggings": openapi.Schema(
                                         type=openapi.TYPE_ARRAY,
                                         items=tagging_schema
@@ -261,6 +410,16 @@ class ProjectTaggingView(APIView):
                     }
                 )
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
+            400: openapi.Response(
+                description="잘못된 요청",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(type=openapi.TYPE_STRING, example="limit은 1 이상의 숫자여야 합니다.")
+                    }
+                )
+            ),
             403: openapi.Response(
                 description="권한 없음",
                 schema=openapi.Schema(
@@ -284,38 +443,29 @@ class ProjectTaggingView(APIView):
     def get(self, request, project_id):
         project = get_object_or_404(Project, id=project_id)
 
-        taggings = (
-            Tagging.objects
-            .filter(user=request.user, memo__project=project)
-            .select_related("tag_style", "memo")
-            .order_by("-created_at")
-        )
+        taggings = Tagging.objects.filter(user=request.user, memo__project=project)
+        tag_style = request.query_params.get("tag_style")
+        if tag_style:
+            if not tag_style.isdigit():
+                return Response({"error": "tag_style은 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+            taggings = taggings.filter(tag_style_id=tag_style)
+        limit = request.query_params.get("limit")
+        if limit is not None:
+            if not limit.isdigit() or int(limit) < 1:
+                return Response({"error": "limit은 1 이상의 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+            limit = int(limit)
 
-        # tag_style 기준으로 그룹핑
-        grouped = defaultdict(list)
-        for tagging in taggings:
-            grouped[tagging.tag_style].append(tagging)
-
-        categories = []
-        for tag_style, tagging_list in grouped.items():
-            tag_style_data = {
-                "id": tag_style.id,
-                "tag_detail": tag_style.tag_detail,
-                "tag_color": tag_style.tag_color,
-            }
-            serializer = TaggingSerializer(tagging_list, many=True, context={"request": request})
-            categories.append({
-                "tag_style": tag_style_data,
-                "taggings": serializer.data
-            })
+        def build():
+            return Response({
+                "project_id": project.id,
+                "project_name": project.project_name,
+                "categories": group_taggings(taggings, limit),
+            }, status=status.HTTP_200_OK)
 
-        serializer = TaggingSerializer(taggings, many=True, context={"request": request})
-        
-        return Response({
-            "project_id": project.id,
-            "project_name": project.project_name,
-            "categories": categories
-        }, status=status.HTTP_200_OK)
+        # 프로젝트 이름과 태그 스타일 이름·색상도 응답에 포함되므로 프로젝트 수정 시각과 TagStyle 버전도 검증값에 반영
+        etag, last_modified = list_validators(taggings, project.modified_at, limit, tag_styles.version())
+        last_modified = max(filter(None, [last_modified, project.modified_at]))
+        return conditional_response(request, etag, last_modified, build)
 
 class TaggingDetailView(APIView):
     permission_classes = [IsAuthenticated]
@@ -332,6 +482,7 @@ class TaggingDetailView(APIView):
                     }
                 )
             ),
+            304: openapi.Response(description="변경 없음 (If-None-Match / If-Modified-Since 일치)"),
             403: openapi.Response(
                 description="권한 없음",
                 schema=openapi.Schema(
@@ -362,8 +513,11 @@ class TaggingDetailView(APIView):
         tagging = get_object_or_404(Tagging, id=tagging_id)
         if request.user != tagging.user:
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
-        serializer = TaggingSerializer(tagging)
-        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+        etag, last_modified = row_validators(tagging)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: Response({"results": TaggingSerializer(tagging).data}, status=status.HTTP_200_OK),
+        )
 
     # 태깅 수정
     @swagger_auto_schema(
@@ -411,7 +565,11 @@ class TaggingDetailView(APIView):
             return Response({"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN)
         serializer = TaggingSerializer(tagging, data=request.data)
         if serializer.is_valid():
-            serializer.save()
+            try:
+                with transaction.atomic():
+                    serializer.save()
+            except IntegrityError:
+                return Response({"error": TAG_STYLE_GONE_MESSAGE}, status=status.HTTP_400_BAD_REQUEST)
             return Response({"results": serializer.data}, status=status.HTTP_200_OK)
         return Response({"errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
     
@@ -473,10 +631,14 @@ class TagStyleView(APIView):
                         )
                     }
                 )
-            )
+            ),
+            304: openapi.Response(description="변경 없음 (If-None-Match 일치)"),
         }
     )
     def get(self, request):
-        tag_styles = TagStyle.objects.all()
-        serializers = TagStyleSerializer(tag_styles, many=True, context={"request": request})
-        return Response({"results": serializers.data}, status=status.HTTP_200_OK)
\ No newline at end of file
+        # 워커 메모리의 레지스트리에서 응답하고, ETag는 TagStyle이 바뀔 때만 올라가는 버전으로 만듦
+        version, rows = tag_styles.all()
+        return conditional_response(
+            request, make_etag(TagStyle._meta.label, version), None,
+            lambda: Response({"results": rows}, status=status.HTTP_200_OK),
+        )
\ No newline at end of file